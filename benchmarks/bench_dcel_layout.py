@@ -0,0 +1,69 @@
+"""
+Memory / throughput comparison: object DCEL vs struct-of-arrays DCEL.
+
+    PYTHONPATH=src python benchmarks/bench_dcel_layout.py [n ...]
+
+For each polygon size n it reports, for both layouts:
+    build   – from_polygon
+    split   – split every boundary edge once at its midpoint
+    mem     – traced memory held by the structure after the splits
+and the end-to-end `slab_partition(sweep=True)` time on a smaller
+polygon (the array layout goes through its handle objects there).
+"""
+import gc
+import sys
+import time
+import tracemalloc
+
+from be_alg.array_dcel import ArrayDCEL
+from be_alg.dcel import DCEL
+from be_alg.slab_partition import slab_partition
+from inputs import star_polygon
+
+
+def split_all_object(dcel):
+    for he in [e for e in dcel.half_edges if e.face is not dcel.outer_face]:
+        a, b = he.origin, he.twin.origin
+        dcel.split_edge(he, (a.x + b.x) / 2, (a.y + b.y) / 2)
+
+
+def split_all_array(dcel):
+    n = len(dcel.he_origin) // 2                 # inner boundary half-edges
+    vx, vy, origin, twin = dcel.vx, dcel.vy, dcel.he_origin, dcel.he_twin
+    for e in range(n):
+        a, b = origin[e], origin[twin[e]]
+        dcel.split_edge_idx(e, (vx[a] + vx[b]) / 2, (vy[a] + vy[b]) / 2)
+
+
+def measure(cls, split, pts):
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    dcel = cls.from_polygon(list(range(len(pts))), pts)
+    t1 = time.perf_counter()
+    split(dcel)
+    t2 = time.perf_counter()
+    mem = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return t1 - t0, t2 - t1, mem
+
+
+def main(sizes):
+    print(f"{'n':>9} {'layout':>7} {'build[s]':>9} {'split[s]':>9} {'mem[MB]':>9}")
+    for n in sizes:
+        pts = star_polygon(n)
+        for name, cls, split in (("object", DCEL, split_all_object),
+                                 ("array", ArrayDCEL, split_all_array)):
+            build, splits, mem = measure(cls, split, pts)
+            print(f"{n:>9} {name:>7} {build:>9.3f} {splits:>9.3f} {mem / 2**20:>9.1f}")
+
+    pts = star_polygon(min(sizes[0], 300))
+    for name, cls in (("object", DCEL), ("array", ArrayDCEL)):
+        dcel = cls.from_polygon(list(range(len(pts))), pts)
+        t0 = time.perf_counter()
+        slab_partition(dcel, sweep=True)
+        print(f"slab_partition n={len(pts)} {name:>7}: {time.perf_counter() - t0:.3f}s")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000])
@@ -0,0 +1,52 @@
+"""
+Per-stage slab partition timings for each exact number backend.
+
+    PYTHONPATH=src python benchmarks/bench_number_backends.py [n ...]
+
+Stages: vertical cuts (sweep), horizontal cuts, face refinement.
+Backends that cannot be imported here (gmpy2 missing, C++ bindings
+not built) are reported as unavailable.
+"""
+import sys
+import time
+
+from be_alg.dcel import DCEL
+from be_alg.number_backend import get_number_backend
+from be_alg.slab_partition import add_horizontal_cuts, add_vertical_cuts, refine_faces
+from inputs import star_polygon
+
+BACKENDS = ("fraction", "gmpy2", "field")
+STAGES = (("vertical", lambda d: add_vertical_cuts(d, sweep=True)),
+          ("horizontal", add_horizontal_cuts),
+          ("refine", refine_faces))
+
+
+def main(sizes):
+    available = []
+    for name in BACKENDS:
+        try:
+            get_number_backend(name)
+            available.append(name)
+        except ImportError as e:
+            print(f"{name}: unavailable ({e})")
+
+    header = "".join(f"{stage:>12}" for stage, _ in STAGES)
+    print(f"{'n':>7} {'backend':>9}{header}{'total':>10}{'speedup':>9}")
+    for n in sizes:
+        pts = star_polygon(n)
+        baseline = None
+        for name in available:
+            dcel = DCEL.from_polygon(list(range(len(pts))), pts, number=name)
+            times = []
+            for _, stage in STAGES:
+                t0 = time.perf_counter()
+                stage(dcel)
+                times.append(time.perf_counter() - t0)
+            total = sum(times)
+            baseline = baseline or total
+            cols = "".join(f"{t:>12.3f}" for t in times)
+            print(f"{n:>7} {name:>9}{cols}{total:>10.3f}{baseline / total:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [300, 1000])
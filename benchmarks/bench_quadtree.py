@@ -0,0 +1,67 @@
+"""
+Quadtree engine vs slab partition on PointSetGenerator instances.
+
+    PYTHONPATH=src python benchmarks/bench_quadtree.py [--range R] [n ...]
+
+For each size n (one generated instance, seeded) it reports, per engine:
+    time     – from the instance to the classified DCEL
+    faces    – inner faces
+    steiner  – vertices added on top of the instance points
+and the FaceType counts, so the triangle quality can be compared too.
+
+Without the CGAL bindings, or with --range, the instances come from
+`inputs.point_set`: the same distribution as PointSetGenerator (integer
+points in [0, R]², at least R/50 apart, region = their convex hull).
+"""
+import random
+import sys
+import time
+from collections import Counter
+
+from be_alg.dcel import DCEL
+from be_alg.face_types import FaceType
+from be_alg.quadtree import quadtree_partition
+from be_alg.slab_partition import slab_partition
+from inputs import SIZE, point_set
+
+try:
+    from cgshop2025_pyutils.generators import PointSetGenerator
+except ImportError:                     # no CGAL bindings
+    PointSetGenerator = None
+
+def slab_engine(instance):
+    dcel = DCEL.from_instance(instance)
+    slab_partition(dcel)
+    return dcel
+
+
+ENGINES = (("slab", slab_engine), ("quadtree", quadtree_partition))
+
+
+def main(sizes, size=None):
+    kinds = list(FaceType)
+    print(f"{'n':>6} {'engine':>9} {'time[s]':>8} {'faces':>7} {'steiner':>8}  "
+          + " ".join(f"{t.name.lower():>10}" for t in kinds))
+    for n in sizes:
+        random.seed(n)
+        if PointSetGenerator is None or size is not None:
+            instance = point_set(n, size or SIZE)
+        else:
+            instance = PointSetGenerator()(n)
+        for name, engine in ENGINES:
+            t0 = time.perf_counter()
+            dcel = engine(instance)
+            elapsed = time.perf_counter() - t0
+            inner = [f for f in dcel.faces if f is not dcel.outer_face]
+            counts = Counter(f.ftype for f in inner)
+            print(f"{n:>6} {name:>9} {elapsed:>8.3f} {len(inner):>7} "
+                  f"{len(dcel.vertices) - instance.num_points:>8}  "
+                  + " ".join(f"{counts[t]:>10}" for t in kinds))
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    size = None
+    if args[:1] == ["--range"]:
+        size, args = int(args[1]), args[2:]
+    main([int(a) for a in args] or [50, 100, 200], size)
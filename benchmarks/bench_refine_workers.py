@@ -0,0 +1,64 @@
+"""
+Refine stage: serial loop vs the process pool of refine_faces(workers=).
+
+    PYTHONPATH=src python benchmarks/bench_refine_workers.py [n [workers ...]]
+
+Cuts star_polygon(n) once per run (vertical + horizontal), then times
+refine_faces alone.  For the pool it also reports how much of that is
+the replay of the diagonals in this process – the part no number of
+cores takes away.  Without workers given it tries 2, 4, … up to the
+machine's core count (at least 2).
+"""
+import os
+import sys
+import time
+
+from be_alg import slab_partition as sp
+from be_alg.dcel import DCEL
+from inputs import star_polygon
+
+
+def cut(pts):
+    dcel = DCEL.from_polygon(list(range(len(pts))), pts)
+    sp.add_vertical_cuts(dcel, sweep=True)
+    sp.add_horizontal_cuts(dcel)
+    return dcel
+
+
+def timed_refine(pts, workers):
+    dcel = cut(pts)
+    replay = [0.0]
+    add_diagonal = sp.add_diagonal
+
+    def counted(*args):
+        t = time.perf_counter()
+        try:
+            return add_diagonal(*args)
+        finally:
+            replay[0] += time.perf_counter() - t
+
+    sp.add_diagonal = counted
+    try:
+        t0 = time.perf_counter()
+        sp.refine_faces(dcel, workers=workers)
+        return time.perf_counter() - t0, replay[0]
+    finally:
+        sp.add_diagonal = add_diagonal
+
+
+def main(n, counts):
+    pts = star_polygon(n)
+    cores = os.cpu_count() or 1
+    print(f"star_polygon({n}), {cores} core(s)")
+    total, replay = timed_refine(pts, None)
+    print(f"{'serial':>10}: {total:7.2f}s  (add_diagonal {replay:.2f}s)")
+    for w in counts:
+        total, replay = timed_refine(pts, w)
+        print(f"{f'workers={w}':>10}: {total:7.2f}s  (replay {replay:.2f}s)")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    n = args[0] if args else 3000
+    counts = args[1:] or [w for w in (2, 4, 8, 16, 32, 64) if w <= max(2, os.cpu_count() or 1)]
+    main(n, counts)
@@ -0,0 +1,65 @@
+"""
+Shared inputs of the benchmarks (run them from the repository root,
+`benchmarks/` is on sys.path as the script directory):
+
+    star_polygon   simple star-shaped polygon, for the slab stages
+    point_set      PointSetGenerator-like point set with its hull
+"""
+import math
+import random
+from fractions import Fraction
+from types import SimpleNamespace
+
+
+def star_polygon(n, seed=0, radius=10**6):
+    rnd = random.Random(seed)
+    angles = sorted(rnd.uniform(0, 2 * math.pi) for _ in range(n))
+    pts, seen = [], set()
+    for a in angles:
+        r = rnd.uniform(0.3, 1) * radius
+        p = (round(r * math.cos(a)), round(r * math.sin(a)))
+        if p not in seen:
+            seen.add(p)
+            pts.append(p)
+    return [(Fraction(x), Fraction(y)) for x, y in pts]
+
+
+SIZE = 10_000                           # PointSetGenerator: [0, 10 000]², 200 apart
+
+
+def point_set(n, size=SIZE):
+    """Pure-Python stand-in for PointSetGenerator()(n), on [0, size]²."""
+    min_d2 = (size // 50) ** 2
+    pts = []
+    while len(pts) < n:
+        x, y = random.randint(0, size), random.randint(0, size)
+        if all((x - a) ** 2 + (y - b) ** 2 >= min_d2 for a, b in pts):
+            pts.append((x, y))
+    return SimpleNamespace(
+        instance_uid=f"point_set_{n}",
+        num_points=n,
+        points_x=[x for x, _ in pts],
+        points_y=[y for _, y in pts],
+        region_boundary=convex_hull(pts),
+        num_constraints=0,
+        additional_constraints=[],
+    )
+
+
+def convex_hull(pts):
+    """Indices of the strictly convex CCW hull (Andrew's monotone chain)."""
+    order = sorted(range(len(pts)), key=lambda i: pts[i])
+
+    def chain(indices):
+        out = []
+        for i in indices:
+            while len(out) >= 2 and _cross(pts[out[-2]], pts[out[-1]], pts[i]) <= 0:
+                out.pop()
+            out.append(i)
+        return out[:-1]
+
+    return chain(order) + chain(reversed(order))
+
+
+def _cross(o, a, b):
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
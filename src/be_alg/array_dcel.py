@@ -0,0 +1,882 @@
+# ------------------------------------------------------------
+#  src/be_alg/array_dcel.py
+#  struct-of-arrays DCEL – same interface as be_alg.dcel.DCEL
+# ------------------------------------------------------------
+from __future__ import annotations
+
+import weakref
+from array import array
+from fractions import Fraction
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from be_alg import dcel_io
+from be_alg.dcel import _broken, _in_corner
+from be_alg.face_index import VerticalEdgeIndex
+from be_alg.face_types import FaceType
+from be_alg.number_backend import NumberBackend, approx, get_number_backend
+from be_alg.subdivision import build_subdivision, link_edges
+
+NIL = -1
+_NIL_PAIR = array("q", [NIL, NIL])
+
+
+class ArrayDCEL:
+    """
+    DCEL whose topology lives in flat integer arrays.
+
+        vertex  v :  vx[v], vy[v], vfx[v], vfy[v], v_incident[v], v_star[v]
+        half-edge e: he_origin[e], he_twin[e], he_next[e], he_prev[e], he_face[e]
+        face    f :  f_outer[f], f_type[f], f_edges[f], f_vertical[f], f_horizontal[f]
+        star entry s: s_face[s], s_edge[s], s_next[s]
+
+The star of v – face → outgoing half-edge, as Vertex.star – is a chain
+of entries from v_star[v] in insertion order; freed entries are reused.
+
+    A few million half-edges cost 5 × 8 bytes each instead of a Python
+    object per element.  The `*_idx` methods work on plain indices.
+    `vertices`, `half_edges`, `faces` and `outer_face` hand out small
+    handle objects (VertexRef / HalfEdgeRef / FaceRef) with the same
+    attributes as the object DCEL, so `slab_partition` runs unchanged.
+    Handles are interned while alive, so `is` comparisons work.
+    """
+
+    def __init__(self, points: List[Tuple[Fraction, Fraction]],
+                 number: str = "fraction"):
+        self.number: NumberBackend = get_number_backend(number)
+        conv = self.number.convert
+        self.vx: list = [conv(x) for x, _ in points]
+        self.vy: list = [conv(y) for _, y in points]
+        self.vfx = array("d", map(approx, self.vx))    # filtered-predicate
+        self.vfy = array("d", map(approx, self.vy))    # float images
+        self.v_incident = array("q", [NIL]) * len(points)
+        self.v_star = array("q", [NIL]) * len(points)     # first star entry
+        self.s_face = array("q")
+        self.s_edge = array("q")
+        self.s_next = array("q")
+        self._s_free: int = NIL                            # chain of freed entries
+        self._index_vertices()
+
+        self.he_origin = array("q")
+        self.he_twin = array("q")
+        self.he_next = array("q")
+        self.he_prev = array("q")
+        self.he_face = array("q")
+
+        self.f_outer = array("q")
+        self.f_edges = array("q")          # ring counters (see Face.n_edges)
+        self.f_vertical = array("q")
+        self.f_horizontal = array("q")
+        self.f_type: List[Optional[FaceType]] = []
+        self.f_verticals: List[Optional[VerticalEdgeIndex]] = []   # lazy
+        self.outer: int = NIL
+
+        self._v_refs = weakref.WeakValueDictionary()
+        self._he_refs = weakref.WeakValueDictionary()
+        self._f_refs = weakref.WeakValueDictionary()
+        self._outer_ref: Optional[FaceRef] = None
+
+    # ---------- בנייה ראשונית מהגבול (ללא אילוצים) ----------
+    @classmethod
+    def from_polygon(cls, boundary_indices: List[int],
+                     points: List[Tuple[Fraction, Fraction]],
+                     number: str = "fraction") -> "ArrayDCEL":
+        """
+        boundary_indices – רצף אינדקסים CCW (ללא חזרה על הראשון).
+        Half-edge i (0 ≤ i < n) runs along the boundary inside face 0,
+        half-edge n + i is its twin in the outer face 1.
+        """
+        dcel = cls(points, number)
+        n = len(boundary_indices)
+        succ = [(i + 1) % n for i in range(n)]
+        pred = [(i - 1) % n for i in range(n)]
+
+        dcel.he_origin = array("q", boundary_indices
+                               + [boundary_indices[s] for s in succ])
+        dcel.he_twin = array("q", [n + i for i in range(n)] + list(range(n)))
+        dcel.he_next = array("q", succ + [n + p for p in pred])
+        dcel.he_prev = array("q", pred + [n + s for s in succ])
+        dcel.he_face = array("q", [0]) * n + array("q", [1]) * n
+
+        dcel.f_outer = array("q", [0, n])
+        n_vert = sum(map(dcel.is_vertical_idx, range(n)))
+        n_horz = sum(map(dcel.is_horizontal_idx, range(n)))
+        dcel.f_edges = array("q", [n, n])
+        dcel.f_vertical = array("q", [n_vert, n_vert])
+        dcel.f_horizontal = array("q", [n_horz, n_horz])
+        dcel.f_type = [None, None]
+        dcel.f_verticals = [None, None]
+        dcel.outer = 1
+
+        # same incident choice (and star order) as DCEL.from_polygon
+        inc = dcel.v_incident
+        for i in range(n):
+            v_origin, v_dest = boundary_indices[i], boundary_indices[succ[i]]
+            if inc[v_origin] == NIL:
+                inc[v_origin] = i
+            if inc[v_dest] == NIL:
+                inc[v_dest] = n + i
+            dcel._star_set(v_origin, 0, i)
+            dcel._star_set(v_dest, 1, n + i)
+        return dcel
+
+    @classmethod
+    def from_instance(cls, instance, number: str = "fraction") -> "ArrayDCEL":
+        """Same as DCEL.from_instance; the sweep output is the array layout."""
+        conv = get_number_backend(number).convert
+        xs, ys, sec, outer = build_subdivision(
+            [conv(x) for x in instance.points_x], [conv(y) for y in instance.points_y],
+            list(instance.region_boundary), instance.additional_constraints)
+        return cls._from_sections(xs, ys, number, outer, sec)
+
+    @classmethod
+    def from_edges(cls, points: List[Tuple[Fraction, Fraction]],
+                   edges: List[Tuple[int, int]], number: str = "fraction") -> "ArrayDCEL":
+        """Same as DCEL.from_edges."""
+        conv = get_number_backend(number).convert
+        xs, ys = [conv(x) for x, _ in points], [conv(y) for _, y in points]
+        sec, outer = link_edges(xs, ys, edges)
+        return cls._from_sections(xs, ys, number, outer, sec)
+
+    @classmethod
+    def from_solution(cls, instance, solution, number: str = "fraction") -> "ArrayDCEL":
+        """Same as DCEL.from_solution."""
+        points = list(zip(instance.points_x, instance.points_y))
+        points += zip(solution.steiner_points_x, solution.steiner_points_y)
+        return cls.from_edges(points, solution.edges, number)
+
+    # ---------- index level ----------
+    def _new_edge_pair(self) -> int:
+        first = len(self.he_origin)
+        for arr in (self.he_origin, self.he_twin, self.he_next,
+                    self.he_prev, self.he_face):
+            arr.extend(_NIL_PAIR)
+        return first
+
+    def _new_face(self) -> int:
+        self.f_outer.append(NIL)
+        self.f_edges.append(0)
+        self.f_vertical.append(0)
+        self.f_horizontal.append(0)
+        self.f_type.append(None)
+        self.f_verticals.append(None)
+        return len(self.f_outer) - 1
+
+    # ---------- vertex stars ----------
+    def _star_get(self, v: int, f: int) -> int:
+        s, s_face = self.v_star[v], self.s_face
+        while s != NIL:
+            if s_face[s] == f:
+                return self.s_edge[s]
+            s = self.s_next[s]
+        return NIL
+
+    def _star_set(self, v: int, f: int, e: int, replace: bool = True) -> None:
+        """star[v][f] = e (replace=False: setdefault)."""
+        s, last, s_face = self.v_star[v], NIL, self.s_face
+        while s != NIL:
+            if s_face[s] == f:
+                if replace:
+                    self.s_edge[s] = e
+                return
+            s, last = self.s_next[s], s
+        s = self._s_free
+        if s == NIL:
+            s = len(s_face)
+            s_face.append(f)
+            self.s_edge.append(e)
+            self.s_next.append(NIL)
+        else:
+            self._s_free = self.s_next[s]
+            s_face[s], self.s_edge[s], self.s_next[s] = f, e, NIL
+        if last == NIL:
+            self.v_star[v] = s
+        else:
+            self.s_next[last] = s
+
+    def _star_pop(self, v: int, f: int) -> int:
+        """Remove and return star[v][f], NIL if absent."""
+        s, last, s_face, s_next = self.v_star[v], NIL, self.s_face, self.s_next
+        while s != NIL:
+            if s_face[s] == f:
+                if last == NIL:
+                    self.v_star[v] = s_next[s]
+                else:
+                    s_next[last] = s_next[s]
+                s_next[s], self._s_free = self._s_free, s
+                return self.s_edge[s]
+            s, last = s_next[s], s
+        return NIL
+
+    def _star_items(self, v: int) -> Iterator[Tuple[int, int]]:
+        s = self.v_star[v]
+        while s != NIL:
+            yield self.s_face[s], self.s_edge[s]
+            s = self.s_next[s]
+
+    def is_vertical_idx(self, e: int) -> bool:
+        a, b = self.he_origin[e], self.he_origin[self.he_twin[e]]
+        return self.vfx[a] == self.vfx[b] and self.vx[a] == self.vx[b]
+
+    def is_horizontal_idx(self, e: int) -> bool:
+        a, b = self.he_origin[e], self.he_origin[self.he_twin[e]]
+        return self.vfy[a] == self.vfy[b] and self.vy[a] == self.vy[b]
+
+    # ---------- vertices by coordinates (see DCEL.vertex_at) ----------
+    # An open-addressed table of vertex indices, hashed on the float
+    # images (fx, fy) and probed linearly; vertices that share their
+    # images just take the next free slots.  Kept at most half full.
+    def _index_vertices(self) -> None:
+        size = 8
+        while size < 2 * len(self.vx):
+            size *= 2
+        self._xy_slots = array("q", [NIL]) * size
+        self._xy_count = 0
+        for v, key in enumerate(zip(self.vfx, self.vfy)):
+            self._index_vertex(v, key)
+
+    def _index_vertex(self, v: int, key: Tuple[float, float]) -> None:
+        slots = self._xy_slots
+        if 2 * (self._xy_count + 1) > len(slots):
+            old = [w for w in slots if w != NIL]
+            slots = self._xy_slots = array("q", [NIL]) * (2 * len(slots))
+            self._xy_count = 0
+            for w in old:
+                self._index_vertex(w, (self.vfx[w], self.vfy[w]))
+        mask = len(slots) - 1
+        i = hash(key) & mask
+        while slots[i] != NIL:
+            i = (i + 1) & mask
+        slots[i] = v
+        self._xy_count += 1
+
+    def vertex_at_idx(self, x, y) -> int:
+        """Index of the vertex at exactly (x, y), or NIL.  O(1)."""
+        return self._vertex_at((approx(x), approx(y)), x, y)
+
+    def _vertex_at(self, key: Tuple[float, float], x, y) -> int:
+        slots, vfx, vfy = self._xy_slots, self.vfx, self.vfy
+        fx, fy = key
+        mask = len(slots) - 1
+        i = hash(key) & mask
+        while True:
+            w = slots[i]
+            if w == NIL:
+                return NIL
+            if vfx[w] == fx and vfy[w] == fy and self.vx[w] == x and self.vy[w] == y:
+                return w
+            i = (i + 1) & mask
+
+    def split_edge_idx(self, e: int, x: Fraction, y: Fraction) -> int:
+        """
+        Split directed edge e (A→B) at (x,y). Return vertex index M.
+        An endpoint at (x,y) is returned as is, an isolated vertex there
+        becomes M (see DCEL.split_edge).
+        """
+        origin, twin, nxt, prv, face = (self.he_origin, self.he_twin,
+                                        self.he_next, self.he_prev, self.he_face)
+        t = twin[e]                      # B→A  (becomes B→M)
+        fx, fy = approx(x), approx(y)
+        for v in (origin[e], origin[t]):
+            if self.vfx[v] == fx and self.vfy[v] == fy and self.vx[v] == x and self.vy[v] == y:
+                return v
+        m = self._vertex_at((fx, fy), x, y)
+        if m != NIL and self.v_incident[m] != NIL:
+            raise ValueError(f"split point {m} is a vertex of another edge")
+        f_left, f_right = face[e], face[t]
+        vertical = self.is_vertical_idx(e)
+        horizontal = self.is_horizontal_idx(e)
+        if vertical:
+            self._verticals_remove(f_left, e)
+            self._verticals_remove(f_right, t)
+
+        isolated = m != NIL
+        if not isolated:
+            m = len(self.vx)
+            self.vx.append(x)
+            self.vy.append(y)
+            self.vfx.append(fx)
+            self.vfy.append(fy)
+            self._index_vertex(m, (fx, fy))
+
+        mb = self._new_edge_pair()       # M → B  (left face)
+        am = mb + 1                      # M → A  (right face)
+        origin[mb] = origin[am] = m
+        twin[mb], twin[t] = t, mb
+        twin[am], twin[e] = e, am
+
+        # LEFT ring  A→M→B→…
+        face[mb] = f_left
+        n_e = nxt[e]
+        prv[mb], nxt[mb] = e, n_e
+        nxt[e] = prv[n_e] = mb
+
+        # RIGHT ring  B→M→A→…
+        face[am] = f_right
+        n_t = nxt[t]
+        prv[am], nxt[am] = t, n_t
+        nxt[t] = prv[n_t] = am
+
+        if isolated:
+            self.v_incident[m] = am
+        else:
+            self.v_incident.append(am)
+            self.v_star.append(NIL)
+        self._star_set(m, f_right, am)
+        self._star_set(m, f_left, mb)
+
+        for f in (f_left, f_right):      # each ring gains one edge of e's kind
+            self.f_edges[f] += 1
+            self.f_vertical[f] += vertical
+            self.f_horizontal[f] += horizontal
+
+        if vertical:
+            self._verticals_add(f_left, e, mb)
+            self._verticals_add(f_right, t, am)
+        return m
+
+    def split_edge_at_idx(self, e: int, points: List[Tuple[Fraction, Fraction]]) -> List[int]:
+        """
+        Split e (A→B) at all `points`, ordered from A to B, in one pass
+        (see DCEL.split_edge_at).  Return the new vertex indices.
+        """
+        k = len(points)
+        if k == 0:
+            return []
+        origin, twin, nxt, prv, face = (self.he_origin, self.he_twin,
+                                        self.he_next, self.he_prev, self.he_face)
+        t = twin[e]
+        f_left, f_right = face[e], face[t]
+        vertical = self.is_vertical_idx(e)
+        horizontal = self.is_horizontal_idx(e)
+        if vertical:
+            self._verticals_remove(f_left, e)
+            self._verticals_remove(f_right, t)
+
+        m0 = len(self.vx)
+        for m, (x, y) in enumerate(points, m0):
+            fx, fy = approx(x), approx(y)
+            self.vx.append(x)
+            self.vy.append(y)
+            self.vfx.append(fx)
+            self.vfy.append(fy)
+            self._index_vertex(m, (fx, fy))
+
+        first = len(origin)
+        block = array("q", [NIL]) * (2 * k)
+        for arr in (origin, twin, nxt, prv, face):
+            arr.extend(block)
+        n_left, n_right = nxt[e], nxt[t]
+        prev_f, prev_b = e, n_right           # fwd : M_i → M_i+1 , bwd : M_i → M_i-1
+        for i in range(k):
+            f, b = first + 2 * i, first + 2 * i + 1
+            origin[f] = origin[b] = m0 + i
+            face[f], face[b] = f_left, f_right
+            twin[b], twin[prev_f] = prev_f, b
+            prv[f], nxt[prev_f] = prev_f, f
+            nxt[b], prv[prev_b] = prev_b, b
+            self.v_incident.append(b)
+            self.v_star.append(NIL)
+            self._star_set(m0 + i, f_right, b)
+            self._star_set(m0 + i, f_left, f)
+            prev_f, prev_b = f, b
+        twin[prev_f], twin[t] = t, prev_f     # M_k → B  ⟷  B → M_k
+        nxt[prev_f], prv[n_left] = n_left, prev_f
+        nxt[t], prv[prev_b] = prev_b, t
+
+        for f in (f_left, f_right):
+            self.f_edges[f] += k
+            self.f_vertical[f] += k * vertical
+            self.f_horizontal[f] += k * horizontal
+        if vertical:
+            self._verticals_add(f_left, e, *range(first, first + 2 * k, 2))
+            self._verticals_add(f_right, t, *range(first + 1, first + 2 * k, 2))
+        return list(range(m0, m0 + k))
+
+    def edge_from_vertex_in_face_idx(self, v: int, f: int, toward: int = NIL) -> int:
+        """
+        Half-edge with origin v in face f (O(1) through v_star).  If v
+        sits on the ring of f more than once, `toward` picks the corner
+        (see DCEL.edge_from_vertex_in_face).
+        """
+        if self.v_incident[v] == NIL:
+            raise ValueError("vertex has no incident edge")
+        e = self._star_get(v, f)
+        if e == NIL:
+            raise ValueError("vertex not incident to given face")
+        if toward == NIL or self._in_corner_idx(e, toward):
+            return e
+        twin, prv = self.he_twin, self.he_prev
+        c = twin[prv[e]]                    # the other edges out of v
+        while c != e:
+            if self.he_face[c] == f and self._in_corner_idx(c, toward):
+                return c
+            c = twin[prv[c]]
+        return e
+
+    def corner_toward_idx(self, v: int, t) -> int:
+        """
+        See DCEL.corner_toward; NIL if v → t runs along an edge.  t is a
+        vertex index or any point with x, y, fx, fy.
+        """
+        twin, prv = self.he_twin, self.he_prev
+        start = e = self.v_incident[v]
+        while True:
+            if self._in_corner_idx(e, t):
+                return e
+            e = twin[prv[e]]
+            if e == start:
+                return NIL
+
+    def _in_corner_idx(self, e: int, t) -> bool:
+        origin = self.he_origin
+        v, b, a = origin[e], origin[self.he_twin[e]], origin[self.he_prev[e]]
+        if isinstance(t, int):
+            t = self._point(t)
+        return _in_corner(self._point(v), self._point(b), self._point(a), t)
+
+    def _point(self, v: int) -> "_Point":
+        return _Point(self.vx[v], self.vy[v], self.vfx[v], self.vfy[v])
+
+    def common_face_idx(self, a: int, b: int, exclude: int = NIL) -> int:
+        faces_a = [f for f, _ in self._star_items(a)]
+        for f, _ in self._star_items(b):
+            if f != exclude and f in faces_a:
+                return f
+        return NIL
+
+    def add_diagonal_idx(self, f: int, a: int, b: int) -> Tuple[int, int]:
+        """Insert diagonal (a,b) inside face f. Return (f, new_face)."""
+        nxt, prv, face = self.he_next, self.he_prev, self.he_face
+        h1 = self.edge_from_vertex_in_face_idx(a, f, b)
+        h2 = self.edge_from_vertex_in_face_idx(b, f, a)
+        h1_prev, h2_prev = prv[h1], prv[h2]
+
+        e1 = self._new_edge_pair()       # e1 : a→b ,  e2 : b→a
+        e2 = e1 + 1
+        self.he_origin[e1], self.he_origin[e2] = a, b
+        self.he_twin[e1], self.he_twin[e2] = e2, e1
+
+        prv[e1], nxt[e1] = h1_prev, h2
+        nxt[h1_prev] = prv[h2] = e1
+        prv[e2], nxt[e2] = h2_prev, h1
+        nxt[h2_prev] = prv[h1] = e2
+
+        nf = self._new_face()
+        origin = self.he_origin
+        n_edges = n_vert = n_horz = 0
+        moved = []
+        e = e1
+        while True:                      # ring #1 → new face
+            face[e] = nf
+            n_edges += 1
+            n_vert += self.is_vertical_idx(e)
+            n_horz += self.is_horizontal_idx(e)
+            v = origin[e]
+            if self._star_get(v, f) == e:
+                self._star_pop(v, f)     # (v, f) moved to nf
+                moved.append(v)
+            self._star_set(v, nf, e)
+            e = nxt[e]
+            if e == e1:
+                break
+        face[e2] = f                     # ring #2 keeps f (already painted)
+        self._star_set(b, f, e2)         # the only new edge of ring #2
+        for v in moved:                  # v may still sit on ring #2 as well
+            c = e0 = self._star_get(v, nf)
+            while True:
+                c = self.he_twin[prv[c]]
+                if c == e0:
+                    break
+                if face[c] == f:
+                    self._star_set(v, f, c, replace=False)
+                    break
+
+        # ring #2 = old ring + both diagonal halves − ring #1
+        diag_v, diag_h = self.is_vertical_idx(e1), self.is_horizontal_idx(e1)
+        for counts, ring1, diag in ((self.f_edges, n_edges, 1),
+                                    (self.f_vertical, n_vert, diag_v),
+                                    (self.f_horizontal, n_horz, diag_h)):
+            counts[nf] = ring1
+            counts[f] += 2 * diag - ring1
+
+        self.f_outer[nf] = e1
+        if face[self.f_outer[f]] != f:
+            self.f_outer[f] = e2
+        self.f_verticals[f] = None       # rebuilt on next access
+
+        inc = self.v_incident
+        if inc[a] == NIL or face[inc[a]] == f:
+            inc[a] = e1
+        if inc[b] == NIL or face[inc[b]] == f:
+            inc[b] = e2
+        return f, nf
+
+    def triangulate_face_idx(self, f: int, ring: List[int],
+                             triangles: List[Tuple[int, int, int]]) -> List[int]:
+        """Split face f along a whole triangulation, see DCEL.triangulate_face."""
+        nxt, prv, face, origin = self.he_next, self.he_prev, self.he_face, self.he_origin
+        k = len(ring)
+        for e in ring:
+            self._star_pop(origin[e], f)
+
+        pending: Dict[Tuple[int, int], int] = {}
+        faces = []
+        for t, corners in enumerate(triangles):
+            g = f if t == 0 else self._new_face()
+            edges = []
+            for p, q in zip(corners, corners[1:] + corners[:1]):
+                if q == (p + 1) % k:
+                    e = ring[p]
+                else:
+                    e = pending.pop((p, q), NIL)
+                    if e == NIL:
+                        e = self._new_edge_pair()
+                        origin[e], origin[e + 1] = origin[ring[p]], origin[ring[q]]
+                        self.he_twin[e], self.he_twin[e + 1] = e + 1, e
+                        pending[(q, p)] = e + 1
+                edges.append(e)
+            for a, b in zip(edges, edges[1:] + edges[:1]):
+                nxt[a], prv[b] = b, a
+                face[a] = g
+                self._star_set(origin[a], g, a)
+            self.f_outer[g] = edges[0]
+            self.f_edges[g] = 3
+            self.f_vertical[g] = sum(map(self.is_vertical_idx, edges))
+            self.f_horizontal[g] = sum(map(self.is_horizontal_idx, edges))
+            self.f_verticals[g] = None          # rebuilt on next access
+            faces.append(g)
+        return faces
+
+    def validate(self) -> None:
+        """Same checks as DCEL.validate, on the arrays."""
+        origin, twin, nxt, prv, face = (self.he_origin, self.he_twin,
+                                        self.he_next, self.he_prev, self.he_face)
+        n_he, n_f = len(origin), len(self.f_outer)
+        for arr in (twin, nxt, prv, face):
+            if len(arr) != n_he:
+                _broken("half-edge arrays differ in length")
+        ring_len = [0] * n_f
+        for i in range(n_he):
+            t, n, p, f = twin[i], nxt[i], prv[i], face[i]
+            if not 0 <= t < n_he or t == i or twin[t] != i:
+                _broken(f"half-edge {i}: twin is not symmetric")
+            if not 0 <= n < n_he or prv[n] != i:
+                _broken(f"half-edge {i}: next.prev is not the edge")
+            if not 0 <= p < n_he or nxt[p] != i:
+                _broken(f"half-edge {i}: prev.next is not the edge")
+            if origin[n] != origin[t]:
+                _broken(f"half-edge {i}: next does not start at its destination")
+            if not 0 <= f < n_f or face[n] != f:
+                _broken(f"half-edge {i}: face differs from next.face")
+            ring_len[f] += 1
+
+        for f in range(n_f):
+            e = self.f_outer[f]
+            if not 0 <= e < n_he or face[e] != f:
+                _broken(f"face {f}: outer edge lies on another face")
+            if self.f_edges[f] != ring_len[f]:
+                _broken(f"face {f}: ring counter {self.f_edges[f]} != {ring_len[f]} edges")
+
+        for v in range(len(self.v_star)):
+            for f, e in self._star_items(v):
+                if origin[e] != v or face[e] != f:
+                    _broken(f"vertex {v}: stale star entry")
+
+    # ---------- snapshots (see be_alg.dcel_io) ----------
+    _ARRAYS = ("he_origin", "he_twin", "he_next", "he_prev", "he_face", "f_outer",
+               "f_edges", "f_vertical", "f_horizontal", "v_incident", "vfx", "vfy")
+
+    def save(self, path) -> None:
+        """Same file format as DCEL.save – the arrays are written as they are."""
+        types = list(FaceType)
+        sections = {name: getattr(self, name) for name in self._ARRAYS}
+        sections["f_type"] = array("q", [NIL if t is None else types.index(t)
+                                         for t in self.f_type])
+        sections["star_off"], sections["star_face"], sections["star_edge"] = \
+            dcel_io.encode_stars(map(self._star_items, range(len(self.v_star))))
+        sections["coord_off"], blob = dcel_io.encode_coordinates(zip(self.vx, self.vy))
+        dcel_io.write_snapshot(path, self.number.name, self.outer, sections, blob)
+
+    @classmethod
+    def load(cls, path, number: Optional[str] = None) -> "ArrayDCEL":
+        """
+        Load a snapshot written by DCEL.save / ArrayDCEL.save.  The index
+        arrays are read from the file in one piece each; only the
+        coordinates and vertex stars are decoded per vertex.
+        """
+        saved, outer, sec, blob = dcel_io.read_snapshot(path)
+        conv = get_number_backend(number or saved).convert
+        xs, ys = dcel_io.decode_coordinates(sec["coord_off"], blob, conv)
+        return cls._from_sections(xs, ys, number or saved, outer, sec)
+
+    @classmethod
+    def _from_sections(cls, xs: list, ys: list, number: str, outer: int,
+                       sec: Dict[str, array]) -> "ArrayDCEL":
+        """Adopt the dcel_io link arrays as they are (see `load`)."""
+        dcel = cls([], number)
+        dcel.vx, dcel.vy = xs, ys
+        for name in cls._ARRAYS:
+            setattr(dcel, name, sec[name])
+        types = list(FaceType)
+        dcel.f_type = [None if t < 0 else types[t] for t in sec["f_type"]]
+        dcel.f_verticals = [None] * len(dcel.f_outer)
+        # the saved stars already lie in chain order: entry i → i + 1
+        off = sec["star_off"]
+        dcel.s_face, dcel.s_edge = sec["star_face"], sec["star_edge"]
+        dcel.s_next = array("q", range(1, len(dcel.s_face) + 1))
+        dcel.v_star = array("q", [NIL]) * (len(off) - 1)
+        for v in range(len(off) - 1):
+            if off[v] < off[v + 1]:
+                dcel.v_star[v] = off[v]
+                dcel.s_next[off[v + 1] - 1] = NIL
+        dcel.outer = outer
+        dcel._index_vertices()
+        return dcel
+
+    def _verticals_remove(self, f: int, e: int) -> None:
+        index = self.f_verticals[f]
+        if index is not None:
+            index.remove(self.half_edge(e))
+
+    def _verticals_add(self, f: int, *edges: int) -> None:
+        index = self.f_verticals[f]
+        if index is not None:
+            for e in edges:
+                index.add(self.half_edge(e))
+
+    def face_verticals(self, f: int) -> VerticalEdgeIndex:
+        index = self.f_verticals[f]
+        if index is None:
+            start = e = self.f_outer[f]
+            ring = []
+            while True:
+                if self.is_vertical_idx(e):
+                    ring.append(self.half_edge(e))
+                e = self.he_next[e]
+                if e == start:
+                    break
+            index = self.f_verticals[f] = VerticalEdgeIndex(ring)
+        return index
+
+    # ---------- handle level (same API as be_alg.dcel.DCEL) ----------
+    def vertex(self, v: int) -> VertexRef:
+        ref = self._v_refs.get(v)
+        if ref is None:
+            ref = self._v_refs[v] = VertexRef(self, v)
+        return ref
+
+    def half_edge(self, e: int) -> HalfEdgeRef:
+        ref = self._he_refs.get(e)
+        if ref is None:
+            ref = self._he_refs[e] = HalfEdgeRef(self, e)
+        return ref
+
+    def face(self, f: int) -> FaceRef:
+        if f == self.outer and self._outer_ref is not None:
+            return self._outer_ref
+        ref = self._f_refs.get(f)
+        if ref is None:
+            ref = self._f_refs[f] = FaceRef(self, f)
+        return ref
+
+    @property
+    def vertices(self) -> "_RefView":
+        return _RefView(self.vertex, lambda: len(self.vx))
+
+    @property
+    def half_edges(self) -> "_RefView":
+        return _RefView(self.half_edge, lambda: len(self.he_origin))
+
+    @property
+    def faces(self) -> "_RefView":
+        return _RefView(self.face, lambda: len(self.f_outer))
+
+    @property
+    def outer_face(self) -> Optional[FaceRef]:
+        if self.outer == NIL:
+            return None
+        if self._outer_ref is None:
+            self._outer_ref = self.face(self.outer)
+        return self._outer_ref
+
+    def vertex_at(self, x, y) -> Optional[VertexRef]:
+        """The vertex at exactly (x, y), or None.  O(1)."""
+        v = self.vertex_at_idx(x, y)
+        return None if v == NIL else self.vertex(v)
+
+    def split_edge(self, he: HalfEdgeRef, x: Fraction, y: Fraction) -> VertexRef:
+        """Split directed edge `he` (A→B) at (x,y). Return vertex M."""
+        return self.vertex(self.split_edge_idx(he.index, x, y))
+
+    def split_edge_at(self, he: HalfEdgeRef,
+                      points: List[Tuple[Fraction, Fraction]]) -> List[VertexRef]:
+        """Split `he` at all `points` (ordered from A to B) in one pass."""
+        return [self.vertex(m) for m in self.split_edge_at_idx(he.index, points)]
+
+    def add_diagonal(self, face: FaceRef,
+                     v1: VertexRef, v2: VertexRef) -> Tuple[FaceRef, FaceRef]:
+        """Insert diagonal (v1,v2) inside 'face'. Return (face, new_face)."""
+        f, nf = self.add_diagonal_idx(face.index, v1.index, v2.index)
+        return self.face(f), self.face(nf)
+
+    def triangulate_face(self, face: FaceRef, ring: List[HalfEdgeRef],
+                         triangles: List[Tuple[int, int, int]]) -> List[FaceRef]:
+        """Split `face` along a whole triangulation, see DCEL.triangulate_face."""
+        faces = self.triangulate_face_idx(face.index, [he.index for he in ring], triangles)
+        return [self.face(g) for g in faces]
+
+    def set_ftype(self, face: FaceRef, ftype: Optional[FaceType]) -> None:
+        self.f_type[face.index] = ftype
+
+    def edge_from_vertex_in_face(self, v: VertexRef, f: FaceRef,
+                                 toward: Optional[VertexRef] = None) -> HalfEdgeRef:
+        t = NIL if toward is None else toward.index
+        return self.half_edge(self.edge_from_vertex_in_face_idx(v.index, f.index, t))
+
+    def corner_toward(self, v: VertexRef, t) -> Optional[HalfEdgeRef]:
+        e = self.corner_toward_idx(v.index, t.index if isinstance(t, VertexRef) else t)
+        return None if e == NIL else self.half_edge(e)
+
+    def faces_around(self, v: VertexRef) -> List[FaceRef]:
+        return [self.face(f) for f, _ in self._star_items(v.index)]
+
+    def common_face(self, v1: VertexRef, v2: VertexRef,
+                    exclude: Optional[FaceRef] = None) -> Optional[FaceRef]:
+        f = self.common_face_idx(v1.index, v2.index,
+                                 NIL if exclude is None else exclude.index)
+        return None if f == NIL else self.face(f)
+
+
+class _Point:
+    __slots__ = ("x", "y", "fx", "fy")
+
+    def __init__(self, x, y, fx, fy):
+        self.x, self.y, self.fx, self.fy = x, y, fx, fy
+
+
+class _RefView(Sequence):
+    """Read-only list-like view that yields handles by index."""
+    __slots__ = ("_get", "_len")
+
+    def __init__(self, get, length):
+        self._get = get
+        self._len = length
+
+    def __len__(self) -> int:
+        return self._len()
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._get(j) for j in range(*i.indices(len(self)))]
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError(i)
+        return self._get(i)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._get(i)
+
+
+# ------------------------------------------------------------
+#  handles
+# ------------------------------------------------------------
+class VertexRef:
+    __slots__ = ("dcel", "index", "__weakref__")
+
+    def __init__(self, dcel: ArrayDCEL, index: int):
+        self.dcel = dcel
+        self.index = index
+
+    @property
+    def x(self):
+        return self.dcel.vx[self.index]
+
+    @property
+    def y(self):
+        return self.dcel.vy[self.index]
+
+    @property
+    def fx(self) -> float:
+        return self.dcel.vfx[self.index]
+
+    @property
+    def fy(self) -> float:
+        return self.dcel.vfy[self.index]
+
+    @property
+    def incident(self) -> Optional[HalfEdgeRef]:
+        e = self.dcel.v_incident[self.index]
+        return None if e == NIL else self.dcel.half_edge(e)
+
+    def __repr__(self):
+        return f"V({float(self.x):.2f},{float(self.y):.2f})"
+
+
+class HalfEdgeRef:
+    __slots__ = ("dcel", "index", "__weakref__")
+
+    def __init__(self, dcel: ArrayDCEL, index: int):
+        self.dcel = dcel
+        self.index = index
+
+    @property
+    def origin(self) -> VertexRef:
+        return self.dcel.vertex(self.dcel.he_origin[self.index])
+
+    @property
+    def twin(self) -> HalfEdgeRef:
+        return self.dcel.half_edge(self.dcel.he_twin[self.index])
+
+    @property
+    def next(self) -> HalfEdgeRef:
+        return self.dcel.half_edge(self.dcel.he_next[self.index])
+
+    @property
+    def prev(self) -> HalfEdgeRef:
+        return self.dcel.half_edge(self.dcel.he_prev[self.index])
+
+    @property
+    def face(self) -> FaceRef:
+        return self.dcel.face(self.dcel.he_face[self.index])
+
+    def __repr__(self):
+        return f"E({self.origin}→{self.twin.origin})"
+
+
+class FaceRef:
+    __slots__ = ("dcel", "index", "__weakref__")
+
+    def __init__(self, dcel: ArrayDCEL, index: int):
+        self.dcel = dcel
+        self.index = index
+
+    @property
+    def outer(self) -> HalfEdgeRef:
+        return self.dcel.half_edge(self.dcel.f_outer[self.index])
+
+    @property
+    def ftype(self) -> Optional[FaceType]:
+        return self.dcel.f_type[self.index]
+
+    @ftype.setter
+    def ftype(self, value: Optional[FaceType]) -> None:
+        self.dcel.f_type[self.index] = value
+
+    @property
+    def verticals(self) -> VerticalEdgeIndex:
+        return self.dcel.face_verticals(self.index)
+
+    @property
+    def n_edges(self) -> int:
+        return self.dcel.f_edges[self.index]
+
+    @property
+    def n_vertical(self) -> int:
+        return self.dcel.f_vertical[self.index]
+
+    @property
+    def n_horizontal(self) -> int:
+        return self.dcel.f_horizontal[self.index]
@@ -0,0 +1,96 @@
+# ------------------------------------------------------------
+#  src/be_alg/bitsize.py
+#  bit lengths of the exact coordinates  (telemetry)
+# ------------------------------------------------------------
+"""
+split_edge interpolates along edges that may already be split, so
+Steiner coordinates can pick up long numerators and denominators.
+Every later exact operation pays for them, the verifier included.
+`bit_sizes` measures them on a DCEL / ArrayDCEL (every vertex) or a
+Cgshop2025Solution (its Steiner points):
+
+    report = bit_sizes(dcel)
+    report.max_bits, report.worst          # → (index, x, y, bits)
+    report.to_json()
+
+SlabStats(bit_sizes=True) takes one report after every stage that
+run_stage runs (see be_alg.slab_partition), so a blow-up shows up at
+the stage that caused it.
+"""
+from __future__ import annotations
+
+import json
+from collections import Counter
+from fractions import Fraction
+from typing import Iterable, Optional, Tuple
+
+from be_alg.export import format_rationals
+from be_alg.number_backend import as_fraction
+
+
+class BitSizeReport:
+    """
+    Histograms over all coordinates (x and y together):
+        numerators    bit length of |numerator|  → how many coordinates
+        denominators  bit length of denominator  → how many coordinates
+    worst – (index, x, y, bits) of the point whose four numbers are the
+    longest together; x / y in solution format ("p/q" or int).
+    """
+    __slots__ = ("numerators", "denominators", "points", "worst")
+
+    def __init__(self):
+        self.numerators: Counter = Counter()
+        self.denominators: Counter = Counter()
+        self.points: int = 0
+        self.worst: Optional[Tuple[int, object, object, int]] = None
+
+    def add(self, index: int, x: Fraction, y: Fraction) -> None:
+        nx, dx = x.numerator.bit_length(), x.denominator.bit_length()
+        ny, dy = y.numerator.bit_length(), y.denominator.bit_length()
+        self.numerators[nx] += 1
+        self.numerators[ny] += 1
+        self.denominators[dx] += 1
+        self.denominators[dy] += 1
+        self.points += 1
+        bits = nx + dx + ny + dy
+        if self.worst is None or bits > self.worst[3]:
+            self.worst = (index, *format_rationals((x, y), exact_fractions=True), bits)
+
+    @property
+    def max_bits(self) -> int:
+        """Longest numerator or denominator."""
+        return max(self.numerators | self.denominators, default=0)
+
+    def to_dict(self) -> dict:
+        return {"points": self.points, "max_bits": self.max_bits,
+                "numerators": dict(sorted(self.numerators.items())),
+                "denominators": dict(sorted(self.denominators.items())),
+                "worst": self.worst}
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+def bit_sizes(source, first: int = 0) -> BitSizeReport:
+    """
+    Report for a DCEL / ArrayDCEL (vertex indices) or a
+    Cgshop2025Solution (Steiner point indices).  Points before `first`
+    are skipped, e.g. first=num_points to look at the Steiner points of
+    a DCEL only; the reported index stays the full one.
+    """
+    report = BitSizeReport()
+    for i, x, y in _coordinates(source, first):
+        report.add(i, x, y)
+    return report
+
+
+def _coordinates(source, first: int) -> Iterable[Tuple[int, Fraction, Fraction]]:
+    if hasattr(source, "steiner_points_x"):             # Cgshop2025Solution
+        xs, ys, conv = source.steiner_points_x, source.steiner_points_y, Fraction
+    elif hasattr(source, "vx"):                         # ArrayDCEL
+        xs, ys, conv = source.vx, source.vy, as_fraction
+    else:
+        xs, ys = [v.x for v in source.vertices], [v.y for v in source.vertices]
+        conv = as_fraction
+    for i in range(first, len(xs)):
+        yield i, conv(xs[i]), conv(ys[i])
@@ -1,15 +1,26 @@
+from array import array
 from fractions import Fraction
-from typing import List, Optional, Tuple
-from src.be_alg.face_types import FaceType
+from typing import Dict, List, Optional, Tuple
+from be_alg import dcel_io
+from be_alg.face_index import VerticalEdgeIndex
+from be_alg.face_types import FaceType
+from be_alg.number_backend import NumberBackend, approx, get_number_backend
+from be_alg.predicates import is_horizontal_filtered as _is_horizontal
+from be_alg.predicates import is_vertical_filtered as _is_vertical
+from be_alg.subdivision import build_subdivision, link_edges
 
 
 class Vertex:
-    __slots__ = ("x", "y", "incident")
+    __slots__ = ("x", "y", "fx", "fy", "incident", "star")
 
     def __init__(self, x: Fraction, y: Fraction):
         self.x: Fraction = x
         self.y: Fraction = y
+        self.fx: float = approx(x)      # monotone float images for the
+        self.fy: float = approx(y)      # filtered predicates
         self.incident: Optional["HalfEdge"] = None
+        # (vertex, face) → outgoing half-edge, kept by split_edge / add_diagonal
+        self.star: Dict["Face", "HalfEdge"] = {}
 
     # נוח להדפסה
     def __repr__(self):
@@ -31,30 +42,53 @@ class HalfEdge:
 
 
 class Face:
-    __slots__ = ("outer", "ftype")
+    __slots__ = ("outer", "ftype", "verticals", "n_edges", "n_horizontal")
 
     def __init__(self):
         self.outer: Optional[HalfEdge] = None
         self.ftype: Optional[FaceType] = None   # ← ימולא אחרי classify_face
+        self.verticals = VerticalEdgeIndex()    # vertical half-edges on the ring
+        self.n_edges: int = 0                   # ring length
+        self.n_horizontal: int = 0              # horizontal half-edges on the ring
+
+    @property
+    def n_vertical(self) -> int:
+        return len(self.verticals)
 
 
 class DCEL:
     """ DCEL מינימלי: מספיק ל-slab partition + triangulation """
 
-    def __init__(self, points: List[Tuple[Fraction, Fraction]]):
-        self.vertices: List[Vertex] = [Vertex(x, y) for x, y in points]
+    def __init__(self, points: List[Tuple[Fraction, Fraction]],
+                 number: str = "fraction"):
+        """
+        number – coordinate type, see be_alg.number_backend
+                 ("fraction" / "gmpy2" / "field").
+        """
+        self.number: NumberBackend = get_number_backend(number)
+        conv = self.number.convert
+        self.vertices: List[Vertex] = [Vertex(conv(x), conv(y)) for x, y in points]
         self.half_edges: List[HalfEdge] = []
         self.faces: List[Face] = []
         self.outer_face: Optional[Face] = None
+        # undo records of the open transactions (see begin / rollback)
+        self._journal: Optional[list] = None
+        self._marks: List[Tuple[int, int, int, int]] = []
+        # (fx, fy) → vertex, see vertex_at; the rare points that share
+        # their float images get a tuple of vertices under the one key
+        self._by_xy: Dict[Tuple[float, float], object] = {}
+        for v in self.vertices:
+            self._index_vertex(v)
 
     # ---------- בנייה ראשונית מהגבול (ללא אילוצים) ----------
     @classmethod
     def from_polygon(cls, boundary_indices: List[int],
-                     points: List[Tuple[Fraction, Fraction]]):
+                     points: List[Tuple[Fraction, Fraction]],
+                     number: str = "fraction"):
         """
         boundary_indices – רצף אינדקסים CCW (ללא חזרה על הראשון).
         """
-        dcel = cls(points)
+        dcel = cls(points, number)
         n = len(boundary_indices)
 
         # יוצרים n זוגות half-edges
@@ -88,6 +122,9 @@ class DCEL:
             te.prev = edges_rev[(i + 1) % n]
             te.face = outer
 
+            v_origin.star[inner] = e
+            v_dest.star[outer] = te
+
             # שמים מצביע incident כלשהו
             if v_origin.incident is None:
                 v_origin.incident = e
@@ -96,22 +133,120 @@ class DCEL:
 
         inner.outer = edges_fwd[0]
         outer.outer = edges_rev[0]
+        inner.verticals = VerticalEdgeIndex(e for e in edges_fwd if _is_vertical(e))
+        outer.verticals = VerticalEdgeIndex(e for e in edges_rev if _is_vertical(e))
+        inner.n_edges = outer.n_edges = n
+        inner.n_horizontal = outer.n_horizontal = sum(map(_is_horizontal, edges_fwd))
 
         # רישום ברשימות
         dcel.half_edges.extend(edges_fwd + edges_rev)
         dcel.faces.extend([inner, outer])
         return dcel
 
+    # ---------- בנייה מהמופע כולו (גבול + אילוצים) ----------
+    @classmethod
+    def from_instance(cls, instance, number: str = "fraction") -> "DCEL":
+        """
+        Boundary and all `additional_constraints` of a Cgshop2025Instance
+        in one sweep (see be_alg.subdivision) – no per-constraint face
+        search.  Loose constraint components get a vertical bridge to the
+        boundary.  Without constraints this equals from_polygon.
+        """
+        conv = get_number_backend(number).convert
+        xs, ys, sec, outer = build_subdivision(
+            [conv(x) for x in instance.points_x], [conv(y) for y in instance.points_y],
+            list(instance.region_boundary), instance.additional_constraints)
+        return cls._from_sections(xs, ys, number, outer, sec)
+
+    # ---------- בנייה מרשימת צלעות (טריאנגולציה / פתרון קיים) ----------
+    @classmethod
+    def from_edges(cls, points: List[Tuple[Fraction, Fraction]],
+                   edges: List[Tuple[int, int]], number: str = "fraction") -> "DCEL":
+        """
+        DCEL of a connected plane graph given as points plus undirected
+        index pairs, e.g. a CDT.  Edges are sorted by angle around every
+        vertex (see be_alg.subdivision.link_edges); O(E log deg).
+        """
+        conv = get_number_backend(number).convert
+        xs, ys = [conv(x) for x, _ in points], [conv(y) for _, y in points]
+        sec, outer = link_edges(xs, ys, edges)
+        return cls._from_sections(xs, ys, number, outer, sec)
+
+    @classmethod
+    def from_solution(cls, instance, solution, number: str = "fraction") -> "DCEL":
+        """
+        DCEL of a Cgshop2025Solution (e.g. of DelaunayBasedSolver): the
+        instance points, then the Steiner points – the order
+        dcel_to_solution writes, so a re-export keeps every index.
+        """
+        points = list(zip(instance.points_x, instance.points_y))
+        points += zip(solution.steiner_points_x, solution.steiner_points_y)
+        return cls.from_edges(points, solution.edges, number)
+
+    # ---------- vertices by coordinates ----------
+    def vertex_at(self, x, y) -> Optional[Vertex]:
+        """
+        The vertex at exactly (x, y), or None.  O(1): coordinates of the
+        "field" backend do not hash, so the index is keyed by the float
+        images and the exact coordinates are compared on a hit.
+        """
+        return self._vertex_at((approx(x), approx(y)), x, y)
+
+    def _vertex_at(self, key: Tuple[float, float], x, y) -> Optional[Vertex]:
+        v = self._by_xy.get(key)
+        if v is None:
+            return None
+        for w in v if type(v) is tuple else (v,):
+            if w.x == x and w.y == y:
+                return w
+        return None
+
+    def _index_vertex(self, v: Vertex) -> None:
+        key = (v.fx, v.fy)
+        w = self._by_xy.setdefault(key, v)
+        if w is not v:
+            self._by_xy[key] = (*w, v) if type(w) is tuple else (w, v)
+
+    def _unindex_vertex(self, v: Vertex) -> None:
+        key = (v.fx, v.fy)
+        w = self._by_xy[key]
+        if type(w) is not tuple:
+            del self._by_xy[key]
+            return
+        rest = tuple(u for u in w if u is not v)
+        self._by_xy[key] = rest[0] if len(rest) == 1 else rest
+
     def split_edge(self, he: HalfEdge, x: Fraction, y: Fraction) -> Vertex:
-        """Split directed edge `he` (A→B) at (x,y). Return vertex M."""
+        """
+        Split directed edge `he` (A→B) at (x,y). Return vertex M.
+        At an endpoint nothing is split and that endpoint is returned; a
+        vertex without edges already at (x,y) (an isolated input point)
+        becomes M instead of a duplicate.
+        """
         A = he.origin
         B = he.twin.origin
+        fx, fy = approx(x), approx(y)
+        for V in (A, B):
+            if V.fx == fx and V.fy == fy and V.x == x and V.y == y:
+                return V
+        M = self._vertex_at((fx, fy), x, y)
+        if M is not None and M.incident is not None:
+            raise ValueError(f"split point {M} is a vertex of another edge")
         F_left = he.face
-        F_right = he.twin.face
-
-        # 0. create new vertex
-        M = Vertex(x, y)
-        self.vertices.append(M)
+        tw = he.twin            # B→A  (becomes B→M)
+        F_right = tw.face
+        vertical = A.fx == B.fx and A.x == B.x
+        horizontal = A.fy == B.fy and A.y == B.y
+        if vertical:                    # keys change with the endpoints
+            F_left.verticals.remove(he)
+            F_right.verticals.remove(tw)
+
+        # 0. create new vertex (or adopt the isolated one)
+        isolated = [] if M is None else [M]
+        if M is None:
+            M = Vertex(x, y)
+            self.vertices.append(M)
+            self._index_vertex(M)
 
         # 1. create new half-edges
         he_mb = HalfEdge()  # M → B     (left face)
@@ -120,8 +255,8 @@ class DCEL:
 
         he_mb.origin = M
         he_am.origin = M
-        he_mb.twin = he.twin  # M→B  ⟷  B→M
-        he.twin.twin = he_mb
+        he_mb.twin = tw  # M→B  ⟷  B→M
+        tw.twin = he_mb
         he_am.twin = he  # M→A  ⟷  A→M
         he.twin = he_am
 
@@ -146,11 +281,569 @@ class DCEL:
 
         # 2b. RIGHT face ring (B→M→A→…)
         he_am.face = F_right
-        _splice(he.twin, he.twin.next, he_am)
-        he.twin.face = F_right  # remains
+        _splice(tw, tw.next, he_am)
+        tw.face = F_right  # remains
 
-        # 3. incident pointer
+        # 3. incident pointer + star of M  (A, B keep theirs)
         M.incident = he_am
-
+        M.star[F_right] = he_am
+        M.star[F_left] = he_mb
+
+        # 4. ring counters – each ring gains one edge of the same kind
+        F_left.n_edges += 1
+        F_right.n_edges += 1
+        if horizontal:
+            F_left.n_horizontal += 1
+            F_right.n_horizontal += 1
+        if vertical:
+            for e in (he, he_mb):
+                F_left.verticals.add(e)
+            for e in (tw, he_am):
+                F_right.verticals.add(e)
+
+        if self._journal is not None:
+            self._journal.append((self._unsplit,
+                                  (he, [he_mb], [he_am], vertical, horizontal, isolated)))
         return M
 
+    def split_edge_at(self, he: HalfEdge,
+                      points: List[Tuple[Fraction, Fraction]]) -> List[Vertex]:
+        """
+        Split directed edge `he` (A→B) at all `points` (ordered from A to B)
+        in one pass: A→M1→…→Mk→B on the left ring, B→Mk→…→M1→A on the
+        right ring, each ring spliced once.  Same result as calling
+        split_edge on the successive B-side pieces; returns [M1, …, Mk].
+        """
+        k = len(points)
+        if k == 0:
+            return []
+        A, B = he.origin, he.twin.origin
+        tw = he.twin
+        F_left, F_right = he.face, tw.face
+        vertical = A.fx == B.fx and A.x == B.x
+        horizontal = A.fy == B.fy and A.y == B.y
+        if vertical:
+            F_left.verticals.remove(he)
+            F_right.verticals.remove(tw)
+
+        ms = [Vertex(x, y) for x, y in points]
+        fwd = [HalfEdge() for _ in range(k)]    # fwd[i] : M_i → M_i+1   (left)
+        bwd = [HalfEdge() for _ in range(k)]    # bwd[i] : M_i → M_i-1   (right)
+        self.vertices.extend(ms)
+        for M in ms:
+            self._index_vertex(M)
+        for f, b in zip(fwd, bwd):
+            self.half_edges.extend((f, b))
+
+        n_left, n_right = he.next, tw.next
+        for i, (M, f, b) in enumerate(zip(ms, fwd, bwd)):
+            f.origin = b.origin = M
+            f.face, b.face = F_left, F_right
+            b.twin = fwd[i - 1] if i else he          # M_i → M_i-1  ⟷  M_i-1 → M_i
+            b.twin.twin = b
+            f.prev = fwd[i - 1] if i else he
+            f.prev.next = f
+            b.next = bwd[i - 1] if i else n_right
+            b.next.prev = b
+            M.incident = b
+            M.star[F_right] = b
+            M.star[F_left] = f
+        fwd[-1].twin, tw.twin = tw, fwd[-1]             # M_k → B  ⟷  B → M_k
+        fwd[-1].next, n_left.prev = n_left, fwd[-1]
+        tw.next, bwd[-1].prev = bwd[-1], tw
+
+        F_left.n_edges += k
+        F_right.n_edges += k
+        if horizontal:
+            F_left.n_horizontal += k
+            F_right.n_horizontal += k
+        if vertical:
+            for e in [he] + fwd:
+                F_left.verticals.add(e)
+            for e in [tw] + bwd:
+                F_right.verticals.add(e)
+        if self._journal is not None:
+            self._journal.append((self._unsplit, (he, fwd, bwd, vertical, horizontal, [])))
+        return ms
+
+    def add_diagonal(self, face: Face,
+                     v1: Vertex, v2: Vertex) -> Tuple[Face, Face]:
+        """
+        Insert diagonal (v1,v2) inside 'face' and split it into two faces.
+        Returns (face, new_face) – the shrunk original face and the face
+        on the v1→v2 side of the new diagonal.
+        """
+        # -- 0.  locate boundary edges that start at v1 , v2  inside 'face'
+        h1 = self.edge_from_vertex_in_face(v1, face, v2)   # v1 → …  in F
+        h2 = self.edge_from_vertex_in_face(v2, face, v1)   # v2 → …  in F
+        journal = self._journal
+        if journal is not None:
+            before = (face.outer, face.n_edges, face.n_horizontal,
+                      v1.incident, v2.incident)
+        stars: List[Tuple[Vertex, dict]] = []   # ring #1 stars as they were (journal)
+
+        # save their current predecessors BEFORE we touch anything
+        h1_prev = h1.prev
+        h2_prev = h2.prev
+
+        # -- 1.  create the two half-edges of the new diagonal
+        e1, e2 = HalfEdge(), HalfEdge()     # e1 : v1→v2 ,  e2 : v2→v1
+        e1.origin, e2.origin = v1, v2
+        e1.twin,   e2.twin   = e2, e1
+        self.half_edges.extend([e1, e2])
+
+        # -- 2.  splice e1 between h1_prev ↔ h2
+        e1.prev = h1_prev
+        e1.next = h2
+        h1_prev.next = e1
+        h2.prev = e1
+
+        # -- 3.  splice e2 between h2_prev ↔ h1
+        e2.prev = h2_prev
+        e2.next = h1
+        h2_prev.next = e2
+        h1.prev = e2
+
+        # -- 4.  build the new face  (all half-edges reachable from e1)
+        new_face = Face()
+        self.faces.append(new_face)
+
+        # paint ring #1 → new_face; its vertical index, counters and the
+        # vertex stars are filled on the way
+        verticals, moved = [], []
+        n_edges = n_horizontal = 0
+        he = e1
+        while True:
+            n_edges += 1
+            n_horizontal += _is_horizontal(he)
+            he.face = new_face
+            star = he.origin.star
+            if journal is not None:
+                stars.append((he.origin, dict(star)))
+            if star.get(face) is he:
+                del star[face]              # (v, face) moved to new_face
+                moved.append(he)
+            star[new_face] = he
+            if _is_vertical(he):
+                verticals.append(he)
+            he = he.next
+            if he is e1:
+                break
+        new_face.verticals = VerticalEdgeIndex(verticals)
+        new_face.n_edges, new_face.n_horizontal = n_edges, n_horizontal
+        new_face.outer = e1
+
+        # ring #2 keeps 'face' = old ring + both diagonal halves − ring #1,
+        # so it is updated without walking it
+        e2.face = face
+        v2.star[face] = e2
+        for first in moved:                 # its origin may sit on ring #2 as well
+            he = first
+            while True:
+                he = he.prev.twin
+                if he is first:
+                    break
+                if he.face is face:
+                    first.origin.star.setdefault(face, he)
+                    break
+        face.n_edges += 2 - n_edges
+        face.n_horizontal += 2 * _is_horizontal(e1) - n_horizontal
+        for he in verticals:
+            if he is not e1:
+                face.verticals.remove(he)
+        if verticals and verticals[0] is e1:
+            face.verticals.add(e2)
+        if face.outer.face is not face:     # outer pointer might cross to other ring
+            face.outer = e2
+
+        # (optionally) set incident pointer of the vertices
+        if v1.incident is None or v1.incident.face is face:
+            v1.incident = e1
+        if v2.incident is None or v2.incident.face is face:
+            v2.incident = e2
+
+        if journal is not None:
+            journal.append((self._remove_diagonal,
+                            (face, new_face, e1, verticals, stars, before)))
+        return face, new_face
+
+    def triangulate_face(self, face: Face, ring: List[HalfEdge],
+                         triangles: List[Tuple[int, int, int]]) -> List[Face]:
+        """
+        Split `face` into triangles in one pass – no per-diagonal ring
+        walks, so O(len(ring)) instead of O(len(ring)²) for k-3 add_diagonal
+        calls.  ring – the face's half-edges in order (ring[i] starts at
+        position i); triangles – CCW position triples that tile the face
+        (a face whose ring visits a vertex twice cannot be handed in).
+        Returns the triangle faces; the first one is `face` itself.
+        """
+        k = len(ring)
+        if self._journal is not None:
+            stars = [(he.origin, dict(he.origin.star)) for he in ring]
+            before = (face.outer, face.n_edges, face.n_horizontal, face.verticals, stars)
+        for he in ring:
+            he.origin.star.pop(face, None)
+
+        pending: Dict[Tuple[int, int], HalfEdge] = {}    # diagonal halves still unused
+        faces = []
+        for t, corners in enumerate(triangles):
+            f = face if t == 0 else Face()
+            edges = []
+            for p, q in zip(corners, corners[1:] + corners[:1]):
+                if q == (p + 1) % k:
+                    he = ring[p]
+                else:
+                    he = pending.pop((p, q), None)
+                    if he is None:
+                        he, tw = HalfEdge(), HalfEdge()
+                        he.origin, tw.origin = ring[p].origin, ring[q].origin
+                        he.twin, tw.twin = tw, he
+                        self.half_edges.extend((he, tw))
+                        pending[(q, p)] = tw
+                edges.append(he)
+            for a, b in zip(edges, edges[1:] + edges[:1]):
+                a.next, b.prev = b, a
+                a.face = f
+                a.origin.star[f] = a
+            f.outer = edges[0]
+            f.n_edges = 3
+            f.n_horizontal = sum(map(_is_horizontal, edges))
+            f.verticals = VerticalEdgeIndex([he for he in edges if _is_vertical(he)])
+            if t:
+                self.faces.append(f)
+            faces.append(f)
+
+        if self._journal is not None:
+            self._journal.append((self._untriangulate, (face, ring, faces, before)))
+        return faces
+
+    def edge_from_vertex_in_face(self, v: Vertex, f: Face,
+                                 toward: Optional[Vertex] = None) -> HalfEdge:
+        """
+        Return a half-edge whose origin is v and whose face is f.
+        Raise ValueError if none exists.  O(1) through `v.star`.
+
+        v can sit on the ring of f more than once (next to a dangling
+        constraint edge); `toward` then picks the corner of f at v that
+        the direction v → toward points into.
+        """
+        if v.incident is None:
+            raise ValueError("vertex has no incident edge")
+        he = v.star.get(f)
+        if he is None:
+            raise ValueError("vertex not incident to given face")
+        if toward is None or _in_corner(v, he.twin.origin, he.prev.origin, toward):
+            return he
+        e = he.prev.twin                    # the other edges out of v
+        while e is not he:
+            if e.face is f and _in_corner(v, e.twin.origin, e.prev.origin, toward):
+                return e
+            e = e.prev.twin
+        return he
+
+    def corner_toward(self, v: Vertex, t: Vertex) -> Optional[HalfEdge]:
+        """
+        The half-edge out of v whose face corner the direction v → t
+        points into (its face holds the start of segment v t), or None
+        if that direction runs along an edge of v.  O(deg v).  t can be
+        any point with x, y, fx, fy – e.g. a Vertex outside the DCEL.
+        """
+        start = e = v.incident
+        while True:
+            if _in_corner(v, e.twin.origin, e.prev.origin, t):
+                return e
+            e = e.prev.twin
+            if e is start:
+                return None
+
+    def set_ftype(self, face: Face, ftype: Optional[FaceType]) -> None:
+        """Set face.ftype – journaled, unlike assigning it directly."""
+        if self._journal is not None:
+            self._journal.append((self._unset_ftype, (face, face.ftype)))
+        face.ftype = ftype
+
+    # ---------- transactions ----------
+    def begin(self) -> None:
+        """
+        Open a transaction: split_edge, split_edge_at, add_diagonal,
+        triangulate_face and set_ftype journal what they change until the
+        matching commit / rollback.  Transactions nest.  Vertex stars come
+        back in their old insertion order.
+        """
+        if self._journal is None:
+            self._journal = []
+        self._marks.append((len(self._journal), len(self.vertices),
+                            len(self.half_edges), len(self.faces)))
+
+    def commit(self) -> None:
+        """Keep the changes of the innermost transaction."""
+        if not self._marks:
+            raise RuntimeError("commit() without begin()")
+        self._marks.pop()
+        if not self._marks:
+            self._journal = None
+
+    def rollback(self) -> None:
+        """
+        Undo the innermost transaction, newest change first – O(changes),
+        not O(n).  Vertices, half-edges and faces created since begin()
+        are dropped; the surviving objects are the ones from before.
+        """
+        if not self._marks:
+            raise RuntimeError("rollback() without begin()")
+        j, n_v, n_he, n_f = self._marks.pop()
+        journal = self._journal
+        while len(journal) > j:
+            undo, args = journal.pop()
+            undo(*args)
+        for v in self.vertices[n_v:]:
+            self._unindex_vertex(v)
+        del self.vertices[n_v:], self.half_edges[n_he:], self.faces[n_f:]
+        if not self._marks:
+            self._journal = None
+
+    def _unsplit(self, he: HalfEdge, fwd: List[HalfEdge], bwd: List[HalfEdge],
+                 vertical: bool, horizontal: bool, isolated: List[Vertex]) -> None:
+        """Undo split_edge / split_edge_at: he and its twin span A–B again."""
+        for M in isolated:                  # an adopted input point is let go
+            M.incident, M.star = None, {}
+        tw = fwd[-1].twin
+        F_left, F_right = he.face, tw.face
+        if vertical:
+            for e in [he] + fwd:
+                F_left.verticals.remove(e)
+            for e in [tw] + bwd:
+                F_right.verticals.remove(e)
+        n_left, n_right = fwd[-1].next, bwd[0].next
+        he.twin, tw.twin = tw, he
+        he.next, n_left.prev = n_left, he
+        tw.next, n_right.prev = n_right, tw
+        F_left.n_edges -= len(fwd)
+        F_right.n_edges -= len(fwd)
+        if horizontal:
+            F_left.n_horizontal -= len(fwd)
+            F_right.n_horizontal -= len(fwd)
+        if vertical:
+            F_left.verticals.add(he)
+            F_right.verticals.add(tw)
+
+    def _remove_diagonal(self, face: Face, new_face: Face, e1: HalfEdge,
+                         verticals: List[HalfEdge], stars: List[Tuple[Vertex, dict]],
+                         before: tuple) -> None:
+        """Undo add_diagonal: ring #1 (from e1) goes back to `face`."""
+        e2 = e1.twin
+        v1, v2 = e1.origin, e2.origin
+        he = e1
+        while True:
+            he.face = face
+            he = he.next
+            if he is e1:
+                break
+        face.outer, face.n_edges, face.n_horizontal, v1.incident, v2.incident = before
+        for v, star in reversed(stars):     # the first copy of a repeated vertex wins
+            _restore_star(v, star)
+
+        h1_prev, h2 = e1.prev, e1.next
+        h2_prev, h1 = e2.prev, e2.next
+        h1_prev.next, h1.prev = h1, h1_prev
+        h2_prev.next, h2.prev = h2, h2_prev
+
+        if verticals and verticals[0] is e1:
+            face.verticals.remove(e2)
+        for he in verticals:
+            if he is not e1:
+                face.verticals.add(he)
+
+    def _untriangulate(self, face: Face, ring: List[HalfEdge],
+                       faces: List[Face], before: tuple) -> None:
+        """Undo triangulate_face: the ring closes around `face` again."""
+        for f in faces:
+            he = f.outer
+            for _ in range(3):
+                he.origin.star.pop(f, None)
+                he = he.next
+        for a, b in zip(ring, ring[1:] + ring[:1]):
+            a.next, b.prev = b, a
+            a.face = face
+        face.outer, face.n_edges, face.n_horizontal, face.verticals, stars = before
+        for v, star in stars:
+            _restore_star(v, star)
+
+    def _unset_ftype(self, face: Face, ftype: Optional[FaceType]) -> None:
+        face.ftype = ftype
+
+    def validate(self) -> None:
+        """
+        Integrity check in one pass over the half-edges: twin / next / prev /
+        face links, face outer pointers and ring counters, vertex stars.
+        Raise RuntimeError on the first problem.  Ring walks do not check
+        for broken rings themselves, so run this in tests and debug runs
+        (e.g. slab_partition(..., validate=True)).
+        """
+        ring_len = {f: 0 for f in self.faces}
+        for i, he in enumerate(self.half_edges):
+            tw, nx, pv = he.twin, he.next, he.prev
+            if tw is None or tw is he or tw.twin is not he:
+                _broken(f"half-edge {i}: twin is not symmetric")
+            if nx is None or nx.prev is not he:
+                _broken(f"half-edge {i}: next.prev is not the edge")
+            if pv is None or pv.next is not he:
+                _broken(f"half-edge {i}: prev.next is not the edge")
+            if nx.origin is not tw.origin:
+                _broken(f"half-edge {i}: next does not start at its destination")
+            if he.face not in ring_len or nx.face is not he.face:
+                _broken(f"half-edge {i}: face differs from next.face")
+            ring_len[he.face] += 1
+
+        for j, (f, n) in enumerate(ring_len.items()):
+            if f.outer is None or f.outer.face is not f:
+                _broken(f"face {j}: outer edge lies on another face")
+            if f.n_edges != n:
+                _broken(f"face {j}: ring counter {f.n_edges} != {n} edges")
+
+        for k, v in enumerate(self.vertices):
+            for f, he in v.star.items():
+                if he.origin is not v or he.face is not f:
+                    _broken(f"vertex {k}: stale star entry")
+
+    # ---------- snapshots (see be_alg.dcel_io) ----------
+    def save(self, path) -> None:
+        """Write a flat binary snapshot; `DCEL.load` / `ArrayDCEL.load` read it."""
+        vid = {v: i for i, v in enumerate(self.vertices)}
+        eid = {e: i for i, e in enumerate(self.half_edges)}
+        fid = {f: i for i, f in enumerate(self.faces)}
+        types = list(FaceType)
+        hes, faces, verts = self.half_edges, self.faces, self.vertices
+
+        sections = {
+            "he_origin": array("q", [vid[e.origin] for e in hes]),
+            "he_twin": array("q", [eid[e.twin] for e in hes]),
+            "he_next": array("q", [eid[e.next] for e in hes]),
+            "he_prev": array("q", [eid[e.prev] for e in hes]),
+            "he_face": array("q", [fid[e.face] for e in hes]),
+            "f_outer": array("q", [eid[f.outer] for f in faces]),
+            "f_type": array("q", [-1 if f.ftype is None else types.index(f.ftype)
+                                  for f in faces]),
+            "f_edges": array("q", [f.n_edges for f in faces]),
+            "f_vertical": array("q", [f.n_vertical for f in faces]),
+            "f_horizontal": array("q", [f.n_horizontal for f in faces]),
+            "v_incident": array("q", [-1 if v.incident is None else eid[v.incident]
+                                      for v in verts]),
+            "vfx": array("d", [v.fx for v in verts]),
+            "vfy": array("d", [v.fy for v in verts]),
+        }
+        sections["star_off"], sections["star_face"], sections["star_edge"] = \
+            dcel_io.encode_stars([(fid[f], eid[e]) for f, e in v.star.items()]
+                                 for v in verts)
+        sections["coord_off"], blob = dcel_io.encode_coordinates((v.x, v.y) for v in verts)
+        outer = -1 if self.outer_face is None else fid[self.outer_face]
+        dcel_io.write_snapshot(path, self.number.name, outer, sections, blob)
+
+    @classmethod
+    def load(cls, path, number: Optional[str] = None) -> "DCEL":
+        """
+        Rebuild a DCEL saved with `save`.  number defaults to the backend
+        it was saved with.  The object graph is built in a few flat passes;
+        `ArrayDCEL.load` skips even those.
+        """
+        saved, outer, sec, blob = dcel_io.read_snapshot(path)
+        xs, ys = dcel_io.decode_coordinates(sec["coord_off"], blob, Fraction)
+        return cls._from_sections(xs, ys, number or saved, outer, sec)
+
+    @classmethod
+    def _from_sections(cls, xs: list, ys: list, number: str, outer: int,
+                       sec: Dict[str, array]) -> "DCEL":
+        """Object graph of the dcel_io link arrays (see `load`)."""
+        dcel = cls(list(zip(xs, ys)), number)
+        verts = dcel.vertices
+        hes = dcel.half_edges = [HalfEdge() for _ in sec["he_origin"]]
+        faces = dcel.faces = [Face() for _ in sec["f_outer"]]
+        types = list(FaceType)
+
+        for e, o, t, n, p, f in zip(hes, sec["he_origin"], sec["he_twin"],
+                                    sec["he_next"], sec["he_prev"], sec["he_face"]):
+            e.origin, e.twin, e.next, e.prev, e.face = verts[o], hes[t], hes[n], hes[p], faces[f]
+
+        verticals: List[List[HalfEdge]] = [[] for _ in faces]
+        for e, f in zip(hes, sec["he_face"]):
+            if _is_vertical(e):
+                verticals[f].append(e)
+        for f, e0, t, n_e, n_h, vs in zip(faces, sec["f_outer"], sec["f_type"],
+                                          sec["f_edges"], sec["f_horizontal"], verticals):
+            f.outer = hes[e0]
+            f.ftype = None if t < 0 else types[t]
+            f.n_edges, f.n_horizontal = n_e, n_h
+            f.verticals = VerticalEdgeIndex(vs)
+
+        off, s_face, s_edge = sec["star_off"], sec["star_face"], sec["star_edge"]
+        for k, (v, inc) in enumerate(zip(verts, sec["v_incident"])):
+            v.incident = None if inc < 0 else hes[inc]
+            v.star = {faces[s_face[j]]: hes[s_edge[j]] for j in range(off[k], off[k + 1])}
+        dcel.outer_face = None if outer < 0 else faces[outer]
+        return dcel
+
+    def faces_around(self, v: Vertex) -> List[Face]:
+        """Faces incident to v (including the outer face)."""
+        return list(v.star)
+
+    def common_face(self, v1: Vertex, v2: Vertex,
+                    exclude: Optional[Face] = None) -> Optional[Face]:
+        """A face incident to both v1 and v2 other than `exclude`, or None."""
+        star1 = v1.star
+        for f in v2.star:
+            if f is not exclude and f in star1:
+                return f
+        return None
+
+
+def _in_corner(v, b, a, t) -> bool:
+    """
+    Does the direction v → t point into the face corner at v between
+    the edges v → b (out) and a → v (in)?  The face lies left of both,
+    so the corner runs counter-clockwise from v→b to v→a; with a == b
+    (a dangling edge) it is everything but that edge.
+
+    Decided on the float images when the cross products it needs clear
+    their rounding error (coordinates ≤ m are off by 2⁻⁵³·m, so a cross
+    product by well under 64·2⁻⁵³·m²), exactly otherwise.
+    """
+    vx, vy = v.fx, v.fy
+    ux, uy = b.fx - vx, b.fy - vy
+    wx, wy = a.fx - vx, a.fy - vy
+    dx, dy = t.fx - vx, t.fy - vy
+    m = max(abs(vx), abs(vy), abs(b.fx), abs(b.fy),
+            abs(a.fx), abs(a.fy), abs(t.fx), abs(t.fy))
+    tol = 7.2e-15 * m * m
+    u_d, d_w = ux * dy - uy * dx, dx * wy - dy * wx
+    if abs(u_d) > tol and abs(d_w) > tol:
+        if (u_d > 0) == (d_w > 0):
+            return u_d > 0                  # every corner shape agrees
+        if abs(ux * wy - uy * wx) > tol:
+            return _corner_contains(ux, uy, wx, wy, dx, dy)
+    return _corner_contains(b.x - v.x, b.y - v.y, a.x - v.x, a.y - v.y,
+                            t.x - v.x, t.y - v.y)
+
+
+def _corner_contains(ux, uy, wx, wy, dx, dy) -> bool:
+    """
+    `_in_corner` on the vectors u = v→b, w = v→a, d = v→t.  Compares
+    against a zero of their own type: FieldNumber does not mix with int.
+    """
+    zero = ux - ux
+    u_d, d_w = ux * dy - uy * dx, dx * wy - dy * wx
+    turn = ux * wy - uy * wx
+    if turn > zero:                                      # convex corner
+        return u_d > zero and d_w > zero
+    if turn == zero and ux * wx + uy * wy > zero:        # a == b
+        return u_d != zero or ux * dx + uy * dy < zero
+    return not (u_d <= zero and d_w <= zero)             # reflex / straight
+
+
+def _broken(msg: str) -> None:
+    raise RuntimeError(f"broken DCEL: {msg}")
+
+
+def _restore_star(v: Vertex, star: dict) -> None:
+    """Put back a saved star in place (same dict, same insertion order)."""
+    v.star.clear()
+    v.star.update(star)
@@ -0,0 +1,118 @@
+# ------------------------------------------------------------
+#  src/be_alg/dcel_io.py
+#  flat binary snapshots of a DCEL (DCEL.save / DCEL.load)
+# ------------------------------------------------------------
+"""
+File layout (little-endian):
+
+    header   magic, number backend name, item count of every section,
+             outer face index, coordinate blob length
+    sections the int64 / float64 arrays of SECTIONS, in that order
+    blob     numerator / denominator bytes of every coordinate
+
+Topology is stored the way ArrayDCEL keeps it: one index array per
+link, NIL = -1.  Coordinates are exact: vertex v owns the four signed
+integers x_num, x_den, y_num, y_den at blob[coord_off[4v + k] :
+coord_off[4v + k + 1]].  The vertex stars are stored with their
+insertion order, so a loaded DCEL continues exactly like the saved one.
+
+Every array is read straight from the file into its `array` in one
+call, so loading an ArrayDCEL never walks the mesh.  The arrays are
+copied rather than memory-mapped: ArrayDCEL grows them in place.
+"""
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from fractions import Fraction
+from typing import Dict, Iterable, List, Tuple
+
+from be_alg.number_backend import as_fraction
+
+MAGIC = b"BEDCEL\x01\x00"
+
+SECTIONS: Tuple[Tuple[str, str], ...] = (
+    ("he_origin", "q"), ("he_twin", "q"), ("he_next", "q"),
+    ("he_prev", "q"), ("he_face", "q"),
+    ("f_outer", "q"), ("f_type", "q"),
+    ("f_edges", "q"), ("f_vertical", "q"), ("f_horizontal", "q"),
+    ("v_incident", "q"), ("vfx", "d"), ("vfy", "d"),
+    ("star_off", "q"), ("star_face", "q"), ("star_edge", "q"),
+    ("coord_off", "q"),
+)
+_HEADER = struct.Struct("<8s16s" + "q" * (len(SECTIONS) + 2))
+
+
+def write_snapshot(path, number: str, outer: int,
+                   sections: Dict[str, array], blob: bytes) -> None:
+    counts = [len(sections[name]) for name, _ in SECTIONS]
+    with open(path, "wb") as fh:
+        fh.write(_HEADER.pack(MAGIC, number.encode(), *counts, outer, len(blob)))
+        for name, code in SECTIONS:
+            arr = sections[name]
+            if arr.typecode != code:
+                arr = array(code, arr)
+            if sys.byteorder == "big":
+                arr = array(code, arr)
+                arr.byteswap()
+            arr.tofile(fh)
+        fh.write(blob)
+
+
+def read_snapshot(path) -> Tuple[str, int, Dict[str, array], bytes]:
+    """Return (number backend, outer face, sections, coordinate blob)."""
+    with open(path, "rb") as fh:
+        head = fh.read(_HEADER.size)
+        if len(head) < _HEADER.size or head[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path}: not a DCEL snapshot")
+        _, number, *rest = _HEADER.unpack(head)
+        counts, outer, blob_len = rest[:len(SECTIONS)], rest[-2], rest[-1]
+
+        sections: Dict[str, array] = {}
+        try:
+            for (name, code), n in zip(SECTIONS, counts):
+                arr = array(code)
+                arr.fromfile(fh, n)
+                if sys.byteorder == "big":
+                    arr.byteswap()
+                sections[name] = arr
+        except EOFError:
+            raise ValueError(f"{path}: truncated DCEL snapshot") from None
+        blob = fh.read(blob_len)
+    if len(blob) != blob_len:
+        raise ValueError(f"{path}: truncated DCEL snapshot")
+    return number.rstrip(b"\0").decode(), outer, sections, blob
+
+
+# ---------- coordinates ----------
+def encode_coordinates(points: Iterable[Tuple[object, object]]) -> Tuple[array, bytes]:
+    offsets, parts, pos = array("q", [0]), [], 0
+    for x, y in points:
+        fx, fy = as_fraction(x), as_fraction(y)
+        for n in (fx.numerator, fx.denominator, fy.numerator, fy.denominator):
+            b = n.to_bytes((n.bit_length() + 8) // 8, "little", signed=True)
+            parts.append(b)
+            pos += len(b)
+            offsets.append(pos)
+    return offsets, b"".join(parts)
+
+
+def decode_coordinates(offsets: array, blob, convert) -> Tuple[List, List]:
+    """Exact x / y lists, each value passed through the backend's convert."""
+    ints = [int.from_bytes(blob[offsets[k]:offsets[k + 1]], "little", signed=True)
+            for k in range(len(offsets) - 1)]
+    xs = [convert(Fraction(n, d)) for n, d in zip(ints[0::4], ints[1::4])]
+    ys = [convert(Fraction(n, d)) for n, d in zip(ints[2::4], ints[3::4])]
+    return xs, ys
+
+
+# ---------- vertex stars ----------
+def encode_stars(stars: Iterable[Iterable[Tuple[int, int]]]) -> Tuple[array, array, array]:
+    off, faces, edges = array("q", [0]), array("q"), array("q")
+    for star in stars:
+        for f, e in star:
+            faces.append(f)
+            edges.append(e)
+        off.append(len(faces))
+    return off, faces, edges
@@ -0,0 +1,103 @@
+# ------------------------------------------------------------
+#  src/be_alg/export.py
+#  finished DCEL  →  Cgshop2025Solution
+# ------------------------------------------------------------
+"""
+The first `num_points` vertices of a DCEL built from an instance are the
+instance points, in instance order (DCEL keeps the input order and
+split_edge only appends).  Everything after them is a Steiner point,
+so vertex index == solution index and no lookup table is needed.
+
+Each undirected edge is kept once: the half-edge whose origin index is
+smaller than its destination's.  The link arrays go through numpy; only
+the Steiner coordinates are formatted per value, in one comprehension.
+
+`verify_dcel` scores a DCEL without the solution round trip: numerators,
+denominators and edges go straight into the CGAL verifier.
+"""
+from __future__ import annotations
+
+from fractions import Fraction
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from be_alg.number_backend import as_fraction
+
+
+def export_arrays(dcel, num_points: int
+                  ) -> Tuple[List[Union[int, str]], List[Union[int, str]], List[List[int]]]:
+    """(steiner_points_x, steiner_points_y, edges) in solution format."""
+    xs, ys, edges = _steiner_and_edges(dcel, num_points)
+    exact = dcel.number.name == "fraction"
+    return format_rationals(xs, exact), format_rationals(ys, exact), edges
+
+
+def _steiner_and_edges(dcel, num_points: int) -> Tuple[list, list, List[List[int]]]:
+    """Exact Steiner coordinates and the edges (each once) of a DCEL."""
+    origin, dest = edge_endpoints(dcel)
+    if hasattr(dcel, "he_origin"):                       # ArrayDCEL
+        xs, ys = dcel.vx[num_points:], dcel.vy[num_points:]
+    else:
+        steiner = dcel.vertices[num_points:]
+        xs, ys = [v.x for v in steiner], [v.y for v in steiner]
+    return xs, ys, np.stack((origin, dest), axis=1).tolist()
+
+
+def edge_endpoints(dcel) -> Tuple[np.ndarray, np.ndarray]:
+    """Vertex indices (origin, dest) of every edge once: the half-edge with origin < dest."""
+    if hasattr(dcel, "he_origin"):                       # ArrayDCEL
+        origin = np.frombuffer(dcel.he_origin, dtype=np.int64)
+        dest = origin[np.frombuffer(dcel.he_twin, dtype=np.int64)]
+    else:
+        vid = {v: i for i, v in enumerate(dcel.vertices)}
+        origin = np.fromiter((vid[e.origin] for e in dcel.half_edges),
+                             dtype=np.int64, count=len(dcel.half_edges))
+        dest = np.fromiter((vid[e.twin.origin] for e in dcel.half_edges),
+                           dtype=np.int64, count=len(dcel.half_edges))
+    keep = origin < dest
+    return origin[keep], dest[keep]
+
+
+def format_rationals(values, exact_fractions: bool = False) -> List[Union[int, str]]:
+    """int for whole numbers, "p/q" otherwise.  exact_fractions skips as_fraction."""
+    qs = values if exact_fractions else map(as_fraction, values)
+    return [q.numerator if q.denominator == 1 else f"{q.numerator}/{q.denominator}"
+            for q in qs]
+
+
+def dcel_to_solution(dcel, instance_uid: str, num_points: int,
+                     meta: Optional[dict] = None, validate: bool = False):
+    """
+    Cgshop2025Solution of a finished DCEL.  The fields are valid by
+    construction, so pydantic validation (a Python loop over every edge)
+    is skipped unless validate=True.
+    """
+    from cgshop2025_pyutils.data_schemas import Cgshop2025Solution
+
+    sx, sy, edges = export_arrays(dcel, num_points)
+    fields = dict(instance_uid=instance_uid, steiner_points_x=sx,
+                  steiner_points_y=sy, edges=edges, meta=meta or {})
+    if validate:
+        return Cgshop2025Solution(**fields)
+    return Cgshop2025Solution.model_construct(**fields)
+
+
+def verify_dcel(dcel, instance, strict: bool = False):
+    """
+    cgshop2025_pyutils.verify of the solution dcel_to_solution would
+    write, fed from memory: exact numerator / denominator pairs and the
+    edge list go to VerificationGeometryHelper in bulk, with no JSON and
+    no number strings.  For quality checks in development loops.
+    """
+    from cgshop2025_pyutils.verifier import verify_rational
+
+    xs, ys, edges = _steiner_and_edges(dcel, instance.num_points)
+    if dcel.number.name != "fraction":
+        xs, ys = map(as_fraction, xs), map(as_fraction, ys)
+    qx = [Fraction(x) for x in instance.points_x] + list(xs)
+    qy = [Fraction(y) for y in instance.points_y] + list(ys)
+    return verify_rational(instance,
+                           [q.numerator for q in qx], [q.denominator for q in qx],
+                           [q.numerator for q in qy], [q.denominator for q in qy],
+                           edges, strict=strict)
@@ -0,0 +1,93 @@
+# ------------------------------------------------------------
+#  src/be_alg/face_index.py
+#  per-face index of vertical half-edges (horizontal ray shooting)
+# ------------------------------------------------------------
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterator, Optional
+
+from be_alg.number_backend import approx
+from be_alg.predicates import key_x, key_y
+from be_alg.treap import Node, Treap
+
+if TYPE_CHECKING:
+    from be_alg.dcel import HalfEdge
+
+
+class VerticalEdgeIndex(Treap):
+    """
+    The vertical half-edges of one face as an interval tree over y: a
+    treap (be_alg.treap) ordered by (y_low, x) whose nodes also keep the
+    largest y_high of their subtree.  add / remove take expected
+    O(log n).  A ray query visits only subtrees that can hold an edge
+    spanning its height y0, so it costs O(log n) plus O(log n) per edge
+    of the face that spans y0 – however many x-groups miss y0.  (A face
+    of the slab stages spans any height with at most two edges.)
+    Keys are filtered `(float, exact)` pairs (see be_alg.predicates),
+    so most comparisons never touch the exact numbers.
+    """
+    __slots__ = ()
+    key = staticmethod(lambda he: (_y_low(he), key_x(he.origin)))
+    aggregate = staticmethod(lambda he: _y_high(he))
+    fixed_keys = True                   # edges leave before their endpoints move
+
+    def _node(self, he: HalfEdge) -> Node:
+        lo, hi = key_y(he.origin), key_y(he.twin.origin)
+        if hi < lo:
+            lo, hi = hi, lo
+        return Node(he, (lo, key_x(he.origin)), hi)
+
+    def add(self, he: HalfEdge) -> None:
+        self.insert(he)
+
+    def remove(self, he: HalfEdge) -> None:
+        """Remove `he`; must run before its endpoints change."""
+        super().remove(he)
+
+    def first_hit_right(self, x0, y0) -> Optional[HalfEdge]:
+        """
+        Closest vertical half-edge with x > x0 whose y-range contains y0
+        (endpoints included), or None.
+        """
+        kx0 = (approx(x0), x0)
+        best = best_key = None
+        for he, kx, ky in self._spanning((approx(y0), y0)):
+            if kx > kx0 and (best is None or kx < best_key[0]
+                             or (kx == best_key[0] and ky > best_key[1])):
+                best, best_key = he, (kx, ky)
+        return best
+
+    def first_hit_left(self, x0, y0) -> Optional[HalfEdge]:
+        """
+        Closest vertical half-edge with x < x0 whose y-range contains y0
+        (endpoints included), or None.
+        """
+        kx0 = (approx(x0), x0)
+        best = best_key = None
+        for he, kx, ky in self._spanning((approx(y0), y0)):
+            if kx < kx0 and (best is None or kx > best_key[0]
+                             or (kx == best_key[0] and ky > best_key[1])):
+                best, best_key = he, (kx, ky)
+        return best
+
+    def _spanning(self, ky0) -> Iterator[tuple]:
+        """(edge, x key, y_low key) of every edge with y_low <= y0 <= y_high."""
+        stack = [self.root]
+        while stack:
+            node: Node = stack.pop()
+            if node is None or node.top < ky0:
+                continue                    # nothing below reaches up to y0
+            stack.append(node.left)
+            lo, kx = node.key
+            if lo <= ky0:                   # the right subtree starts at y_low >= lo
+                stack.append(node.right)
+                if ky0 <= node.own:
+                    yield node.item, kx, lo
+
+
+def _y_low(he):
+    return min(key_y(he.origin), key_y(he.twin.origin))
+
+
+def _y_high(he):
+    return max(key_y(he.origin), key_y(he.twin.origin))
@@ -4,4 +4,3 @@ class FaceType(Enum):
     RIGHT_TRI = auto()
     OBTUSE_TRI = auto()
     OPEN_SLAB = auto()
-
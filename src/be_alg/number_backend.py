@@ -0,0 +1,117 @@
+# ------------------------------------------------------------
+#  src/be_alg/number_backend.py
+#  exact number types for DCEL coordinates
+# ------------------------------------------------------------
+"""
+Selectable exact number type for DCEL coordinates.
+
+    "fraction"  fractions.Fraction            (default, pure Python)
+    "gmpy2"     gmpy2.mpq                     (GMP rationals, optional)
+    "field"     cgshop2025_pyutils FieldNumber (CGAL exact field, C++)
+
+All three support + - * / and the comparison operators, which is all the
+slab code needs.  FieldNumber is not hashable, so the stages never put
+coordinates into sets or dict keys.  FieldNumber also only does
+arithmetic with FieldNumbers, so convert every input before mixing.
+"""
+from __future__ import annotations
+
+import math
+from fractions import Fraction
+from typing import Any, Callable, Dict
+
+
+class NumberBackend:
+    __slots__ = ("name", "convert")
+
+    def __init__(self, name: str, convert: Callable[[Any], Any]):
+        self.name = name
+        self.convert = convert      # int | Fraction | "p/q" → backend number
+
+    def __repr__(self):
+        return f"NumberBackend({self.name!r})"
+
+
+def _fraction_backend() -> NumberBackend:
+    return NumberBackend("fraction", Fraction)
+
+
+def _gmpy2_backend() -> NumberBackend:
+    try:
+        import gmpy2
+    except ImportError as e:
+        msg = "The 'gmpy2' number backend requires the gmpy2 package."
+        raise ImportError(msg) from e
+    return NumberBackend("gmpy2", gmpy2.mpq)
+
+
+def _field_backend() -> NumberBackend:
+    from cgshop2025_pyutils.geometry import FieldNumber
+
+    def convert(value):
+        if isinstance(value, FieldNumber):
+            return value
+        if isinstance(value, int):
+            return FieldNumber(value)
+        q = Fraction(value)
+        return FieldNumber(f"{q.numerator}/{q.denominator}")
+
+    return NumberBackend("field", convert)
+
+
+_FACTORIES: Dict[str, Callable[[], NumberBackend]] = {
+    "fraction": _fraction_backend,
+    "gmpy2": _gmpy2_backend,
+    "field": _field_backend,
+}
+_CACHE: Dict[str, NumberBackend] = {}
+
+
+def get_number_backend(name: str = "fraction") -> NumberBackend:
+    """Return the backend registered as `name` (imports it on first use)."""
+    backend = _CACHE.get(name)
+    if backend is None:
+        if name not in _FACTORIES:
+            msg = f"Unknown number backend '{name}' (choose from {sorted(_FACTORIES)})."
+            raise ValueError(msg)
+        backend = _CACHE[name] = _FACTORIES[name]()
+    return backend
+
+
+def as_fraction(value) -> Fraction:
+    """Exact Fraction for a coordinate of any backend."""
+    if isinstance(value, (Fraction, int)):
+        return Fraction(value)
+    if hasattr(value, "denominator"):              # gmpy2.mpq
+        return Fraction(int(value.numerator), int(value.denominator))
+    return Fraction(value.exact())                 # FieldNumber
+
+
+def approx(value) -> float:
+    """
+    Float approximation of an exact coordinate that is *monotone*:
+    a < b  ⇒  approx(a) <= approx(b).  Hence approx(a) < approx(b)
+    proves a < b, and only equal approximations need an exact look.
+    float() of Fraction / int / mpq rounds correctly, which is monotone.
+    FieldNumber's own float() is an interval midpoint, which need not be,
+    so it is only the starting guess for the largest float <= value.
+    """
+    try:
+        f = float(value)
+    except OverflowError:
+        return math.inf if value > 0 else -math.inf
+    if hasattr(value, "denominator") or not math.isfinite(f):
+        return f
+    return _float_below(value, f)
+
+
+def _float_below(value, f: float) -> float:
+    """Largest float <= value, from a guess f a few ulps off (FieldNumber)."""
+    kind = type(value)
+    while kind(f) > value:
+        f = math.nextafter(f, -math.inf)
+    while True:
+        up = math.nextafter(f, math.inf)
+        if kind(up) > value:
+            return f
+        f = up
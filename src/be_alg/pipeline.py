@@ -0,0 +1,159 @@
+# ------------------------------------------------------------
+#  src/be_alg/pipeline.py
+#  Bern–Eppstein driver: instance → DCEL → slab stages → solution
+# ------------------------------------------------------------
+"""
+    build       DCEL.from_instance  (boundary + additional_constraints)
+    vertical    add_vertical_cuts
+    horizontal  add_horizontal_cuts
+    refine      refine_faces  (classify + split OPEN_SLAB)
+    triangulate triangulate_faces  (be_alg.triangulation)
+
+With a checkpoint directory every stage leaves
+`<uid>.<number>.<hash>.<stage>.dcel` (DCEL.save) behind, keyed by the
+number backend and a hash of the instance content, so neither another
+backend nor an edited instance under the same uid picks them up.  A
+later run resumes after the last checkpoint it finds, or reruns from
+`from_stage` on top of the checkpoint of the stage before it – tuning
+"refine" on a big instance does not redo the cuts.  All stage options
+(sweep / filtered / workers) and both DCEL layouts give identical
+results, so checkpoints are not keyed by them.
+
+    python -m be_alg.pipeline NAME --db instances.zip --checkpoints ckpt/
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from be_alg.dcel import DCEL
+from be_alg.slab_partition import (
+    SlabStats,
+    add_horizontal_cuts,
+    add_vertical_cuts,
+    refine_faces,
+    run_stage,
+)
+from be_alg.triangulation import triangulate_faces
+
+STAGES: Tuple[str, ...] = ("build", "vertical", "horizontal", "refine", "triangulate")
+
+
+def checkpoint_key(instance, number: str = "fraction") -> str:
+    """`<uid>.<number>.<hash>` – the hash covers points, boundary and constraints."""
+    content = json.dumps([list(instance.points_x), list(instance.points_y),
+                          list(instance.region_boundary),
+                          [list(c) for c in instance.additional_constraints]], default=str)
+    digest = hashlib.sha256(content.encode()).hexdigest()[:16]
+    return f"{instance.instance_uid}.{number}.{digest}"
+
+
+def checkpoint_path(checkpoint_dir, key: str, stage: str) -> Path:
+    return Path(checkpoint_dir) / f"{key}.{stage}.dcel"
+
+
+def run_stages(instance, checkpoint_dir=None, from_stage: Optional[str] = None,
+               dcel_cls=DCEL, number: str = "fraction", sweep: bool = True,
+               filtered: bool = False, workers: Optional[int] = None,
+               validate: bool = False, stats: Optional[SlabStats] = None):
+    """
+    Run the slab stages on `instance` (anything with the Cgshop2025Instance
+    fields) and return the finished DCEL.  See the module docstring for
+    checkpoints.  validate=True runs dcel.validate() after every stage;
+    `stats` collects the stages that actually run.
+    """
+    key = checkpoint_key(instance, number) if checkpoint_dir is not None else None
+    stages: Dict[str, Tuple[Callable, dict]] = {
+        "vertical": (add_vertical_cuts, dict(sweep=sweep, filtered=filtered)),
+        "horizontal": (add_horizontal_cuts, {}),
+        "refine": (refine_faces, dict(filtered=filtered, workers=workers)),
+        "triangulate": (triangulate_faces, {}),
+    }
+
+    if from_stage is not None:
+        if from_stage not in STAGES:
+            raise ValueError(f"Unknown stage '{from_stage}' (choose from {STAGES}).")
+        start = STAGES.index(from_stage)
+        if start > 0 and checkpoint_dir is None:
+            raise ValueError(f"from_stage='{from_stage}' needs a checkpoint_dir.")
+    else:
+        start = 0
+        if checkpoint_dir is not None:
+            for k, stage in enumerate(STAGES):
+                if checkpoint_path(checkpoint_dir, key, stage).exists():
+                    start = k + 1
+
+    dcel = None
+    if start > 0:
+        path = checkpoint_path(checkpoint_dir, key, STAGES[start - 1])
+        if not path.exists():
+            raise FileNotFoundError(f"missing checkpoint '{path}'")
+        dcel = dcel_cls.load(path)
+
+    for stage in STAGES[start:]:
+        if stage == "build":
+            dcel = dcel_cls.from_instance(instance, number=number)
+        else:
+            stage_fn, kwargs = stages[stage]
+            run_stage(dcel, stage, stage_fn, stats, **kwargs)
+        if validate:
+            dcel.validate()
+        if checkpoint_dir is not None:
+            Path(checkpoint_dir).mkdir(parents=True, exist_ok=True)
+            dcel.save(checkpoint_path(checkpoint_dir, key, stage))
+    return dcel
+
+
+def run_pipeline(instance, database=None, **options):
+    """
+    instance – a Cgshop2025Instance, or its name in `database`
+               (an InstanceDatabase or a path to one).
+    options  – see `run_stages`.
+    Returns the Cgshop2025Solution of the slab partition.
+    """
+    from be_alg.export import dcel_to_solution
+
+    if isinstance(instance, str):
+        if database is None:
+            raise ValueError("an instance name needs a database")
+        if isinstance(database, (str, Path)):
+            from cgshop2025_pyutils import InstanceDatabase
+            database = InstanceDatabase(database)
+        instance = database[instance]
+
+    dcel = run_stages(instance, **options)
+    return dcel_to_solution(dcel, instance.instance_uid, instance.num_points,
+                            meta={"algorithm": "bern-eppstein slab partition"})
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Bern–Eppstein slab partition of one CG:SHOP 2025 instance")
+    parser.add_argument("instance", help="instance name in --db")
+    parser.add_argument("--db", required=True, help="instance folder or zip")
+    parser.add_argument("--checkpoints", help="checkpoint directory")
+    parser.add_argument("--from-stage", choices=STAGES)
+    parser.add_argument("--workers", type=int, help="processes for the refine stage")
+    parser.add_argument("--out", help="solution json (default: <uid>.solution.json)")
+    parser.add_argument("--bit-sizes", action="store_true",
+                        help="report coordinate bit lengths after every stage")
+    args = parser.parse_args(argv)
+
+    stats = SlabStats(bit_sizes=True) if args.bit_sizes else None
+    solution = run_pipeline(args.instance, args.db, checkpoint_dir=args.checkpoints,
+                            from_stage=args.from_stage, workers=args.workers,
+                            stats=stats)
+    if stats is not None:
+        for stage, report in stats.bits.items():
+            print(f"{stage:>12}: max {report.max_bits} bits, worst vertex {report.worst}")
+    out = Path(args.out or f"{solution.instance_uid}.solution.json")
+    out.write_text(solution.model_dump_json())
+    print(f"{out}: {len(solution.steiner_points_x)} Steiner points, "
+          f"{len(solution.edges)} edges")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+# ------------------------------------------------------------
+#  src/be_alg/point_location.py
+#  (x, y) → face over the slabs of a finished slab partition
+# ------------------------------------------------------------
+"""
+Slab point location.  The distinct vertex x values cut the plane into
+slabs; inside a slab the non-vertical edges crossing it do not cross
+each other, so they are sorted bottom to top once and a query is two
+binary searches: the slab by x, then the edge just below (x, y).  The
+face above that edge – the face of its left → right half-edge – holds
+the point; below every edge it is the outer face.
+
+After slab_partition every edge already runs between two neighbouring
+x values, so the table has one entry per edge.  Any other DCEL works
+too, an edge is then listed in every slab it crosses.
+
+`locate` is exact.  `locate_many` answers a numpy batch on the float
+coordinates (vectorised binary search), so a point within rounding
+distance of an edge may get the face on the other side.  A point on an
+edge or a slab line gets one of the faces that touch it.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import List
+
+import numpy as np
+
+from be_alg.number_backend import approx
+
+
+class PointLocator:
+    """Build once from a DCEL or ArrayDCEL, then query; O(log n) per point."""
+
+    def __init__(self, dcel):
+        self.dcel = dcel
+        if hasattr(dcel, "he_origin"):                   # ArrayDCEL
+            tail = dcel.he_origin
+            head = [tail[t] for t in dcel.he_twin]
+            face = dcel.he_face
+            xs, ys, outer = dcel.vx, dcel.vy, dcel.outer
+        else:
+            vid = {v: i for i, v in enumerate(dcel.vertices)}
+            fid = {f: i for i, f in enumerate(dcel.faces)}
+            tail = [vid[e.origin] for e in dcel.half_edges]
+            head = [vid[e.twin.origin] for e in dcel.half_edges]
+            face = [fid[e.face] for e in dcel.half_edges]
+            xs = [v.x for v in dcel.vertices]
+            ys = [v.y for v in dcel.vertices]
+            outer = fid[dcel.outer_face]
+        self.outer = outer
+
+        # slab lines: distinct x, compared through filtered (float, exact) keys
+        kx = [(approx(x), x) for x in xs]
+        lines = []
+        for k in sorted(kx):
+            if not lines or k != lines[-1]:
+                lines.append(k)
+        self.lines = [x for _, x in lines]
+        rank = [bisect_right(lines, k) - 1 for k in kx]
+
+        # one entry per (slab, left → right half-edge crossing it)
+        entries = []
+        for e, (a, b) in enumerate(zip(tail, head)):
+            ra, rb = rank[a], rank[b]
+            if ra >= rb:
+                continue                    # vertical, or the right → left twin
+            if rb - ra == 1:
+                entries.append((ra, ys[a] + ys[b], e))
+                continue
+            slope = (ys[b] - ys[a]) / (xs[b] - xs[a])
+            for r in range(ra, rb):
+                y0 = ys[a] + (self.lines[r] - xs[a]) * slope
+                y1 = ys[a] + (self.lines[r + 1] - xs[a]) * slope
+                entries.append((r, y0 + y1, e))
+        entries.sort(key=lambda t: (t[0], approx(t[1]), t[1]))
+
+        n_slabs = max(len(self.lines) - 1, 0)
+        counts = np.bincount(np.fromiter((r for r, _, _ in entries), dtype=np.int64,
+                                         count=len(entries)), minlength=n_slabs)
+        self.slab_start = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        self.tail: List[int] = [tail[e] for _, _, e in entries]
+        self.head: List[int] = [head[e] for _, _, e in entries]
+        self.face = np.fromiter((face[e] for _, _, e in entries), dtype=np.int64,
+                                count=len(entries))
+        self._xs, self._ys = xs, ys
+
+        # float images for locate_many
+        fa_x = np.array([approx(xs[v]) for v in self.tail], dtype=np.float64)
+        fa_y = np.array([approx(ys[v]) for v in self.tail], dtype=np.float64)
+        fb_x = np.array([approx(xs[v]) for v in self.head], dtype=np.float64)
+        fb_y = np.array([approx(ys[v]) for v in self.head], dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope_f = np.where(fb_x > fa_x, (fb_y - fa_y) / (fb_x - fa_x), 0.0)
+        self._fa_x, self._fa_y, self._slope = fa_x, fa_y, slope_f
+        self._lines_f = np.array([fx for fx, _ in lines], dtype=np.float64)
+
+    def __len__(self) -> int:
+        """Number of (slab, edge) entries."""
+        return len(self.face)
+
+    # ---------- exact, one point ----------
+    def locate_index(self, x, y) -> int:
+        """Index (into dcel.faces) of the face containing (x, y)."""
+        s = bisect_right(self.lines, x) - 1
+        if s < 0 or s >= len(self.lines) - 1:
+            return self.outer
+        xs, ys = self._xs, self._ys
+
+        def y_at(i):
+            a, b = self.tail[i], self.head[i]
+            return ys[a] + (x - xs[a]) * (ys[b] - ys[a]) / (xs[b] - xs[a])
+
+        lo, hi = int(self.slab_start[s]), int(self.slab_start[s + 1])
+        start = lo
+        while lo < hi:                                   # first edge above y
+            mid = (lo + hi) // 2
+            if y_at(mid) <= y:
+                lo = mid + 1
+            else:
+                hi = mid
+        return self.outer if lo == start else int(self.face[lo - 1])
+
+    def locate(self, x, y):
+        """The Face containing (x, y)."""
+        return self.dcel.faces[self.locate_index(x, y)]
+
+    # ---------- floats, many points ----------
+    def locate_many(self, qx, qy) -> np.ndarray:
+        """Face indices (into dcel.faces) for arrays of query coordinates."""
+        qx = np.asarray(qx, dtype=np.float64)
+        qy = np.asarray(qy, dtype=np.float64)
+        slab = np.searchsorted(self._lines_f, qx, side="right") - 1
+        inside = (slab >= 0) & (slab < len(self._lines_f) - 1)
+        slab = np.where(inside, slab, 0)
+
+        start = self.slab_start[slab]
+        lo = start.copy()
+        hi = np.where(inside, self.slab_start[np.minimum(slab + 1, len(self.slab_start) - 1)],
+                      start)
+        active = lo < hi
+        while active.any():
+            idx = np.nonzero(active)[0]
+            mid = (lo[idx] + hi[idx]) // 2
+            y_mid = self._fa_y[mid] + (qx[idx] - self._fa_x[mid]) * self._slope[mid]
+            up = y_mid <= qy[idx]
+            lo[idx] = np.where(up, mid + 1, lo[idx])
+            hi[idx] = np.where(up, hi[idx], mid)
+            active[idx] = lo[idx] < hi[idx]
+
+        below = np.maximum(lo - 1, 0)
+        found = inside & (lo > start)
+        out = np.full(qx.shape, self.outer, dtype=np.int64)
+        if len(self.face):
+            out[found] = self.face[below[found]]
+        return out
@@ -0,0 +1,90 @@
+# ------------------------------------------------------------
+#  src/be_alg/predicates.py
+#  exact and float-filtered predicates for the slab stages
+# ------------------------------------------------------------
+"""
+Every vertex caches `fx`, `fy` = number_backend.approx(x / y), a
+monotone float image of its exact coordinate.  A filtered predicate
+decides on those floats whenever they differ.  Equal floats are the
+only ambiguous case, and there it falls back to the exact numbers.
+The answers are therefore always the exact ones.
+
+`(fx, x)` tuples compare the same way as the exact values: Python
+compares the floats first and looks at `x` only on a tie.  The
+`key_x` / `key_y` helpers use this for filtered sorting and bisecting.
+"""
+from __future__ import annotations
+
+from operator import attrgetter, itemgetter
+from typing import Tuple
+
+from be_alg.number_backend import approx
+
+
+def is_vertical(e) -> bool:
+    return e.origin.x == e.twin.origin.x
+
+
+def is_horizontal(e) -> bool:
+    return e.origin.y == e.twin.origin.y
+
+
+def is_vertical_filtered(e) -> bool:
+    a, b = e.origin, e.twin.origin
+    return a.fx == b.fx and a.x == b.x
+
+
+def is_horizontal_filtered(e) -> bool:
+    a, b = e.origin, e.twin.origin
+    return a.fy == b.fy and a.y == b.y
+
+
+def compare(fa: float, a, fb: float, b) -> int:
+    """sign(a - b), decided on the floats unless they tie."""
+    if fa < fb:
+        return -1
+    if fa > fb:
+        return 1
+    return (a > b) - (a < b)
+
+
+def key_x(v) -> Tuple:
+    return v.fx, v.x
+
+
+def key_y(v) -> Tuple:
+    return v.fy, v.y
+
+
+class Predicates:
+    """
+    The predicate set one slab stage runs with.
+
+        is_vertical(e), is_horizontal(e)
+        key_x(v), key_y(v)   – sort / compare keys of a vertex coordinate
+        key(value)           – the same kind of key for a bare number
+        value(k)             – the exact number behind a key
+    """
+    __slots__ = ("is_vertical", "is_horizontal", "key_x", "key_y", "key", "value")
+
+    def __init__(self, is_vertical, is_horizontal, key_x, key_y, key, value):
+        self.is_vertical = is_vertical
+        self.is_horizontal = is_horizontal
+        self.key_x = key_x
+        self.key_y = key_y
+        self.key = key
+        self.value = value
+
+
+def _identity(v):
+    return v
+
+
+EXACT = Predicates(is_vertical, is_horizontal,
+                   attrgetter("x"), attrgetter("y"), _identity, _identity)
+FILTERED = Predicates(is_vertical_filtered, is_horizontal_filtered,
+                      key_x, key_y, lambda v: (approx(v), v), itemgetter(1))
+
+
+def predicates(filtered: bool) -> Predicates:
+    return FILTERED if filtered else EXACT
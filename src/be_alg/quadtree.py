@@ -0,0 +1,527 @@
+# ------------------------------------------------------------
+#  src/be_alg/quadtree.py
+#  balanced-quadtree partition  (Bern–Eppstein–Gilbert style)
+# ------------------------------------------------------------
+"""
+A second engine next to slab_partition for point sets whose region is
+their convex hull (PointSetGenerator instances).  Same output: a DCEL
+whose inner faces carry a FaceType.
+
+    1. build    split the root square (side 2^k, on the integer grid)
+                until no leaf holds more than one input point off its
+                corners.
+    2. balance  split leaves until side neighbours differ by at most one
+                level, so a leaf side holds at most one hanging vertex.
+    3. warp     a leaf's point p pulls a corner c of its leaf onto
+                itself (the BEG warping step), nearest corner first.
+                Every leaf whose ring holds c is then triangulated with
+                p in place of c – by diagonals, or else by a fan from its
+                centre – and c is warped only if all those triangles are
+                non-obtuse.  The leaves of points that found no corner
+                are split WARP_ROUNDS times, rebalanced and warped again.
+       cells    a leaf without hanging vertices or such a point stays a
+                square (RECTANGLE); otherwise it is fanned from its point
+                if that lies inside, else from its centre (right triangles
+                when only hanging vertices split its sides).
+    4. clip     leaves that are not inside the hull are cut down to
+                it; the hull edges are split where cell edges meet them.
+    5. link     DCEL.from_edges, then classify every inner face.
+
+Trade-off in step 1: splitting until every point is a corner of its
+leaves gives right triangles only, but a point reaches a corner only at
+the depth where its coordinates become multiples of the cell side – up
+to log2 R levels for every point, so 90–370 times the faces of
+slab_partition.  Stopping at one point per leaf keeps the depth at
+log2(R / closest pair); the triangles fanned from a point get exact
+types and are often obtuse.  Warping removes the fan where it can, but
+a point far off the diagonals through the corners of its leaf, or next
+to another point, keeps its fan.  One round of splitting brings
+obtuse triangles from about 31 % to 12 % of the faces at twice the
+faces (benchmarks/bench_quadtree.py, n = 200); further rounds add
+faces faster than they remove obtuse triangles.
+
+The points have integer coordinates (CG:SHOP instances), so the depth
+is at most log2 of the coordinate range R: m = O(n log R) leaves,
+each located against the h hull vertices in O(log h); only the b leaves
+crossing the hull are clipped, in O(h) each.  O(n log n) overall when R
+is polynomial in n.  All geometry is exact: doubled integers for the
+grid (cell centres are half-integers), Fractions for clip points.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from fractions import Fraction
+from typing import Dict, List, Optional, Set, Tuple
+
+from be_alg.dcel import DCEL
+from be_alg.face_types import FaceType
+from be_alg.slab_partition import classify_face, iterate_half_edges
+from be_alg.triangulation import triangle_type
+
+Cell = Tuple[int, int, int]                     # (depth, i, j)
+WARP_ROUNDS = 1         # times the leaves of unwarped points are split and warped again
+_SIDES = ((1, 0), (0, 1), (-1, 0), (0, -1))     # E, N, W, S
+
+
+def quadtree_partition(instance, dcel_cls=DCEL, number: str = "fraction"):
+    """
+    Partition the convex region of `instance` (anything with the
+    Cgshop2025Instance fields, no constraints) along a balanced quadtree.
+    The first instance.num_points vertices are the instance points, as
+    for from_instance, so be_alg.export works unchanged.
+    """
+    if instance.additional_constraints:
+        raise ValueError("the quadtree engine takes point sets without constraints")
+    xs, ys = list(instance.points_x), list(instance.points_y)
+    if not all(isinstance(v, int) for v in xs + ys):
+        raise ValueError("the quadtree engine needs integer coordinates")
+
+    pts = [(2 * x, 2 * y) for x, y in zip(xs, ys)]           # doubled grid
+    hull = _Hull([pts[i] for i in instance.region_boundary])
+    x0, y0 = min(xs), min(ys)
+    k = max(max(xs) - x0, max(ys) - y0, 1).bit_length()
+    tree = _Quadtree((2 * x0, 2 * y0), 2 << k, k, pts)
+    inputs = set(pts)
+    tree.balance()
+    warped = _warp(tree, hull, inputs)
+    for _ in range(WARP_ROUNDS):
+        stuck = [cell for cell, p in tree.extra.items() if cell not in warped
+                 and cell[0] < tree.max_depth and hull.locate(p)[0] == 1]
+        for cell in stuck:              # p lands elsewhere relative to the child's corners
+            if cell in tree.leaves:
+                tree.split(cell)
+        tree.balance()
+        warped = _warp(tree, hull, inputs)
+    points, edges = _Graph(pts, hull).build(tree, warped)
+    dcel = dcel_cls.from_edges(points, edges, number)
+    for f in dcel.faces:
+        if f is not dcel.outer_face:
+            f.ftype = _face_type(f)
+    return dcel
+
+
+# ---------- 1 + 2. quadtree ----------
+class _Quadtree:
+    """Leaves and internal nodes as (depth, i, j) sets; cell size = side >> depth."""
+
+    def __init__(self, origin: Tuple[int, int], side: int, max_depth: int,
+                 pts: List[Tuple[int, int]]):
+        self.origin, self.side, self.max_depth = origin, side, max_depth
+        self.leaves: Set[Cell] = set()
+        self.internal: Set[Cell] = set()
+        self.extra: Dict[Cell, Tuple[int, int]] = {}    # leaf → its point off the corners
+        stack = [((0, 0, 0), pts)]
+        while stack:
+            cell, inside = stack.pop()
+            loose = [p for p in inside if not self._is_corner(cell, p)]
+            if cell[0] == max_depth or len(loose) <= 1:
+                self.leaves.add(cell)
+                if loose:
+                    self.extra[cell] = loose[0]
+                continue
+            self.internal.add(cell)
+            # a corner of the cell is a corner of the one child that holds it
+            for child in self.children(cell):
+                stack.append((child, [p for p in loose if self._holds(child, p)]))
+
+    def box(self, cell: Cell) -> Tuple[int, int, int, int]:
+        d, i, j = cell
+        s = self.side >> d
+        x, y = self.origin[0] + i * s, self.origin[1] + j * s
+        return x, y, x + s, y + s
+
+    def _is_corner(self, cell: Cell, p) -> bool:
+        x_lo, y_lo, x_hi, y_hi = self.box(cell)
+        return p[0] in (x_lo, x_hi) and p[1] in (y_lo, y_hi)
+
+    def _holds(self, cell: Cell, p) -> bool:
+        x_lo, y_lo, x_hi, y_hi = self.box(cell)
+        return x_lo <= p[0] <= x_hi and y_lo <= p[1] <= y_hi
+
+    @staticmethod
+    def children(cell: Cell) -> List[Cell]:
+        d, i, j = cell
+        return [(d + 1, 2 * i + a, 2 * j + b) for a, b in ((0, 0), (1, 0), (0, 1), (1, 1))]
+
+    def _covering_leaf(self, cell: Cell) -> Optional[Cell]:
+        """The leaf at depth <= d that contains `cell`, None if it is subdivided."""
+        d, i, j = cell
+        for up in range(d + 1):
+            c = (d - up, i >> up, j >> up)
+            if c in self.leaves:
+                return c
+        return None
+
+    def leaves_at(self, c: Tuple[int, int], d: int) -> List[Cell]:
+        """The leaves whose boundary holds c, a corner of the depth-d cells."""
+        s = self.side >> d
+        ci, cj = (c[0] - self.origin[0]) // s, (c[1] - self.origin[1]) // s
+        found: List[Cell] = []
+        for cell in ((d, ci - a, cj - b) for a in (0, 1) for b in (0, 1)):
+            if not (0 <= cell[1] < 1 << d and 0 <= cell[2] < 1 << d):
+                continue
+            leaf = self._covering_leaf(cell)
+            while leaf is None:             # subdivided: the child at c, down to a leaf
+                cell = next(ch for ch in self.children(cell) if self._holds(ch, c))
+                leaf = cell if cell in self.leaves else None
+            if leaf not in found:
+                found.append(leaf)
+        return found
+
+    def balance(self) -> None:
+        """Split until side-adjacent leaves differ by at most one level."""
+        by_depth: Dict[int, List[Cell]] = defaultdict(list)
+        for c in self.leaves:
+            by_depth[c[0]].append(c)
+        for d in range(max(by_depth, default=0), 1, -1):
+            queue = by_depth[d]
+            while queue:
+                cell = queue.pop()
+                if cell not in self.leaves:
+                    continue
+                _, i, j = cell
+                for di, dj in _SIDES:
+                    ni, nj = i + di, j + dj
+                    if not (0 <= ni < 1 << d and 0 <= nj < 1 << d):
+                        continue
+                    coarse = self._covering_leaf((d, ni, nj))
+                    while coarse is not None and coarse[0] < d - 1:
+                        for child in self.split(coarse):
+                            by_depth[child[0]].append(child)
+                        coarse = self._covering_leaf((d, ni, nj))
+
+    def split(self, cell: Cell) -> List[Cell]:
+        """Replace leaf `cell` by its children; its point goes to the one holding it."""
+        self.leaves.remove(cell)
+        self.internal.add(cell)
+        p = self.extra.pop(cell, None)
+        children = self.children(cell)
+        for child in children:
+            self.leaves.add(child)
+            if p is not None and self._holds(child, p) and not self._is_corner(child, p):
+                self.extra[child] = p
+        return children
+
+    def hanging(self, cell: Cell) -> List[bool]:
+        """Per side (E, N, W, S): does the neighbour put a vertex at its middle?"""
+        d, i, j = cell
+        return [(d, i + di, j + dj) in self.internal for di, dj in _SIDES]
+
+
+# ---------- 3 + 4. cells, clipped to the hull ----------
+class _Hull:
+    """Strictly convex CCW ring (collinear vertices dropped) with O(log h) location."""
+
+    def __init__(self, ring: List[Tuple[int, int]]):
+        h = len(ring)
+        keep = [ring[a] for a in range(h)
+                if _cross(ring[a - 1], ring[a], ring[(a + 1) % h]) != 0]
+        if len(keep) < 3 or any(_cross(keep[a - 1], keep[a], keep[(a + 1) % len(keep)]) < 0
+                                for a in range(len(keep))):
+            raise ValueError("the quadtree engine needs a convex CCW region boundary")
+        self.v = keep
+        xs, ys = [p[0] for p in keep], [p[1] for p in keep]
+        self.bbox = (min(xs), min(ys), max(xs), max(ys))
+
+    def locate(self, q) -> Tuple[int, Optional[int]]:
+        """
+        (1, None) strictly inside, (-1, None) outside, (0, a) on edge
+        a (v[a] → v[a+1]) and (0, None) on a hull vertex.
+        """
+        v, h = self.v, len(self.v)
+        o = v[0]
+        c_first, c_last = _cross(o, v[1], q), _cross(o, v[-1], q)
+        if c_first < 0 or c_last > 0:
+            return -1, None
+        if c_first == 0 or c_last == 0:           # on the line of edge 0 or h-1
+            a, b = (o, v[1]) if c_first == 0 else (v[-1], o)
+            t, n = _dot(a, b, q), _dot(a, b, b)
+            if t < 0 or t > n:
+                return -1, None
+            if q == a or q == b:
+                return 0, None
+            return 0, (0 if c_first == 0 else h - 1)
+        lo, hi = 1, h - 1                         # last k with q left of o → v[k]
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if _cross(o, v[mid], q) >= 0:
+                lo = mid
+            else:
+                hi = mid
+        c = _cross(v[lo], v[lo + 1], q)
+        if c < 0:
+            return -1, None
+        if c > 0:
+            return 1, None
+        if q == v[lo] or q == v[lo + 1]:
+            return 0, None
+        return 0, lo
+
+    def clip(self, p, q):
+        """
+        The part of segment p q inside the closed hull as
+        (start, end, hull edges at start, at end, edge it runs along),
+        or None if it is outside or touches in one point.
+        """
+        t0, t1 = Fraction(0), Fraction(1)
+        v, h = self.v, len(self.v)
+        values = []
+        for a in range(h):
+            cp, cq = _cross(v[a], v[a - h + 1], p), _cross(v[a], v[a - h + 1], q)
+            values.append((cp, cq))
+            if cp < 0 and cq < 0:
+                return None
+            if cp < 0:
+                t0 = max(t0, Fraction(cp, cp - cq))
+            elif cq < 0:
+                t1 = min(t1, Fraction(cp, cp - cq))
+        if t0 >= t1:
+            return None
+        s, e = _lerp(p, q, t0), _lerp(p, q, t1)
+        on_s = [a for a, (cp, cq) in enumerate(values) if cp + t0 * (cq - cp) == 0]
+        on_e = [a for a, (cp, cq) in enumerate(values) if cp + t1 * (cq - cp) == 0]
+        along = next((a for a in on_s if a in on_e), None)
+        return s, e, on_s, on_e, along
+
+
+class _Graph:
+    """Collects the points and undirected edges handed to from_edges."""
+
+    def __init__(self, pts: List[Tuple[int, int]], hull: _Hull):
+        self.hull = hull
+        self.ids: Dict[tuple, int] = {}
+        self.coords: List[tuple] = []
+        for p in pts:
+            self._id(p)
+        self.edges: Set[Tuple[int, int]] = set()
+        self.on_hull: Dict[int, Set[tuple]] = defaultdict(set)
+
+    def _id(self, p) -> int:
+        i = self.ids.get(p)
+        if i is None:
+            i = self.ids[p] = len(self.coords)
+            self.coords.append(p)
+        return i
+
+    def _edge(self, p, q) -> None:
+        a, b = self._id(p), self._id(q)
+        self.edges.add((a, b) if a < b else (b, a))
+
+    def build(self, tree: _Quadtree, warped: Dict[Cell, List[tuple]]
+              ) -> Tuple[list, List[Tuple[int, int]]]:
+        hx0, hy0, hx1, hy1 = self.hull.bbox
+        for cell in tree.leaves:
+            if cell in warped:
+                self._add_inside(warped[cell])
+                continue
+            x_lo, y_lo, x_hi, y_hi = tree.box(cell)
+            if x_hi < hx0 or x_lo > hx1 or y_hi < hy0 or y_lo > hy1:
+                continue
+            segments = _cell_segments(x_lo, y_lo, x_hi, y_hi, tree.hanging(cell),
+                                      tree.extra.get(cell))
+            where = {c: self.hull.locate(c) for c in
+                     ((x_lo, y_lo), (x_hi, y_lo), (x_hi, y_hi), (x_lo, y_hi))}
+            if all(s >= 0 for s, _ in where.values()):
+                self._add_inside(segments)
+            else:
+                self._add_clipped(segments)
+
+        v = self.hull.v
+        for a, on in self.on_hull.items():   # hull edges, split where cells meet them
+            s, e = v[a], v[(a + 1) % len(v)]
+            chain = [s, *sorted(on, key=lambda q: _dot(s, e, q)), e]
+            for p, q in zip(chain, chain[1:]):
+                self._edge(p, q)
+        for a in range(len(v)):
+            if a not in self.on_hull:
+                self._edge(v[a], v[(a + 1) % len(v)])
+
+        points = [(Fraction(x) / 2, Fraction(y) / 2) for x, y in self.coords]
+        return points, sorted(self.edges)
+
+    def _add_inside(self, segments) -> None:
+        """A leaf inside the closed hull: only its hull contacts need care."""
+        where = {}
+        for p, q in segments:
+            for c in (p, q):
+                if c not in where:
+                    where[c] = self.hull.locate(c)
+                    if where[c][1] is not None:
+                        self.on_hull[where[c][1]].add(c)
+            (sp, ap), (sq, aq) = where[p], where[q]
+            if sp == sq == 0 and (ap == aq or ap is None or aq is None) and \
+                    self._along_hull(p, q):
+                continue                        # runs along a hull edge
+            self._edge(p, q)
+
+    def _along_hull(self, p, q) -> bool:
+        mid = ((p[0] + q[0]) / 2, (p[1] + q[1]) / 2)
+        return self.hull.locate(mid)[0] == 0
+
+    def _add_clipped(self, segments) -> None:
+        for p, q in segments:
+            piece = self.hull.clip(p, q)
+            if piece is None:
+                continue
+            s, e, on_s, on_e, along = piece
+            s, e = _grid_point(s), _grid_point(e)
+            for c, on in ((s, on_s), (e, on_e)):
+                if len(on) == 1:                # on one edge, not at a hull vertex
+                    self.on_hull[on[0]].add(c)
+            if along is None:
+                self._edge(s, e)
+
+
+def _warp(tree: _Quadtree, hull: _Hull, inputs: Set[tuple]) -> Dict[Cell, List[tuple]]:
+    """
+    Step 3: leaf → its segments, for the leaves around a corner c that is
+    moved onto the point p of a leaf.  c must sit strictly inside the
+    hull and not be an input point; the leaves that have c on their ring
+    must lie in the hull and hold no other point.  Every one of them,
+    with p in place of c, needs a triangulation of its ring into
+    non-obtuse triangles, else nothing is warped at c.
+    """
+    out: Dict[Cell, List[tuple]] = {}
+    for cell, p in sorted(tree.extra.items()):
+        if hull.locate(p)[0] != 1:
+            continue
+        x_lo, y_lo, x_hi, y_hi = tree.box(cell)
+        corners = sorted(((x, y) for x in (x_lo, x_hi) for y in (y_lo, y_hi)),
+                         key=lambda c: _dot(p, c, c))
+        for c in corners:                   # nearest first
+            if c in inputs or hull.locate(c)[0] != 1:
+                continue
+            plans = _warp_plans(tree, hull, cell, c, p, out)
+            if plans is not None:
+                out.update(plans)
+                break
+    return out
+
+
+def _warp_plans(tree: _Quadtree, hull: _Hull, cell: Cell, c, p,
+                taken: Dict[Cell, List[tuple]]) -> Optional[Dict[Cell, List[tuple]]]:
+    """The segments of every leaf around c with c moved to p, or None."""
+    plans = {}
+    for n in tree.leaves_at(c, cell[0]):
+        if n in taken or (n != cell and n in tree.extra):
+            return None
+        x0, y0, x1, y1 = tree.box(n)
+        if any(hull.locate(q)[0] < 0 for q in ((x0, y0), (x1, y0), (x1, y1), (x0, y1))):
+            return None
+        ring = _cell_ring(x0, y0, x1, y1, tree.hanging(n))
+        if c not in ring:
+            return None
+        ring = [p if q == c else q for q in ring]
+        sides = list(zip(ring, ring[1:] + ring[:1]))
+        diagonals = _non_obtuse_diagonals(ring)
+        if diagonals is None:               # else a fan from the centre, as unwarped
+            centre = ((x0 + x1) // 2, (y0 + y1) // 2)
+            if not all(_cross(a, b, centre) > 0 and _non_obtuse(a, b, centre)
+                       for a, b in sides):
+                return None
+            diagonals = [(centre, q) for q in ring]
+        plans[n] = sides + diagonals
+    return plans
+
+
+def _non_obtuse_diagonals(ring: List[tuple]) -> Optional[List[tuple]]:
+    """
+    Diagonals of a triangulation of the CCW ring into non-obtuse
+    triangles that hold no other ring vertex, or None.  Interval
+    dynamic program – the rings have at most nine vertices.
+    """
+    m = len(ring)
+    memo: Dict[Tuple[int, int], Optional[List[tuple]]] = {}
+
+    def solve(i: int, j: int) -> Optional[List[tuple]]:
+        if j - i < 2:
+            return []
+        if (i, j) not in memo:
+            memo[i, j] = None
+            for k in range(i + 1, j):
+                a, b, c = ring[i], ring[k], ring[j]
+                if _cross(a, b, c) <= 0 or not _non_obtuse(a, b, c) or any(
+                        _in_triangle(a, b, c, ring[r]) for r in range(m) if r not in (i, j, k)):
+                    continue
+                left, right = solve(i, k), solve(k, j)
+                if left is not None and right is not None:
+                    memo[i, j] = left + right + [(a, b)] * (k - i > 1) + [(b, c)] * (j - k > 1)
+                    break
+        return memo[i, j]
+
+    return solve(0, m - 1)
+
+
+def _cell_segments(x_lo, y_lo, x_hi, y_hi, hanging: List[bool],
+                   extra: Optional[tuple]) -> List[tuple]:
+    """
+    Sides (split at hanging vertices and at `extra`, the leaf's input
+    point off its corners) and, if the leaf is not a plain square, the
+    fan from `extra` if it is inside, else from the centre.
+    """
+    ring = _cell_ring(x_lo, y_lo, x_hi, y_hi, hanging, extra)
+    segments = list(zip(ring, ring[1:] + ring[:1]))
+    if len(ring) > 4 or extra is not None:
+        inside = extra is not None and extra not in ring
+        centre = extra if inside else ((x_lo + x_hi) // 2, (y_lo + y_hi) // 2)
+        segments += [(centre, c) for c in ring if c != centre]
+    return segments
+
+
+def _cell_ring(x_lo, y_lo, x_hi, y_hi, hanging: List[bool],
+               extra: Optional[tuple] = None) -> List[tuple]:
+    """The leaf's ring, CCW from SW, with its hanging vertices and `extra` if on a side."""
+    corners = [(x_hi, y_lo), (x_hi, y_hi), (x_lo, y_hi), (x_lo, y_lo)]
+    xm, ym = (x_lo + x_hi) // 2, (y_lo + y_hi) // 2
+    mids = [(x_hi, ym), (xm, y_hi), (x_lo, ym), (xm, y_lo)]     # E, N, W, S
+    on_side = [False] * 4 if extra is None else \
+        [extra[0] == x_hi, extra[1] == y_hi, extra[0] == x_lo, extra[1] == y_lo]
+    ring = [corners[3]]             # S side, E side, N side, W side
+    for side, corner, axis, sign in ((3, 0, 0, 1), (0, 1, 1, 1), (1, 2, 0, -1), (2, 3, 1, -1)):
+        on = [mids[side]] if hanging[side] else []
+        if on_side[side] and extra not in on:
+            on = sorted(on + [extra], key=lambda q: sign * q[axis])
+        ring += on
+        ring.append(corners[corner])
+    ring.pop()                      # back at SW
+    return ring
+
+
+# ---------- 5. face types ----------
+def _face_type(face) -> FaceType:
+    """
+    classify_face, plus the exact angle test for triangles it cannot
+    place from the counters (fan triangles with diagonal legs, clipped
+    pieces).
+    """
+    t = classify_face(face)
+    if t is not FaceType.OBTUSE_TRI or face.n_edges != 3:
+        return t
+    return triangle_type(*(he.origin for he in iterate_half_edges(face.outer)))
+
+
+# ---------- exact helpers ----------
+def _cross(o, a, b):
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def _dot(o, a, b):
+    return (a[0] - o[0]) * (b[0] - o[0]) + (a[1] - o[1]) * (b[1] - o[1])
+
+
+def _non_obtuse(a, b, c) -> bool:
+    return _dot(a, b, c) >= 0 and _dot(b, c, a) >= 0 and _dot(c, a, b) >= 0
+
+
+def _in_triangle(a, b, c, q) -> bool:
+    """q in the closed CCW triangle abc."""
+    return _cross(a, b, q) >= 0 and _cross(b, c, q) >= 0 and _cross(c, a, q) >= 0
+
+
+def _lerp(p, q, t):
+    return p[0] + t * (q[0] - p[0]), p[1] + t * (q[1] - p[1])
+
+
+def _grid_point(p) -> tuple:
+    """Whole Fractions back to ints, so grid corners keep one id."""
+    return tuple(int(c) if getattr(c, "denominator", 1) == 1 else c for c in p)
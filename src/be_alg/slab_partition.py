@@ -4,13 +4,24 @@
 # ------------------------------------------------------------
 from __future__ import annotations
 
-from fractions import Fraction
-from typing import List, Tuple, Iterable, Optional
-from collections import Counter
+import heapq
+import json
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING, Dict, List, Tuple, Iterable, Optional
+from be_alg.bitsize import BitSizeReport, bit_sizes
 from be_alg.dcel import DCEL, Face, HalfEdge, Vertex
 from be_alg.face_types import FaceType
+from be_alg.number_backend import as_fraction
+from be_alg.predicates import Predicates, predicates
 from be_alg.viz_utils import show_slab_partition
 
+if TYPE_CHECKING:
+    from fractions import Fraction
+
 
 
 # ------------------------------------------------------------
@@ -19,91 +30,143 @@ from be_alg.viz_utils import show_slab_partition
 # ------------------------------------------------------------------
 #  3-A : Vertical slab lines  (FINAL VERSION)
 # ------------------------------------------------------------------
-def add_vertical_cuts(dcel: DCEL) -> None:
+def add_vertical_cuts(dcel: DCEL, sweep: bool = False,
+                      filtered: bool = False) -> None:
     """
     לכל ערך x שקיים בקודקודי המצולע:
         • מאתרים את כל נקודות-החיתוך (קודקודים קיימים / סטיינר חדשים)
           שבהן הקו x = const פוגש צלעות פנימיות של המצולע.
         • ממיינים לפי y ומחברים כל זוג עוקב (תחתון-עליון) באלכסון
           אנכי, אבל *רק אם* הם באותה פאה ועדיין לא מחוברים בקו אנכי.
+
+    sweep=True runs the same cuts as a left-to-right sweep
+    (see `_add_vertical_cuts_sweep`) instead of rescanning every
+    half-edge for every x – O((n + k) log n) instead of O(X·E).
+
+    filtered=True decides every comparison on the cached float
+    coordinates first (see be_alg.predicates); the cuts are identical.
     """
-    xs = sorted({v.x for v in dcel.vertices})
+    P = predicates(filtered)
+    if sweep:
+        _add_vertical_cuts_sweep(dcel, P)
+        return
+
+    keys = _distinct_sorted(P.key_x(v) for v in dcel.vertices)
 
-    for x0 in xs:
+    for k0 in keys:
+        x0 = P.value(k0)
         # 1. אסוף / צור כל Hit על הקו האנכי הזה
         hits: list[Vertex] = []
         for he in list(dcel.half_edges):
             if he.face is dcel.outer_face:                # דלג על החוץ
                 continue
 
-            x1, x2 = he.origin.x, he.twin.origin.x
-            if min(x1, x2) < x0 < max(x1, x2):           # חוצה צלע
+            k1, k2 = P.key_x(he.origin), P.key_x(he.twin.origin)
+            if min(k1, k2) < k0 < max(k1, k2):           # חוצה צלע
+                x1, x2 = he.origin.x, he.twin.origin.x
                 t  = (x0 - x1) / (x2 - x1)
                 y0 = he.origin.y + t * (he.twin.origin.y - he.origin.y)
                 hits.append(dcel.split_edge(he, x0, y0))
-            elif x1 == x0:                               # פוגע בקודקוד קיים
+            elif k1 == k0:                               # פוגע בקודקוד קיים
                 hits.append(he.origin)
 
-        if len(hits) < 2:
+        _connect_hits(dcel, hits, P)
+
+
+def _connect_hits(dcel: DCEL, hits: List[Vertex], P: Predicates) -> None:
+    """Pair consecutive hits on one vertical line with vertical diagonals."""
+    if len(hits) < 2:
+        return
+
+    # 2. מיין לפי y וחבר כל זוג עוקב שהקטע ביניהם עובר בפאה פנימית
+    #    (a vertex with two inner edges is hit twice).  Inside / outside
+    #    need not alternate along the line – constraint edges inside the
+    #    region are hits too – so every pair is decided by the face corner
+    #    at v_low that points up; None means v_low → v_up is already an edge.
+    hits.sort(key=P.key_y)
+    hits = [v for k, v in enumerate(hits) if k == 0 or v is not hits[k - 1]]
+    outer = dcel.outer_face
+    for v_low, v_up in zip(hits, hits[1:]):
+        corner = dcel.corner_toward(v_low, v_up)
+        if corner is None or corner.face is outer:
             continue
+        add_diagonal(dcel, corner.face, v_low, v_up)
 
-        # 2. מיין לפי y וחבר זוגות
-        hits.sort(key=lambda v: v.y)
-        i = 0
-        while i + 1 < len(hits):
-            v_low, v_up = hits[i], hits[i + 1]
 
-            # 2a. חייבים להיות באותה פאה פנימית
-            face = _common_face(v_low, v_up)
-            if face is None:
-                i += 1          # לא באותה פאה → עבור לקודקוד הבא
-                continue
+# ------------------------------------------------------------------
+#  3-A' : vertical slab lines as a left-to-right sweep
+# ------------------------------------------------------------------
+def _add_vertical_cuts_sweep(dcel: DCEL, P: Predicates) -> None:
+    """
+    Sweep version of `add_vertical_cuts` – same hits, same splits.
 
-            # 2b. אם כבר מחוברים בקו אנכי קיים, דלג
-            edge_from_low = _find_edge_from_vertex_in_face(v_low, face)
-            if (_is_vertical(edge_from_low) and
-                (edge_from_low.origin is v_up or edge_from_low.twin.origin is v_up)):
-                i += 2
+    Events are the distinct vertex x values.  `active` holds the inner
+    (non-outer-face) half-edges whose x-range strictly contains the
+    sweep line, ordered by y.  At every event each active edge either
+    ends on the line or is split by it, so the work per event is
+    proportional to the hits it produces.
+    """
+    outer = dcel.outer_face
+    kx = P.key_x
+    keys = _distinct_sorted(kx(v) for v in dcel.vertices)
+
+    # buckets are keyed by the rank of x in keys – coordinates of every
+    # number backend compare, but not all of them hash
+    on_line: List[List[Vertex]] = [[] for _ in keys]     # origins on x = keys[i]
+    starts: List[List[HalfEdge]] = [[] for _ in keys]    # edges whose left end is keys[i]
+    for he in dcel.half_edges:
+        if he.face is outer:
+            continue
+        k1 = kx(he.origin)
+        on_line[bisect_left(keys, k1)].append(he.origin)
+        if not P.is_vertical(he):
+            starts[bisect_left(keys, min(k1, kx(he.twin.origin)))].append(he)
+
+    active: List[HalfEdge] = []
+    for rank, k0 in enumerate(keys):
+        x0 = P.value(k0)
+        hits: List[Vertex] = list(on_line[rank])
+
+        # 1. every active edge ends on the line or is split by it
+        cont: List[HalfEdge] = []
+        for he in active:
+            a, b = he.origin, he.twin.origin
+            ka = kx(a)
+            if ka == k0 or kx(b) == k0:                # ends at a vertex on x0
                 continue
+            t = (x0 - a.x) / (b.x - a.x)
+            m = dcel.split_edge(he, x0, a.y + t * (b.y - a.y))
+            hits.append(m)
+            # the piece right of x0 keeps crossing later lines
+            cont.append(he if ka > k0 else he.next)       # he.next is M→B
 
-            # 2c. מוסיף אלכסון אנכי חדש
-            add_diagonal(dcel, face, v_low, v_up)
-            i += 2
+        # 2. hits from `active` are already y-ordered → the sort is a merge
+        _connect_hits(dcel, hits, P)
 
+        # 3. edges starting at x0 join the active set in y order
+        new = starts[rank]
+        if new:
+            new.sort(key=lambda e: _sweep_key(e, x0))
+            active = list(heapq.merge(cont, new, key=lambda e: _sweep_key(e, x0)))
+        else:
+            active = cont
 
-# ------------------------------------------------------------
-#  סביב הקודקוד – קבע אילו פאות צמודות אליו
-# ------------------------------------------------------------
-def _faces_incident(v: Vertex) -> set[Face]:
-    faces, visited = set(), set()
-    he0 = v.incident
-    he  = he0
-    while he and he not in visited:
-        visited.add(he)
-        if he.face is not None:
-            faces.add(he.face)
-        he = he.twin.next
-    return faces
-
-
-def _common_face(v1: Vertex, v2: Vertex) -> Optional[Face]:
-    faces1 = _faces_incident(v1)
-    for f in _faces_incident(v2):
-        if f in faces1 and f.outer is not None:   # מתעלמים מהפאה החיצונית
-            return f
-    return None
 
+def _distinct_sorted(values: Iterable) -> list:
+    """sorted(set(values)) for numbers that compare but may not hash."""
+    out: list = []
+    for v in sorted(values):
+        if not out or out[-1] < v:
+            out.append(v)
+    return out
 
-def _is_vertical(e: HalfEdge) -> bool:
-    return e.origin.x == e.twin.origin.x
 
+def _sweep_key(he: HalfEdge, x0: Fraction) -> Tuple[Fraction, Fraction]:
+    """(y, slope) of a non-vertical edge just right of the line x = x0."""
+    a, b = he.origin, he.twin.origin
+    slope = (b.y - a.y) / (b.x - a.x)
+    return a.y + (x0 - a.x) * slope, slope
 
-# ------------------------------------------------------------
-# helper – add one vertical diagonal  (קצר ובטוח)
-# ------------------------------------------------------------
-def _add_vertical_diagonal(dcel: DCEL, v_low: Vertex, v_up: Vertex) -> None:
-    face = _find_edge_from_vertex_in_face(v_low, v_low.incident.face).face
-    add_diagonal(dcel, face, v_low, v_up)
 
 # ------------------------------------------------------------
 #  3-B  :  horizontal slab lines  –  FINAL
@@ -116,17 +179,28 @@ def add_horizontal_cuts(dcel: DCEL) -> None:
         • מחלק את הקטע האנכי בנקודת הפגישה.
     """
     made = 0
+    one = dcel.number.convert(1)        # probe step, in the backend's type
     # סורקים ישירות את רשימת הקודקודים – כך לא מפספסים גם קודקודים
     # שנוצרו ע״י split_edge ואינם origin של half-edge בפאה הנוכחית.
-    for v in dcel.vertices:
+    # The hits made here are not shot from again (ArrayDCEL.vertices
+    # stops at its starting length anyway, a list would keep growing).
+    for v in islice(dcel.vertices, len(dcel.vertices)):
         if v.incident is None:
             continue
         f = v.incident.face
         if f is None or f is dcel.outer_face:
             continue            # קודקוד על גבול חיצוני – לא חותכים
 
-        target = _first_vertical_hit_to_right(f, v.x, v.y)
-        if target:
+        # the ray starts in the face corner that points right (a vertex
+        # on constraint edges touches several inner faces); none means
+        # an edge already runs right from v
+        corner = dcel.corner_toward(v, Vertex(v.x + one, v.y))
+        if corner is None or corner.face is dcel.outer_face:
+            continue
+        target = _first_vertical_hit_to_right(corner.face, v.x, v.y)
+        # a hit on an endpoint already has its vertex – splitting there
+        # would create a zero-length edge
+        if target and v.y != target.origin.y and v.y != target.twin.origin.y:
             dcel.split_edge(target, target.origin.x, v.y)
             made += 1
     # אפשר להדפיס/לוג אם רוצים:  print("horizontal cuts:", made)
@@ -138,63 +212,29 @@ def _first_vertical_hit_to_right(face: Face,
     """
     מחזירה את חצי-הקשת האנכית הקרובה ביותר מימין (x > x0)
     כך שהגובה y0 נמצא בתחומה.  אם אין – מחזירה None.
+    Answered from the face's `VerticalEdgeIndex`, without walking the ring.
     """
-    best_dx: Optional[Fraction] = None
-    best_he: Optional[HalfEdge] = None
-
-    for he in iterate_half_edges(face.outer):
-        if not _is_vertical(he):
-            continue
-
-        x_vert = he.origin.x                          # כי אנכי: x קבוע
-        if x_vert <= x0:                              # כולל  ==  (על הקו עצמו)
-            continue
-
-        y_min = min(he.origin.y, he.twin.origin.y)
-        y_max = max(he.origin.y, he.twin.origin.y)
-        if not (y_min <= y0 <= y_max):
-            continue                                  # לא מגיע לגובה y0
-
-        dx = x_vert - x0
-        if best_dx is None or dx < best_dx:
-            best_dx, best_he = dx, he
-
-    return best_he
-
-
-
-def _first_vertical_hit_to_right(face: Face,
-                                 x0: Fraction, y0: Fraction) -> Optional[HalfEdge]:
-    """Return the closest vertical half-edge to the right at height y0."""
-    best_dx: Optional[Fraction] = None
-    best_he: Optional[HalfEdge] = None
-    for he in iterate_half_edges(face.outer):
-        if he.origin.x == he.twin.origin.x:         # vertical
-            x_vert = he.origin.x
-            if x_vert > x0:
-                y_min = min(he.origin.y, he.twin.origin.y)
-                y_max = max(he.origin.y, he.twin.origin.y)
-                if y_min <= y0 <= y_max:
-                    dx = x_vert - x0
-                    if best_dx is None or dx < best_dx:
-                        best_dx, best_he = dx, he
-    return best_he
+    return face.verticals.first_hit_right(x0, y0)
 
 # ------------------------------------------------------------
 #  3-C  :  classify faces  (Lemma 5)
 # ------------------------------------------------------------
-def classify_face(face: Face) -> FaceType:
-    edges = list(iterate_half_edges(face.outer))
-    vert  = [e for e in edges if _is_vertical(e)]
-    horz  = [e for e in edges if _is_horizontal(e)]
+def classify_face(face: Face, filtered: bool = False) -> FaceType:
+    """
+    Decided on the ring counters the DCEL keeps per face – no ring walk.
+    Only the two-vertical case looks at the edges, via `face.verticals`.
+    """
+    P = predicates(filtered)
+    n_edges, n_vert, n_horz = face.n_edges, face.n_vertical, face.n_horizontal
 
-    if len(edges) == 4 and len(vert) == 2 and len(horz) == 2:
+    if n_edges == 4 and n_vert == 2 and n_horz == 2:
         return FaceType.RECTANGLE
-    if len(edges) == 3 and len(vert) == 1 and len(horz) == 1:
+    if n_edges == 3 and n_vert == 1 and n_horz == 1:
         return FaceType.RIGHT_TRI
-    if len(vert) == 2:
-        y1 = sorted([vert[0].origin.y, vert[0].twin.origin.y])
-        y2 = sorted([vert[1].origin.y, vert[1].twin.origin.y])
+    if n_vert == 2:
+        vert = list(face.verticals)
+        y1 = sorted([P.key_y(vert[0].origin), P.key_y(vert[0].twin.origin)])
+        y2 = sorted([P.key_y(vert[1].origin), P.key_y(vert[1].twin.origin)])
         if max(y1[0], y2[0]) <= min(y1[1], y2[1]):
             return FaceType.OBTUSE_TRI        # overlap → obtuse triangle
         return FaceType.OPEN_SLAB
@@ -203,36 +243,199 @@ def classify_face(face: Face) -> FaceType:
 # ------------------------------------------------------------
 #  3-D  :  split remaining OPEN_SLAB faces
 # ------------------------------------------------------------
-def split_open_slab(dcel: DCEL, face: Face) -> Tuple[Face, Face]:
-    vert_edges = sorted([e for e in iterate_half_edges(face.outer) if _is_vertical(e)],
-                        key=lambda e: e.origin.x)
+def split_open_slab(dcel: DCEL, face: Face,
+                    filtered: bool = False) -> Tuple[Face, Face]:
+    P = predicates(filtered)
+    ky = P.key_y
+    vert_edges = sorted(face.verticals, key=lambda e: P.key_x(e.origin))
     left_e, right_e = vert_edges[0], vert_edges[1]
 
-    v_left_top  = left_e.origin  if left_e.origin.y  > left_e.twin.origin.y  else left_e.twin.origin
-    v_right_bot = right_e.origin if right_e.origin.y < right_e.twin.origin.y else right_e.twin.origin
+    v_left_top  = left_e.origin  if ky(left_e.origin)  > ky(left_e.twin.origin)  else left_e.twin.origin
+    v_right_bot = right_e.origin if ky(right_e.origin) < ky(right_e.twin.origin) else right_e.twin.origin
 
     return add_diagonal(dcel, face, v_left_top, v_right_bot)
 
 # ------------------------------------------------------------
 #  main Stage-3 driver
 # ------------------------------------------------------------
-def slab_partition(dcel: DCEL) -> None:
-    add_vertical_cuts(dcel)
-    add_horizontal_cuts(dcel)
-
+def slab_partition(dcel: DCEL, sweep: bool = False,
+                   filtered: bool = False, validate: bool = False,
+                   workers: Optional[int] = None,
+                   stats: bool = False) -> Optional[SlabStats]:
+    """
+    validate=True runs `dcel.validate()` after every stage (tests / debug).
+    workers > 1 refines the OPEN_SLAB faces in a process pool.
+    stats=True returns a `SlabStats` with per-stage times and counters.
+    """
+    st = SlabStats() if stats else None
+    for name, stage, kwargs in (
+            ("vertical", add_vertical_cuts, dict(sweep=sweep, filtered=filtered)),
+            ("horizontal", add_horizontal_cuts, {}),
+            ("refine", refine_faces, dict(filtered=filtered, workers=workers))):
+        run_stage(dcel, name, stage, st, **kwargs)
+        if validate:
+            dcel.validate()
+    return st
+
+
+def refine_faces(dcel: DCEL, filtered: bool = False,
+                 workers: Optional[int] = None) -> None:
+    """
+    Classify every inner face, splitting OPEN_SLAB faces until none is left.
+    workers > 1 hands the OPEN_SLAB faces to `_refine_faces_parallel`.
+    """
     pending: List[Face] = [f for f in dcel.faces if f is not dcel.outer_face]
+    if workers is not None and workers > 1:
+        _refine_faces_parallel(dcel, pending[::-1], filtered, workers)
+        return
     while pending:
         f = pending.pop()
-        f.ftype = classify_face(f)
+        dcel.set_ftype(f, classify_face(f, filtered))
         if f.ftype is FaceType.OPEN_SLAB:
-            f1, f2 = split_open_slab(dcel, f)
+            f1, f2 = split_open_slab(dcel, f, filtered)
             pending.extend([f1, f2])
 
+
+# ------------------------------------------------------------
+#  3-D' :  OPEN_SLAB refinement in a process pool
+# ------------------------------------------------------------
+def _refine_faces_parallel(dcel: DCEL, faces: List[Face], filtered: bool,
+                           workers: int) -> None:
+    """
+    Every face refines independently of the others.  The OPEN_SLAB faces
+    are cut into one chunk per worker – their rings as vertex numbers
+    plus one coordinate table per chunk – and a worker splits the rings
+    with the rules of classify_face / split_open_slab (`_refine_rings`).
+    The diagonals come back in insertion order and are replayed here
+    with add_diagonal, face by face in the order of the serial loop, so
+    the result is the serial one, down to the order of dcel.faces.  A
+    ring that visits a vertex twice is refined here.
+    """
+    shipped: Dict[Face, int] = {}
+    rings: List[List[Vertex]] = []
+    for f in faces:
+        dcel.set_ftype(f, classify_face(f, filtered))
+        if f.ftype is not FaceType.OPEN_SLAB:
+            continue
+        ring = [he.origin for he in iterate_half_edges(f.outer)]
+        if len(set(ring)) == len(ring):
+            shipped[f] = len(rings)
+            rings.append(ring)
+    if not rings:
+        return
+
+    size = -(-len(rings) // workers)
+    chunks, tables = [], []
+    for start in range(0, len(rings), size):
+        number: Dict[Vertex, int] = {}
+        chunk = [[number.setdefault(v, len(number)) for v in ring]
+                 for ring in rings[start:start + size]]
+        table = list(number)
+        chunks.append((chunk, [as_fraction(v.x) for v in table],
+                       [as_fraction(v.y) for v in table]))
+        tables.append(table)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = [r for chunk in pool.map(_refine_rings, chunks) for r in chunk]
+
+    for f in faces:
+        if f.ftype is not FaceType.OPEN_SLAB:
+            continue
+        k = shipped.get(f)
+        if k is None:
+            pending = [f]
+            while pending:
+                g = pending.pop()
+                dcel.set_ftype(g, classify_face(g, filtered))
+                if g.ftype is FaceType.OPEN_SLAB:
+                    pending.extend(split_open_slab(dcel, g, filtered))
+            continue
+        table = tables[k // size]
+        diagonals, types = results[k]
+        local = [f]                             # the worker's face numbering
+        for parent, a, b in diagonals:
+            local.append(add_diagonal(dcel, local[parent], table[a], table[b])[1])
+        for g, t in zip(local, types):
+            dcel.set_ftype(g, t)
+
+
+def _refine_rings(job: Tuple[List[list], list, list]) -> List[tuple]:
+    """
+    Worker side.  `job` is (rings of vertex numbers, xs, ys).  For each
+    ring it returns
+        diagonals – (local face, vertex, vertex) in insertion order
+        types     – FaceType per local face
+    Local faces: 0 = the ring, 1 + k = the face made by diagonal k – the
+    v1 → v2 side, as DCEL.add_diagonal does.  The faces are taken in the
+    order of the serial loop of refine_faces.
+    """
+    rings, xs, ys = job
+    out = []
+    for ring in rings:
+        faces, types, diagonals = [ring], [None], []
+        pending = [0]
+        while pending:
+            f = pending.pop()
+            r = faces[f]
+            types[f] = _ring_type(r, xs, ys)
+            if types[f] is not FaceType.OPEN_SLAB:
+                continue
+            left, right = sorted((e for e in zip(r, r[1:] + r[:1]) if xs[e[0]] == xs[e[1]]),
+                                 key=lambda e: xs[e[0]])
+            v1 = max(left, key=lambda v: ys[v])             # as split_open_slab
+            v2 = min(right, key=lambda v: ys[v])
+            p1, p2 = r.index(v1), r.index(v2)
+            rot = r[p2:] + r[:p2]
+            faces[f] = (r[p1:] + r[:p1])[:(p2 - p1) % len(r) + 1]
+            faces.append([v1] + rot[:(p1 - p2) % len(r)])
+            types.append(None)
+            diagonals.append((f, v1, v2))
+            pending.extend([f, len(faces) - 1])
+        out.append((diagonals, types))
+    return out
+
+
+def _ring_type(ring: list, xs: list, ys: list) -> FaceType:
+    """classify_face for a ring of vertex numbers."""
+    edges = list(zip(ring, ring[1:] + ring[:1]))
+    vert = [e for e in edges if xs[e[0]] == xs[e[1]]]
+    n_horz = sum(ys[a] == ys[b] for a, b in edges)
+    if len(edges) == 4 and len(vert) == 2 and n_horz == 2:
+        return FaceType.RECTANGLE
+    if len(edges) == 3 and len(vert) == 1 and n_horz == 1:
+        return FaceType.RIGHT_TRI
+    if len(vert) == 2:
+        y1, y2 = (sorted((ys[a], ys[b])) for a, b in vert)
+        if max(y1[0], y2[0]) <= min(y1[1], y2[1]):
+            return FaceType.OBTUSE_TRI
+        return FaceType.OPEN_SLAB
+    return FaceType.OBTUSE_TRI
+
+
 # ------------------------------------------------------------
 #  helper utilities
 # ------------------------------------------------------------
-def iterate_half_edges(start: HalfEdge) -> Iterable[HalfEdge]:
-    """Yield the half-edges in the boundary loop; abort if ring is broken."""
+def iterate_half_edges(start: HalfEdge, checked: bool = False) -> Iterable[HalfEdge]:
+    """
+    Yield the half-edges in the boundary loop.
+    The default walk keeps no bookkeeping – a broken ring is for
+    `DCEL.validate()` to find.  checked=True aborts on a broken ring.
+    """
+    walk = _iterate_half_edges_checked(start) if checked else _iterate_half_edges(start)
+    if _STATS is not None:
+        return _STATS.counted(walk)
+    return walk
+
+
+def _iterate_half_edges(start: HalfEdge) -> Iterable[HalfEdge]:
+    he = start
+    while True:
+        yield he
+        he = he.next
+        if he is start:
+            return
+
+
+def _iterate_half_edges_checked(start: HalfEdge) -> Iterable[HalfEdge]:
     he = start
     first = True
     visited = set()
@@ -248,117 +451,128 @@ def iterate_half_edges(start: HalfEdge) -> Iterable[HalfEdge]:
         raise RuntimeError("broken ring (next is None)")
 
 
-def _is_vertical(e: HalfEdge)   -> bool: return e.origin.x == e.twin.origin.x
-def _is_horizontal(e: HalfEdge) -> bool: return e.origin.y == e.twin.origin.y
+# ------------------------------------------------------------
+#  instrumentation  (off unless a SlabStats is passed in)
+# ------------------------------------------------------------
+class SlabStats:
+    """
+    Wall time and hot-path counters per stage:
+        split_edge    DCEL.split_edge calls
+        add_diagonal  DCEL.add_diagonal calls
+        ring_steps    half-edges visited by ring walks (iterate_half_edges
+                      and the new ring painted by add_diagonal)
+        edge_lookups  DCEL.edge_from_vertex_in_face / corner_toward calls
+    bit_sizes=True also keeps a be_alg.bitsize report of the coordinates
+    after every stage, in `bits`.
+    `to_json()` gives a flat record for comparing runs.
+    """
+    COUNTERS = ("split_edge", "add_diagonal", "ring_steps", "edge_lookups")
+    __slots__ = ("stages", "_current", "bits")
+
+    def __init__(self, bit_sizes: bool = False):
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self._current: Dict[str, float] = {}
+        self.bits: Optional[Dict[str, BitSizeReport]] = {} if bit_sizes else None
+
+    def begin(self, stage: str) -> None:
+        self._current = self.stages.setdefault(
+            stage, dict.fromkeys(self.COUNTERS, 0) | {"seconds": 0.0})
+
+    def count(self, name: str, k: int = 1) -> None:
+        self._current[name] += k
+
+    def counted(self, walk: Iterable[HalfEdge]) -> Iterable[HalfEdge]:
+        for he in walk:
+            self._current["ring_steps"] += 1
+            yield he
+
+    def totals(self) -> Dict[str, float]:
+        out = dict.fromkeys(self.COUNTERS, 0) | {"seconds": 0.0}
+        for row in self.stages.values():
+            for k, v in row.items():
+                out[k] += v
+        return out
+
+    def to_dict(self) -> dict:
+        out = {"stages": self.stages, "totals": self.totals()}
+        if self.bits is not None:
+            out["bit_sizes"] = {stage: r.to_dict() for stage, r in self.bits.items()}
+        return out
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+_STATS: Optional[SlabStats] = None          # set only while a stage is instrumented
+
+
+def run_stage(dcel: DCEL, name: str, stage, stats: Optional[SlabStats] = None,
+              **kwargs) -> None:
+    """Run `stage(dcel, **kwargs)`; with `stats`, time and count it as `name`."""
+    if stats is None:
+        stage(dcel, **kwargs)
+        return
+    with _instrumented(dcel, stats):
+        stats.begin(name)
+        t0 = time.perf_counter()
+        stage(dcel, **kwargs)
+        stats.count("seconds", time.perf_counter() - t0)
+    if stats.bits is not None:
+        stats.bits[name] = bit_sizes(dcel)
+
+
+@contextmanager
+def _instrumented(dcel: DCEL, stats: SlabStats):
+    """
+    Shadow the DCEL methods with counting wrappers on this instance only,
+    so an uninstrumented run executes exactly the plain code.
+    """
+    global _STATS
+    split_edge, add_diagonal, lookup, corner = (
+        dcel.split_edge, dcel.add_diagonal, dcel.edge_from_vertex_in_face,
+        dcel.corner_toward)
+
+    def counting_split_edge(he, x, y):
+        stats.count("split_edge")
+        return split_edge(he, x, y)
+
+    def counting_add_diagonal(face, v1, v2):
+        stats.count("add_diagonal")
+        f1, f2 = add_diagonal(face, v1, v2)
+        stats.count("ring_steps", f2.n_edges)
+        return f1, f2
+
+    def counting_lookup(v, f, toward=None):
+        stats.count("edge_lookups")
+        return lookup(v, f, toward)
+
+    def counting_corner(v, t):
+        stats.count("edge_lookups")
+        return corner(v, t)
+
+    dcel.split_edge = counting_split_edge
+    dcel.add_diagonal = counting_add_diagonal
+    dcel.edge_from_vertex_in_face = counting_lookup
+    dcel.corner_toward = counting_corner
+    _STATS = stats
+    try:
+        yield
+    finally:
+        _STATS = None
+        del dcel.split_edge, dcel.add_diagonal, dcel.edge_from_vertex_in_face
+        del dcel.corner_toward
+
 
 # ---- generic diagonal (used by split_open_slab) ----
-# ==== תיקון add_diagonal (רק 4 שורות מודגשות) ====
-# be_alg/slab_partition.py  -------------------------------------
-# be_alg/slab_partition.py  -------------------------------------
 def add_diagonal(dcel: DCEL, face: Face,
                  v1: Vertex, v2: Vertex) -> Tuple[Face, Face]:
     """
     Insert diagonal (v1,v2) inside 'face' and split it into two faces.
     Returns (face_left, face_right)  – the two faces that now share the
-    new diagonal (in arbitrary order).
-    """
-
-    # -- 0.  locate boundary edges that start at v1 , v2  inside 'face'
-    h1 = _find_edge_from_vertex_in_face(v1, face)   # v1 → …  in F
-    h2 = _find_edge_from_vertex_in_face(v2, face)   # v2 → …  in F
-
-    # save their current predecessors BEFORE we touch anything
-    h1_prev = h1.prev
-    h2_prev = h2.prev
-
-    # -- 1.  create the two half-edges of the new diagonal
-    e1, e2 = HalfEdge(), HalfEdge()     # e1 : v1→v2 ,  e2 : v2→v1
-    e1.origin, e2.origin = v1, v2
-    e1.twin,   e2.twin   = e2, e1
-    dcel.half_edges.extend([e1, e2])
-
-    # -- 2.  splice e1 between h1_prev ↔ h2
-    e1.prev = h1_prev
-    e1.next = h2
-    h1_prev.next = e1
-    h2.prev = e1
-
-    # -- 3.  splice e2 between h2_prev ↔ h1
-    e2.prev = h2_prev
-    e2.next = h1
-    h2_prev.next = e2
-    h1.prev = e2
-
-    # -- 4.  build the new face  (all half-edges reachable from e1)
-    new_face = Face()
-    dcel.faces.append(new_face)
-
-    # flood-fill two rings → assign 'face' / 'new_face'
-    def paint(start: HalfEdge, f: Face):
-        he = start
-        while True:
-            he.face = f
-            he = he.next
-            if he is start:
-                break
-
-    paint(e1, new_face)   # ring #1
-    paint(e2, face)       # ring #2   (shrunk original face)
-
-    new_face.outer = e1
-    if face.outer in {h1, h2}:          # outer pointer might cross to other ring
-        face.outer = e2
-
-    # (optionally) set incident pointer of the vertices
-    if v1.incident is None or v1.incident.face is face:
-        v1.incident = e1
-    if v2.incident is None or v2.incident.face is face:
-        v2.incident = e2
-
-    return face, new_face
-
-    # נהל שתי טבעות: אחת שמתחילה ב-e1, ואחת ב-e2
-    def flood_fill(start: HalfEdge, f: Face):
-        he = start
-        while True:
-            he.face = f
-            he = he.next
-            if he is start:
-                break
-
-    flood_fill(e1, new_face)   # הטבעת החדשה
-    flood_fill(e2, face)       # הטבעת שנותרה ב-face הישן
-
-    # קבע outer כלשהו לפאות
-    new_face.outer = e1
-    if face.outer in {h1, h2}:
-        face.outer = e2        # outer של הפאה המקורית אולי השתנה
-
-    return face, new_face
-
-
-# ------------------------------------------------------------
-#  clean  _find_edge_from_vertex_in_face
-# ------------------------------------------------------------
-def _find_edge_from_vertex_in_face(v: Vertex, f: Face) -> HalfEdge:
-    """
-    Return a half-edge whose origin is v and whose face is f.
-    Raise ValueError if none exists.
+    new diagonal (in arbitrary order).  See `DCEL.add_diagonal`.
     """
-    he0 = v.incident
-    if he0 is None:
-        raise ValueError("vertex has no incident edge")
+    return dcel.add_diagonal(face, v1, v2)
 
-    he = he0
-    first = True
-    while first or he is not he0:
-        first = False
-        if he.face is f:
-            return he
-        he = he.twin.next
-        if he is None:
-            raise ValueError("broken DCEL (next is None)")
-    raise ValueError("vertex not incident to given face")
 
 # ------------------------------------------------------------
 #  demo / debug
@@ -0,0 +1,300 @@
+# ------------------------------------------------------------
+#  src/be_alg/subdivision.py
+#  boundary + constraint segments  →  DCEL link arrays, one sweep
+# ------------------------------------------------------------
+"""
+`build_subdivision` turns a region boundary and its constraint segments
+into the flat arrays of be_alg.dcel_io; DCEL.from_instance and
+ArrayDCEL.from_instance assemble their own layout from them.
+
+    1. sweep   left to right over the points, keeping the non-vertical
+               segments that cross the sweep line sorted by y (a treap,
+               be_alg.treap).
+               A constraint component that does not touch the boundary
+               would be a hole, which a Face cannot hold, so at its
+               leftmost vertex it gets a vertical bridge down to the
+               first segment or point below – part of the vertical cut
+               add_vertical_cuts makes through that vertex anyway.
+    2. rotate  sort the edges around every vertex by angle; the edge
+               after u→w is the one leaving w just clockwise of w→u.
+    3. faces   walk the next-cycles, filling counters, stars and
+               incident edges on the way.
+
+Segments may only touch at endpoints (as in a valid Cgshop2025Instance).
+Isolated points stay isolated unless a bridge ends on them.  Without
+constraints the arrays equal those of from_polygon, half-edge for
+half-edge.  O((n + k) log n) for n points and k constraints.
+
+`link_edges` runs steps 2 and 3 alone on a connected plane graph that
+needs no bridging – a triangulation, the edges of a Cgshop2025Solution –
+in O(E log deg).
+"""
+from __future__ import annotations
+
+from array import array
+from itertools import groupby
+from typing import Dict, List, Sequence, Tuple
+
+from be_alg import dcel_io
+from be_alg.number_backend import approx
+from be_alg.treap import Treap
+
+NIL = -1
+
+Edge = Tuple[int, int]
+
+
+def build_subdivision(xs: list, ys: list, boundary: Sequence[int],
+                      constraints: Sequence[Sequence[int]] = ()
+                      ) -> Tuple[list, list, Dict[str, array], int]:
+    """
+    xs, ys      – exact point coordinates (already in the number backend).
+    boundary    – CCW index ring, as for from_polygon.
+    constraints – index pairs; repeats and boundary edges are dropped.
+    Return (xs, ys, sections, outer face).  xs / ys are new lists with
+    the bridge feet appended as Steiner points.
+    """
+    xs, ys = list(xs), list(ys)
+    n = len(boundary)
+    edges: List[Edge] = [(boundary[i], boundary[(i + 1) % n]) for i in range(n)]
+    seen = {frozenset(e) for e in edges}
+    for a, b in constraints:
+        if frozenset((a, b)) not in seen:
+            seen.add(frozenset((a, b)))
+            edges.append((a, b))
+
+    bridges, feet = _bridge_components(xs, ys, edges, boundary[0])
+    sections, outer = _link(xs, ys, _split_at_feet(xs, edges, feet) + bridges)
+    return xs, ys, sections, outer
+
+
+def link_edges(xs: list, ys: list, edges: Sequence[Sequence[int]]
+               ) -> Tuple[Dict[str, array], int]:
+    """
+    Sections and outer face of a connected plane straight-line graph on
+    the points xs / ys; `edges` are undirected index pairs, repeats are
+    dropped.  Raise ValueError for loops or a disconnected graph.
+    """
+    seen = set()
+    unique: List[Edge] = []
+    for a, b in edges:
+        if a == b:
+            raise ValueError(f"edge ({a}, {b}) is a loop")
+        e = (a, b) if a < b else (b, a)
+        if e not in seen:
+            seen.add(e)
+            unique.append(e)
+    if not unique:
+        raise ValueError("no edges")
+
+    # the outer face lies right of the most clockwise edge out of the
+    # leftmost (lowest) vertex – left of its half-edge coming back in
+    used = {v for e in unique for v in e}
+    v0 = min(used, key=lambda v: (xs[v], ys[v]))
+
+    def clockwise(j: int) -> tuple:
+        w = unique[j][0] + unique[j][1] - v0
+        if xs[w] == xs[v0]:                 # straight up (no int 0: FieldNumber)
+            return (True, 0)
+        return (False, (ys[w] - ys[v0]) / (xs[w] - xs[v0]))
+
+    j0 = min((j for j, e in enumerate(unique) if v0 in e), key=clockwise)
+    sections, _ = _link(xs, ys, unique)
+    outer = sections["he_face"][j0 if unique[j0][1] == v0 else len(unique) + j0]
+
+    # Euler: a connected plane graph has E − V + 2 faces, every further
+    # component adds the walk around it as a face with a hole
+    if len(sections["f_outer"]) != len(unique) - len(used) + 2:
+        raise ValueError("the edges do not form a connected graph")
+    return sections, outer
+
+
+# ---------- 1. sweep ----------
+def _bridge_components(xs: list, ys: list, edges: List[Edge], anchor: int
+                       ) -> Tuple[List[Edge], Dict[int, List[int]]]:
+    """
+    Vertical bridges that tie every component to the one of `anchor`.
+    Return (bridges, {edge index: feet on it}); the feet are appended
+    to xs / ys.
+    """
+    parent = list(range(len(xs)))
+
+    def find(v: int) -> int:
+        while parent[v] != v:
+            parent[v] = parent[parent[v]]
+            v = parent[v]
+        return v
+
+    degree = [0] * len(xs)
+    for a, b in edges:
+        parent[find(a)] = find(b)
+        degree[a] += 1
+        degree[b] += 1
+    attached = {find(anchor)}
+
+    # non-vertical edges, oriented left → right
+    left: Dict[int, int] = {}
+    right: Dict[int, int] = {}
+    slope: Dict[int, object] = {}
+    falling: Dict[int, object] = {}     # −slope; FieldNumber has no unary minus
+    for s, (a, b) in enumerate(edges):
+        if xs[a] != xs[b]:
+            if xs[b] < xs[a]:
+                a, b = b, a
+            left[s], right[s] = a, b
+            slope[s] = (ys[b] - ys[a]) / (xs[b] - xs[a])
+            falling[s] = (ys[a] - ys[b]) / (xs[b] - xs[a])
+
+    def y_at(s: int, x):
+        a = left[s]
+        return ys[a] + (x - xs[a]) * slope[s]
+
+    # coordinates of every number backend compare, but not all of them
+    # hash – events are sorted and grouped instead of bucketed
+    by_left = sorted(left, key=lambda s: xs[left[s]])
+    by_right = sorted(right, key=lambda s: xs[right[s]])
+    order = sorted(range(len(xs)), key=lambda v: (xs[v], ys[v]))
+    status = Treap()                    # segments across the line, by y
+    i_in = i_out = 0
+    bridges: List[Edge] = []
+    feet: Dict[int, List[int]] = {}
+
+    for x, group in groupby(order, key=xs.__getitem__):
+        group = list(group)
+
+        # a. segments ending on the line leave (ordered as just left of it)
+        while i_out < len(by_right) and xs[right[by_right[i_out]]] == x:
+            s = by_right[i_out]
+            i_out += 1
+            status.remove(s, key=lambda t: (y_at(t, x), falling[t]))
+
+        # b. the leftmost vertex of every loose component bridges down
+        for k, v in enumerate(group):
+            if degree[v] == 0 or find(v) in attached:
+                continue
+            top, j = v, k
+            while True:
+                s = status.last_below(ys[top], key=lambda t: y_at(t, x))
+                below = group[j - 1] if j else None
+                if s is not None and (below is None or y_at(s, x) > ys[below]):
+                    target = len(xs)
+                    xs.append(x)
+                    ys.append(y_at(s, x))
+                    parent.append(find(left[s]))
+                    degree.append(0)
+                    feet.setdefault(s, []).append(target)
+                elif below is not None:
+                    target = below
+                else:
+                    raise ValueError(f"point {v} lies outside the region boundary")
+                loose = degree[target] == 0 and target == below
+                bridges.append((target, top))
+                degree[target] += 1
+                degree[top] += 1
+                parent[find(top)] = find(target)
+                if not loose:
+                    break
+                top, j = target, j - 1      # isolated point: keep going down
+            attached.add(find(v))
+
+        # c. segments starting on the line enter (ordered as just right of it)
+        while i_in < len(by_left) and xs[left[by_left[i_in]]] == x:
+            s = by_left[i_in]
+            i_in += 1
+            status.insert(s, key=lambda t: (y_at(t, x), slope[t]))
+
+    return bridges, feet
+
+
+def _split_at_feet(xs: list, edges: List[Edge], feet: Dict[int, List[int]]
+                   ) -> List[Edge]:
+    """Replace every edge with feet by its pieces, keeping its direction."""
+    out: List[Edge] = []
+    for s, (a, b) in enumerate(edges):
+        ms = feet.get(s)
+        if not ms:
+            out.append((a, b))
+            continue
+        ms.sort(key=xs.__getitem__, reverse=xs[b] < xs[a])
+        chain = [a, *ms, b]
+        out.extend(zip(chain, chain[1:]))
+    return out
+
+
+# ---------- 2 + 3. rotation system and faces ----------
+def _angle_key(x, y, wx, wy) -> tuple:
+    """
+    Exact sort key of the direction (x, y) → (wx, wy) by angle in
+    [0, 2π).  Only compares coordinates with coordinates, so it also
+    works for FieldNumber (no int mixing, no unary minus).
+    """
+    if wy == y:
+        return (0, 0, 0) if wx > x else (1, 0, 0)
+    return (0 if wy > y else 1, 1, (x - wx) / (wy - y))
+
+
+def _link(xs: list, ys: list, edges: List[Edge]) -> Tuple[Dict[str, array], int]:
+    """
+    Half-edge j runs along edges[j], half-edge m + j back (the
+    from_polygon layout).  The returned outer face is the one right of
+    edge 0, so that must be a CCW boundary edge.
+    """
+    m = len(edges)
+    origin = array("q", [a for a, _ in edges] + [b for _, b in edges])
+    twin = array("q", range(m, 2 * m)) + array("q", range(m))
+    nxt = array("q", [NIL]) * (2 * m)
+    prv = array("q", [NIL]) * (2 * m)
+
+    around: List[List[int]] = [[] for _ in xs]
+    for e, v in enumerate(origin):
+        around[v].append(e)
+    for v, es in enumerate(around):
+        x, y = xs[v], ys[v]
+        es.sort(key=lambda e: _angle_key(x, y, xs[origin[twin[e]]], ys[origin[twin[e]]]))
+        for k, e in enumerate(es):
+            t, after = twin[e], es[k - 1]           # just clockwise of v→u
+            nxt[t], prv[after] = after, t
+
+    vertical = [xs[origin[e]] == xs[origin[twin[e]]] for e in range(2 * m)]
+    horizontal = [ys[origin[e]] == ys[origin[twin[e]]] for e in range(2 * m)]
+    face = array("q", [NIL]) * (2 * m)
+    f_outer, f_edges, f_vertical, f_horizontal = (array("q") for _ in range(4))
+    for e0 in range(2 * m):
+        if face[e0] != NIL:
+            continue
+        f, e = len(f_outer), e0
+        n_e = n_v = n_h = 0
+        while True:
+            face[e] = f
+            n_e += 1
+            n_v += vertical[e]
+            n_h += horizontal[e]
+            e = nxt[e]
+            if e == e0:
+                break
+        f_outer.append(e0)
+        f_edges.append(n_e)
+        f_vertical.append(n_v)
+        f_horizontal.append(n_h)
+
+    # same incident choice (and star order) as from_polygon
+    incident = array("q", [NIL]) * len(xs)
+    stars: List[Dict[int, int]] = [{} for _ in xs]
+    for j in range(m):
+        for e in (j, m + j):
+            v = origin[e]
+            if incident[v] == NIL:
+                incident[v] = e
+            stars[v].setdefault(face[e], e)
+
+    sections = {
+        "he_origin": origin, "he_twin": twin, "he_next": nxt, "he_prev": prv,
+        "he_face": face, "f_outer": f_outer,
+        "f_type": array("q", [NIL]) * len(f_outer),
+        "f_edges": f_edges, "f_vertical": f_vertical, "f_horizontal": f_horizontal,
+        "v_incident": incident,
+        "vfx": array("d", map(approx, xs)), "vfy": array("d", map(approx, ys)),
+    }
+    sections["star_off"], sections["star_face"], sections["star_edge"] = \
+        dcel_io.encode_stars(star.items() for star in stars)
+    return sections, face[m]
@@ -0,0 +1,244 @@
+# ------------------------------------------------------------
+#  src/be_alg/treap.py
+#  randomized balanced search tree for the sweep / index structures
+# ------------------------------------------------------------
+"""
+A treap: a binary search tree in key order whose nodes also form a
+heap on random priorities, so insert / remove / search take expected
+O(log n) whatever the insertion order – unlike bisect.insort on a
+list, which is O(n) per update.
+
+By default keys are not stored.  They are computed from the items when
+the tree is searched, either by the class's `key` or by a `key=` passed to the
+call.  So the subdivision sweep can order its segments by their y at
+the current sweep line: that order does not change while a segment is
+in the tree, but its keys do.
+
+A subclass may set `aggregate` (item → comparable).  Every node then
+keeps in `top` the largest aggregate of its subtree, which lets a
+search skip whole subtrees (the interval tree of
+be_alg.face_index.VerticalEdgeIndex).  With `fixed_keys` the class key
+and the aggregate of an item are taken once, when its node is made –
+for items whose key cannot change while they are in the tree.
+"""
+from __future__ import annotations
+
+import random
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+_RNG = random.Random(0x7E4B)
+
+
+class Node:
+    __slots__ = ("item", "prio", "left", "right", "key", "own", "top")
+
+    def __init__(self, item, key=None, own=None):
+        self.item = item
+        self.prio = _RNG.random()
+        self.left: Optional[Node] = None
+        self.right: Optional[Node] = None
+        self.key = key              # cached key / aggregate (fixed_keys)
+        self.own = own
+        self.top = own
+
+
+class Treap:
+    __slots__ = ("root", "size")
+    key: Optional[Callable[[Any], Any]] = None
+    aggregate: Optional[Callable[[Any], Any]] = None
+    fixed_keys = False
+
+    def __init__(self, items: Iterable = (), key=None):
+        """`items` in any order; they are sorted by `key` (or the class key)."""
+        self.root: Optional[Node] = None
+        self.size = 0
+        if self.fixed_keys:             # one key per item, sorted with it
+            nodes = sorted(map(self._node, items), key=_node_key)
+        else:
+            nodes = sorted(items, key=key or self.key)
+            nodes = list(map(self._node, nodes))
+        if nodes:
+            self._build(nodes)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator:
+        stack: List[Node] = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.item
+            node = node.right
+
+    # ---------- updates ----------
+    def insert(self, item, key=None) -> None:
+        """Insert after the items with an equal key."""
+        key = key or self.key
+        new = self._node(item)
+        k = new.key if self.fixed_keys else key(item)
+        path, node = [], self.root
+        while node is not None and node.prio > new.prio:
+            right = not k < self._key(node, key)
+            path.append((node, right))
+            node = node.right if right else node.left
+        new.left, new.right = self._split(node, k, key, True)
+        self._replace(path, self._pull(new))
+        self.size += 1
+
+    def remove(self, item, key=None) -> None:
+        """
+        Remove `item` – not just any item with an equal key, but one that
+        == it (for objects without __eq__: itself); ValueError if absent.
+        """
+        key = key or self.key
+        k = key(item)
+        path, node = [], self.root
+        while node is not None:
+            nk = self._key(node, key)
+            if nk < k:
+                path.append((node, True))
+                node = node.right
+            elif k < nk:
+                path.append((node, False))
+                node = node.left
+            else:
+                break
+        if node is not None and node.item == item:
+            self._replace(path, self._merge(node.left, node.right))
+            self.size -= 1
+            return
+        # equal keys may sit on both sides of `node`: cut them all out
+        left, rest = self._split(self.root, k, key, False)
+        equal, right = self._split(rest, k, key, True)
+        items = self._items(equal)
+        at = next((i for i, x in enumerate(items) if x == item), None)
+        kept = items if at is None else items[:at] + items[at + 1:]
+        if len(kept) < len(items):
+            equal = None
+            for x in kept:
+                equal = self._merge(equal, self._node(x))
+            self.size -= 1
+        self.root = self._merge(self._merge(left, equal), right)
+        if len(kept) == len(items):
+            raise ValueError("item is not in the treap")
+
+    # ---------- searches ----------
+    def last_below(self, value, key=None):
+        """The last item whose key is < value, or None."""
+        key = key or self.key
+        node, best = self.root, None
+        fixed = self.fixed_keys
+        while node is not None:
+            if (node.key if fixed else key(node.item)) < value:
+                best, node = node.item, node.right
+            else:
+                node = node.left
+        return best
+
+    # ---------- internals ----------
+    def _node(self, item) -> Node:
+        agg = self.aggregate
+        if self.fixed_keys:
+            return Node(item, self.key(item), None if agg is None else agg(item))
+        return Node(item, None, None if agg is None else agg(item))
+
+    def _key(self, node: Node, key):
+        return node.key if self.fixed_keys else key(node.item)
+
+    def _replace(self, path: list, sub: Optional[Node]) -> None:
+        """Hang `sub` below the end of `path` and refresh the path's aggregates."""
+        if not path:
+            self.root = sub
+            return
+        parent, right = path[-1]
+        if right:
+            parent.right = sub
+        else:
+            parent.left = sub
+        if self.aggregate is not None:
+            for node, _ in reversed(path):
+                self._pull(node)
+
+    def _pull(self, node: Node) -> Node:
+        if self.aggregate is not None:
+            top = node.own
+            left, right = node.left, node.right
+            if left is not None and left.top > top:
+                top = left.top
+            if right is not None and right.top > top:
+                top = right.top
+            node.top = top
+        return node
+
+    def _split(self, node: Optional[Node], value, key, right_of_equal: bool):
+        """
+        (items with key < value, the rest); with right_of_equal the
+        items equal to value go left.
+        """
+        if node is None:
+            return None, None
+        k = node.key if self.fixed_keys else key(node.item)
+        if k < value or (right_of_equal and not value < k):
+            a, b = self._split(node.right, value, key, right_of_equal)
+            node.right = a
+            return self._pull(node), b
+        a, b = self._split(node.left, value, key, right_of_equal)
+        node.left = b
+        return a, self._pull(node)
+
+    def _merge(self, a: Optional[Node], b: Optional[Node]) -> Optional[Node]:
+        """Every item of a precedes every item of b."""
+        if a is None:
+            return b
+        if b is None:
+            return a
+        if a.prio > b.prio:
+            a.right = self._merge(a.right, b)
+            return self._pull(a)
+        b.left = self._merge(a, b.left)
+        return self._pull(b)
+
+    def _build(self, nodes: List[Node]) -> None:
+        """Cartesian tree of nodes in key order in O(n) (one stack pass)."""
+        spine: List[Node] = []
+        for node in nodes:
+            last = None
+            while spine and spine[-1].prio < node.prio:
+                last = spine.pop()
+            node.left = last
+            if spine:
+                spine[-1].right = node
+            spine.append(node)
+        self.root = spine[0]
+        self.size = len(nodes)
+        if self.aggregate is not None and len(nodes) > 1:
+            self._pull_all(self.root)
+
+    def _pull_all(self, root: Node) -> None:
+        order, stack = [], [root]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(c for c in (node.left, node.right) if c is not None)
+        for node in reversed(order):
+            self._pull(node)
+
+    @staticmethod
+    def _items(node: Optional[Node]) -> list:
+        out, stack = [], []
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            out.append(node.item)
+            node = node.right
+        return out
+
+
+def _node_key(node: Node):
+    return node.key
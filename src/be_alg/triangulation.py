@@ -0,0 +1,529 @@
+# ------------------------------------------------------------
+#  src/be_alg/triangulation.py
+#  Stage 4 : classified faces → triangles
+# ------------------------------------------------------------
+"""
+refine_faces leaves every inner face with a FaceType.  This stage
+first adds the Steiner points the faces need, then groups the faces by
+type and runs one plan per group: a list of CCW ring-position
+triangles, handed to `dcel.triangulate_face`, which wires the whole
+face in one pass instead of one add_diagonal (and one ring repaint)
+per diagonal.
+
+    column points          a level of one column is put on the opposite
+                           column of the same face (a horizontal ray, see
+                           `_add_column_points`) only where the face's
+                           own zip would take an obtuse triangle at it.
+                           split_edge keeps both faces of a vertical edge
+                           valid; the point is a new level of the face
+                           behind it, which is checked the same way – a
+                           face that can zip around the level stops the
+                           ray.  No new y values are made, so this ends.
+    corner points          where a sloped edge borders the outer face and
+                           one column has levels beyond the other column's
+                           end, each level gets a point on that edge
+                           (`_add_corner_points`) – the corner is cut into
+                           right triangles instead of a fan.  When the
+                           columns do not share a height at all, both
+                           corners are cut and the quad between them split.
+    RIGHT_TRI              already triangles – untouched
+    RECTANGLE              the same plan for all: (0,1,2) (0,2,3) – two
+                           right triangles, typed without looking
+    OBTUSE_TRI             refine's catch-all: vertical trapezoids.
+                           The corners as above, the rest zipped bottom-up
+                           between the two columns, every step taking the
+                           candidate triangle that is not obtuse (else the
+                           lower one).
+    altitudes              a triangle obtuse at a column vertex whose
+                           opposite side borders the outer face is split
+                           at the altitude foot – two right triangles.
+
+What stays obtuse (typed OBTUSE_TRI, so it can be found later): the
+corner fans whose sloped edge is shared with another face (a point on
+it would be a level for that face as well), or is too flat for its
+levels – feet and ray hits on it do not leave pieces that split into
+non-obtuse triangles, and a plan has no points inside the face.  Faces
+of another shape (a ring that visits a vertex twice, more than two
+non-vertical edges) are left as they are.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from be_alg.dcel import DCEL, Face, Vertex
+from be_alg.face_types import FaceType
+from be_alg.predicates import is_vertical_filtered as _is_vertical
+from be_alg.slab_partition import iterate_half_edges
+
+Plan = Tuple[List[Tuple[int, int, int]], List[FaceType]]
+
+_RECTANGLE_PLAN: Plan = ([(0, 1, 2), (0, 2, 3)], [FaceType.RIGHT_TRI] * 2)
+
+
+def triangulate_faces(dcel: DCEL) -> int:
+    """
+    Triangulate every classified inner face; returns the number of faces
+    left as they were (see the module docstring).
+    """
+    faces = [f for f in dcel.faces if f is not dcel.outer_face and f.ftype is not None]
+    _add_column_points(dcel, faces)
+    _add_corner_points(dcel, faces)
+
+    batches: Dict[Optional[FaceType], List[Face]] = defaultdict(list)
+    for f in faces:
+        if f.n_edges == 3:
+            if f.ftype is FaceType.OBTUSE_TRI:
+                dcel.set_ftype(f, triangle_type(*(he.origin for he in iterate_half_edges(f.outer))))
+            batches[f.ftype].append(f)
+        elif f.ftype is FaceType.RECTANGLE and f.n_edges == 4:
+            batches[FaceType.RECTANGLE].append(f)
+        else:                   # a trapezoid, or a rectangle / triangle with column points
+            batches[None].append(f)
+
+    skipped = 0
+    for f in batches[FaceType.RECTANGLE]:
+        _apply(dcel, f, list(iterate_half_edges(f.outer)), _RECTANGLE_PLAN)
+    obtuse = batches[FaceType.OBTUSE_TRI]
+    for f in batches[None]:
+        ring = list(iterate_half_edges(f.outer))
+        plan = _trapezoid_plan(ring)
+        if plan is None:
+            skipped += 1
+            continue
+        for g, t in zip(_apply(dcel, f, ring, plan), plan[1]):
+            if t is FaceType.OBTUSE_TRI:
+                obtuse.append(g)
+    for f in obtuse:
+        _drop_altitude(dcel, f)
+    return skipped
+
+
+def _add_column_points(dcel: DCEL, faces: List[Face]) -> None:
+    """
+    Give every trapezoid (exactly two non-vertical edges) the column
+    points its own zip needs (`_needed_column_points`): a horizontal ray
+    from the level splits the opposite column there.  The face behind
+    that column has a new level and is checked the same way; a face
+    whose zip comes out without such a need stops the ray.
+    """
+    outer = dcel.outer_face
+    queue = [f for f in faces if f.n_edges - f.n_vertical == 2]
+    queued = set(queue)
+    while queue:
+        f = queue.pop()
+        queued.discard(f)
+        for v, right in _needed_column_points(f, outer):
+            if right:
+                hit = f.verticals.first_hit_right(v.x, v.y)
+            else:
+                hit = f.verticals.first_hit_left(v.x, v.y)
+            behind = hit.twin.face
+            dcel.split_edge(hit, hit.origin.x, v.y)
+            if (behind is not outer and behind.ftype is not None and behind not in queued
+                    and behind.n_edges - behind.n_vertical == 2):
+                queue.append(behind)
+                queued.add(behind)
+
+
+def _needed_column_points(face: Face, outer: Face) -> list:
+    """
+    (vertex, True if the column lies to its right) for each column point
+    the face needs: the far end of a corner (`_corners`) whose column
+    has levels beyond that end but none at its height –
+    `_add_corner_points` starts from there – and a column level of an
+    obtuse triangle in the zip that falls between two levels of the
+    opposite column.  Each level found is put on a copy of the columns
+    and the zip is run again, so a level that the ones below make
+    harmless asks for nothing.
+    """
+    ring = list(iterate_half_edges(face.outer))
+    shape = _outline(ring)
+    if shape is None or len(shape[2]) != 2 or len(shape[3]) != 2:
+        return []
+    left, right = ([ring[p].origin for p in col] for col in shape[:2])
+    needs = []
+
+    def put(v, col) -> int:
+        """A level of col at v.y, in y order; returns its index."""
+        needs.append((v, v.x < col[0].x))
+        at = next(q for q, w in enumerate(col) if v.y < w.y)
+        col.insert(at, Vertex(col[0].x, v.y))
+        return at
+
+    for _, corner, end, legs, free in _corners(ring, outer):
+        if free and legs and not any(v.y == end.y for v in legs) and \
+                (corner.y < end.y) == (end.y < legs[-1].y):
+            put(end, left if corner.x == left[0].x else right)
+    types: Dict[tuple, FaceType] = {}
+
+    def kind(tri):
+        t = types.get(tri)
+        if t is None:
+            t = types[tri] = triangle_type(*tri)
+        return t
+
+    states = [(0, 0)]                   # the zip's (i, j) before each step
+    while True:
+        i, j = states[-1]
+        for tri, t, i, j in _zip(left, right, i, j, len(left) - 1, len(right) - 1,
+                                 kind, lambda v: v):
+            states.append((i, j))
+            if t is not FaceType.OBTUSE_TRI:
+                continue
+            v = next((v for v in tri if _between(v, right if v.x == left[0].x else left)), None)
+            if v is not None:
+                side = 0 if v.x == right[0].x else 1
+                at = put(v, left if side == 0 else right)
+                # a step looks one level ahead: go back to the last one below `at - 1`
+                while len(states) > 1 and states[-1][side] > at - 2:
+                    states.pop()
+                break
+        else:
+            break
+    return needs
+
+
+def _between(v, col) -> bool:
+    """v's height falls strictly between two levels of col, and is none of them."""
+    return col[0].y < v.y < col[-1].y and not any(w.y == v.y for w in col)
+
+
+def _add_corner_points(dcel: DCEL, faces: List[Face]) -> None:
+    """
+    Split the sloped bottom / top edge of a trapezoid where it borders
+    the outer face and one column has levels beyond the other column's
+    end – the corner the zip would fan from the far corner.  Each such
+    level gets a point on the edge: the foot of its perpendicular or
+    its horizontal ray's hit, chosen so that every piece between two
+    levels splits into two non-obtuse triangles (`_corner_choice`).
+    When the two columns do not share a height, each corner takes its
+    whole column and the last level's point too; the pair of last
+    points is chosen so that the quad left between the corners splits
+    well as well.
+    """
+    outer = dcel.outer_face
+    for f in faces:
+        if f.n_edges - f.n_vertical != 2:
+            continue
+        ring = list(iterate_half_edges(f.outer))
+        cuts, ends = [], []
+        for he, corner, end, legs, free in _corners(ring, outer):
+            c = next((i for i, v in enumerate(legs) if v.y == end.y), None)
+            if c and free:
+                choices = _corner_choice(corner, end, legs[:c + 1], False)
+                if choices:
+                    cuts.append((he, corner, choices[0]))
+            elif not legs:                      # a column of one vertex: nothing to cut
+                ends.append((he, corner, end, [[(corner.x, corner.y)]]))
+            elif c is None and free and (corner.y < legs[-1].y) == (legs[-1].y < end.y):
+                ends.append((he, corner, end, _corner_choice(corner, end, legs, True)))
+        if len(ends) == 2:              # the columns lie one above the other
+            (he, a, b, below), (ge, c, d, above) = ends
+            pairs = [(p, q) for p in below for q in above]
+            good = [(p, q) for p, q in pairs
+                    if _closes_well([p[-1], (b.x, b.y), q[-1], (d.x, d.y)])]
+            p, q = (good or pairs or [(None, None)])[0]
+            if p is not None:
+                cuts += [(he, a, p[:-1] if p[-1] == (a.x, a.y) else p),
+                         (ge, c, q[:-1] if q[-1] == (c.x, c.y) else q)]
+        for he, corner, points in cuts:
+            if points:
+                dcel.split_edge_at(he, points if corner is he.origin else points[::-1])
+
+
+def _corners(ring: list, outer: Face):
+    """
+    (edge, corner, far end, the corner column's other levels from the
+    corner on, True if the edge borders the outer face) for the sloped
+    bottom / top edge of a trapezoid.  The corner is the end of the
+    edge that lies beyond the other column: the lower one for the
+    bottom edge, the higher one for the top.  Only an edge on the outer
+    face may take points.
+    """
+    shape = _outline(ring)
+    if shape is None:
+        return
+    left, right, bottom, top = shape
+    for chain, far in ((bottom, False), (top, True)):
+        he = ring[chain[0]]
+        a, b = he.origin, he.twin.origin
+        if len(chain) != 2 or a.y == b.y:
+            continue
+        col = left if a.y < b.y else right          # the corner's column
+        if far:
+            col = col[::-1]
+        corner = ring[col[0]].origin
+        yield (he, corner, (b if corner is a else a), [ring[q].origin for q in col[1:]],
+               he.twin.face is outer)
+
+
+def _corner_choice(a, b, levels, free: bool) -> list:
+    """
+    Points on the edge a → b for the column `levels` from a on: per
+    level the perpendicular foot or the horizontal hit, in order along
+    the edge, such that the corner triangle and every quad between two
+    levels split into non-obtuse triangles.  The last level is the one
+    at b's height, whose point is b itself; with `free` it is the top of
+    a column that ends before b and takes a point as well.  One list of
+    points (b left out) per way the last level can end – none if no
+    choice works.
+    """
+    ax, ay = a.x, a.y
+    dx, dy = b.x - ax, b.y - ay
+    n2 = dx * dx + dy * dy
+    t_end = dy / dy                         # 1 in the backend's numbers
+    options = []
+    for v in levels:
+        t_foot = ((v.x - ax) * dx + (v.y - ay) * dy) / n2
+        t_ray = (v.y - ay) / dy
+        options.append([(t, (ax + t * dx, ay + t * dy)) for t in (t_foot, t_ray)
+                        if t_end - t_end < t < t_end])
+    if not free:
+        options[-1] = [(t_end, (b.x, b.y))]
+    corner = (ax, ay)
+    points = [(v.x, v.y) for v in levels]
+
+    # best[k][o]: the option taken for the level before (-1 for the first),
+    # None if o cannot be reached
+    best = [[None] * len(o) for o in options]
+    for o, (t, q) in enumerate(options[0]):
+        if _non_obtuse(corner, q, points[0]):
+            best[0][o] = -1
+    for k in range(1, len(levels)):
+        for o, (t, q) in enumerate(options[k]):
+            for prev, (s, r) in enumerate(options[k - 1]):
+                if best[k - 1][prev] is not None and s < t and \
+                        _splits_well(points[k - 1], r, q, points[k]):
+                    best[k][o] = prev
+                    break
+    chosen = []
+    for last in range(len(options[-1])):
+        if best[-1][last] is None:
+            continue
+        picked, o = [], last
+        for k in range(len(levels) - 1, -1, -1):
+            picked.append(options[k][o][1])
+            o = best[k][o]
+        chosen.append(picked[::-1] if free else picked[:0:-1])
+    return chosen
+
+
+def _closes_well(quad: list) -> bool:
+    """`_splits_well` for a quad that may repeat a corner – then a non-obtuse triangle."""
+    corners = [p for k, p in enumerate(quad) if p != quad[k - 1]]
+    if len(corners) == 3:
+        return _non_obtuse(*corners)
+    return len(corners) == 4 and _splits_well(*corners)
+
+
+def _splits_well(a, b, c, d) -> bool:
+    """The quad a b c d is convex and one of its diagonals gives two non-obtuse triangles."""
+    turns = [_turn(p, q, r) for p, q, r in ((a, b, c), (b, c, d), (c, d, a), (d, a, b))]
+    if not (all(t > 0 for t in turns) or all(t < 0 for t in turns)):
+        return False
+    return (_non_obtuse(a, b, c) and _non_obtuse(a, c, d)) or \
+        (_non_obtuse(a, b, d) and _non_obtuse(b, c, d))
+
+
+def _turn(p, q, r) -> int:
+    left, right = (q[0] - p[0]) * (r[1] - p[1]), (q[1] - p[1]) * (r[0] - p[0])
+    return (left > right) - (left < right)
+
+
+def _non_obtuse(a, b, c) -> bool:
+    for p, q, r in ((a, b, c), (b, c, a), (c, a, b)):
+        if (q[0] - p[0]) * (r[0] - p[0]) < (p[1] - q[1]) * (r[1] - p[1]):
+            return False
+    return True
+
+
+def _drop_altitude(dcel: DCEL, face: Face) -> None:
+    """
+    Split an obtuse triangle whose longest side borders the outer face
+    at the foot of the altitude from its obtuse corner.
+    """
+    ring = list(iterate_half_edges(face.outer))
+    for p in range(3):
+        c, a, b = (ring[(p + i) % 3].origin for i in range(3))
+        if (a.x - c.x) * (b.x - c.x) < (c.y - a.y) * (b.y - c.y):    # obtuse at c
+            break
+    else:
+        return
+    side = ring[(p + 1) % 3]                                         # a → b
+    if side.twin.face is not dcel.outer_face:
+        return
+    dx, dy = b.x - a.x, b.y - a.y
+    t = ((c.x - a.x) * dx + (c.y - a.y) * dy) / (dx * dx + dy * dy)
+    foot = dcel.split_edge(side, a.x + t * dx, a.y + t * dy)
+    for g in dcel.add_diagonal(face, c, foot):
+        dcel.set_ftype(g, FaceType.RIGHT_TRI)
+
+
+def _apply(dcel: DCEL, face: Face, ring: list, plan: Plan) -> List[Face]:
+    triangles, types = plan
+    faces = dcel.triangulate_face(face, ring, triangles)
+    for g, t in zip(faces, types):
+        dcel.set_ftype(g, t)
+    return faces
+
+
+def _outline(ring: list) -> Optional[Tuple[list, list, list, list]]:
+    """
+    Ring positions of a face bounded by two vertical columns and two
+    x-monotone chains: (left, right) bottom → top, the bottom chain left
+    → right and the top chain right → left, corners included; None for
+    any other ring.  The ring is CCW, so the bottom chain runs left to
+    right, the right column goes up and the left one down.
+    """
+    k = len(ring)
+    if len({he.origin for he in ring}) != k:
+        return None
+    step = [0 if _is_vertical(he) else 1 if he.origin.x < he.twin.origin.x else -1
+            for he in ring]
+    starts = [p for p in range(k) if step[p] == 1 and step[p - 1] != 1]
+    if len(starts) != 1:
+        return None
+    order = [(starts[0] + p) % k for p in range(k)]
+    runs, p = [], 0                             # bottom, right, top, left edge runs
+    for want in (1, 0, -1, 0):
+        q = p
+        while q < k and step[order[q]] == want:
+            q += 1
+        runs.append(order[p:q + 1] if q < k else order[p:] + order[:1])
+        p = q
+    if p != k or len(runs[2]) < 2:
+        return None
+    bottom, right, top, left = runs
+    return left[::-1], right, bottom, top
+
+
+def _trapezoid_plan(ring: list) -> Optional[Plan]:
+    """
+    Zip a face bounded by two vertical columns, a bottom and a top edge
+    (see `_outline`).  The bottom / top chain may hold the points of
+    `_add_corner_points`: then the corner is cut into the triangles and
+    quads between the column levels and those points, and the zip runs
+    between the columns from the level of the far corner on.
+    """
+    shape = _outline(ring)
+    if shape is None:
+        return None
+    left, right, bottom, top = shape
+    pt = [he.origin for he in ring]
+    triangles, types = [], []
+
+    def add(tri):
+        triangles.append(tuple(sorted(tri)))
+        types.append(triangle_type(*(pt[p] for p in tri)))
+
+    i, j = 0, 0                                  # where the zip starts and ends
+    i_end, j_end = len(left) - 1, len(right) - 1
+    apart = pt[left[-1]].y < pt[right[0]].y or pt[right[-1]].y < pt[left[0]].y
+    middle = []
+    for chain, far in ((bottom, False), (top, True)):
+        inner = chain[1:-1]
+        a, b = chain[0], chain[-1]
+        low_left = pt[a].y < pt[b].y
+        col = left if low_left else right
+        if far:
+            col = col[::-1]
+        if col[0] != a:
+            inner, a, b = inner[::-1], b, a
+        if apart:                                # the corner takes its whole column
+            if len(inner) != len(col) - 1:
+                break
+            c, hyp = len(inner), [a] + inner
+            middle += [hyp[-1], b]
+        elif not inner:
+            continue
+        else:
+            c = next((q for q, p in enumerate(col) if pt[p].y == pt[b].y), None)
+            if c != len(inner) + 1:
+                return None
+            hyp = [a] + inner + [b]
+        if any(_turn((pt[a].x, pt[a].y), (pt[b].x, pt[b].y), (pt[p].x, pt[p].y))
+               for p in inner):
+            return None
+        legs = col[:c + 1]
+        if c:
+            add((legs[0], hyp[1], legs[1]))
+        for q in range(1, c):
+            w, x, y, z = legs[q], hyp[q], hyp[q + 1], legs[q + 1]
+            pair = [(w, x, y), (w, y, z)]
+            if any(triangle_type(*(pt[p] for p in t)) is FaceType.OBTUSE_TRI for t in pair):
+                pair = [(w, x, z), (x, y, z)]
+            for t in pair:
+                add(t)
+        at = len(col) - 1 - c if far else c
+        if far:
+            i_end, j_end = (at, j_end) if low_left else (i_end, at)
+        else:
+            i, j = (at, j) if low_left else (i, at)
+    else:
+        if apart:                               # the quad between the two corners
+            quad = [p for k, p in enumerate(middle) if p != middle[k - 1]]
+            if len(quad) == 3:
+                add(tuple(quad))
+            elif len(quad) == 4:
+                w, x, y, z = quad
+                pair = [(w, x, y), (w, y, z)]
+                if any(triangle_type(*(pt[p] for p in t)) is FaceType.OBTUSE_TRI for t in pair):
+                    pair = [(w, x, z), (x, y, z)]
+                for t in pair:
+                    add(t)
+            return triangles, types
+    if apart and triangles:
+        return None
+    for tri, t, _, _ in _zip(left, right, i, j, i_end, j_end,
+                             lambda tri: triangle_type(*(pt[p] for p in tri)), lambda p: pt[p]):
+        triangles.append(tuple(sorted(tri)))
+        types.append(t)
+    return triangles, types
+
+
+def _zip(left, right, i, j, i_end, j_end, kind, point):
+    """
+    The zip from levels (i, j) of the two columns up to (i_end, j_end):
+    (triangle, type, i, j after the step), each step taking the
+    candidate that is not obtuse, else the one with the lower apex.  `kind` types a triangle
+    of column items, `point` gives an item's vertex.
+    """
+    while i < i_end or j < j_end:
+        options = []
+        if i < i_end:
+            options.append(((left[i], right[j], left[i + 1]), i + 1, j))
+        if j < j_end:
+            options.append(((left[i], right[j], right[j + 1]), i, j + 1))
+        scored = []
+        for tri, ni, nj in options:
+            t = kind(tri)
+            apex = point(tri[2])
+            scored.append(((t is FaceType.OBTUSE_TRI, apex.fy, apex.y), tri, t, ni, nj))
+        _, tri, t, i, j = min(scored, key=lambda s: s[0])
+        yield tri, t, i, j
+
+
+def triangle_type(a, b, c) -> FaceType:
+    """
+    OBTUSE_TRI, or RIGHT_TRI for every other triangle abc – acute ones
+    included, the stages only need to tell the obtuse ones apart.  A corner's
+    dot product is taken from the float images when it clears their
+    rounding error (the bound of dcel._in_corner), exactly otherwise –
+    mostly the axis-parallel right angles.  The exact test compares the
+    two products of the dot product with each other, so it needs no
+    backend zero (FieldNumber does not compare with int).
+    """
+    m = max(abs(a.fx), abs(a.fy), abs(b.fx), abs(b.fy), abs(c.fx), abs(c.fy))
+    tol = 7.2e-15 * m * m
+    for p, q, r in ((a, b, c), (b, c, a), (c, a, b)):
+        d = (q.fx - p.fx) * (r.fx - p.fx) + (q.fy - p.fy) * (r.fy - p.fy)
+        if abs(d) > tol:
+            if d < 0:
+                return FaceType.OBTUSE_TRI
+            continue
+        along_x = (q.x - p.x) * (r.x - p.x)
+        against_y = (p.y - q.y) * (r.y - p.y)             # −(y part)
+        if along_x < against_y:
+            return FaceType.OBTUSE_TRI
+    return FaceType.RIGHT_TRI
@@ -1,17 +1,107 @@
 from __future__ import annotations
-from fractions import Fraction
-import matplotlib
-matplotlib.use("TkAgg")         # חייב לבוא לפני import pyplot
-import matplotlib.pyplot as plt
-from matplotlib.lines import Line2D
 
-from be_alg.dcel import DCEL, HalfEdge
+import os
+import sys
+from typing import Tuple
+
+import numpy as np
+
+from be_alg.dcel import DCEL
+from be_alg.export import edge_endpoints
 #from cgshop2025_pyutils.io.instance import read_instance   # רק אם רוצים show_problem
 
+# matplotlib is imported on first use: a worker that only partitions never
+# pays for it, and without a display it gets Agg instead of TkAgg.
+EDGE_COLORS = {"vertical": "darkorange", "horizontal": "royalblue", "other": "lightgray"}
+
+
+def _pyplot():
+    """pyplot on TkAgg when a display is there (MPLBACKEND wins), else Agg."""
+    if "matplotlib.pyplot" not in sys.modules:
+        import matplotlib
+        if not os.environ.get("MPLBACKEND"):
+            matplotlib.use(_display_backend() or "Agg")   # חייב לבוא לפני import pyplot
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _display_backend():
+    """
+    "TkAgg" if it can draw here, else None: on X11 / Wayland systems it
+    needs DISPLAY or WAYLAND_DISPLAY, everywhere it needs tkinter.
+    """
+    if sys.platform not in ("win32", "darwin") and not (
+            os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")):
+        return None
+    try:
+        import matplotlib.backends.backend_tkagg  # noqa: F401
+    except ImportError:
+        return None
+    return "TkAgg"
+
 
 # ------------------------------------------------------------
 #  A.  ציור ה-DCEL לאחר add_vertical_cuts + add_horizontal_cuts
 # ------------------------------------------------------------
+def edge_segments(dcel: DCEL) -> dict:
+    """
+    Every edge once, as float segments of shape (k, 2, 2), per class:
+    {"vertical": …, "horizontal": …, "other": …}.  Classes are exact:
+    the float images decide, equal ones are checked on the exact values.
+    """
+    a, b = edge_endpoints(dcel)
+    if hasattr(dcel, "he_origin"):                       # ArrayDCEL
+        fx, fy = np.frombuffer(dcel.vfx), np.frombuffer(dcel.vfy)
+        xs, ys = dcel.vx, dcel.vy
+    else:
+        fx = np.fromiter((v.fx for v in dcel.vertices), dtype=float)
+        fy = np.fromiter((v.fy for v in dcel.vertices), dtype=float)
+        xs, ys = [v.x for v in dcel.vertices], [v.y for v in dcel.vertices]
+
+    vertical = _exactly_equal(fx, xs, a, b)
+    horizontal = _exactly_equal(fy, ys, a, b) & ~vertical
+    segments = np.stack((np.stack((fx[a], fy[a]), axis=1),
+                         np.stack((fx[b], fy[b]), axis=1)), axis=1)
+    return {"vertical": segments[vertical], "horizontal": segments[horizontal],
+            "other": segments[~(vertical | horizontal)]}
+
+
+def _exactly_equal(f: np.ndarray, exact: list, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    same = f[a] == f[b]
+    for k in np.flatnonzero(same):                       # ties only
+        same[k] = exact[a[k]] == exact[b[k]]
+    return same
+
+
+def draw_slab_partition(dcel: DCEL, ax, linewidth: float = 1.0):
+    """One LineCollection per edge class on `ax` – a single draw call each."""
+    from matplotlib.collections import LineCollection
+
+    for name, segments in edge_segments(dcel).items():
+        ax.add_collection(LineCollection(segments, colors=EDGE_COLORS[name],
+                                         linewidths=linewidth, label=name))
+    ax.autoscale_view()
+    ax.set_aspect("equal", adjustable="box")
+    return ax
+
+
+def save_slab_partition(dcel: DCEL, path, title: str = "Slab partition",
+                        figsize: Tuple[float, float] = (7, 7), dpi: int = 150,
+                        linewidth: float = 1.0) -> None:
+    """
+    Write the partition to `path`; the extension picks the format
+    (.png / .svg / .pdf).  Goes through a bare Figure, not pyplot, so it
+    needs no GUI backend and leaves no figure open.
+    """
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize)
+    ax = fig.add_subplot()
+    draw_slab_partition(dcel, ax, linewidth)
+    ax.set_title(title)
+    fig.savefig(path, dpi=dpi)
+
+
 def show_slab_partition(dcel: DCEL, title: str = "Slab partition"):
     """
     מצייר את כל חצי-הקשתות:
@@ -19,24 +109,9 @@ def show_slab_partition(dcel: DCEL, title: str = "Slab partition"):
         אופקיות – כחול
         אלכסוניות (גבול / אלכסון open-slab) – אפור
     """
+    plt = _pyplot()
     fig, ax = plt.subplots(figsize=(7, 7))
-
-    def col(e: HalfEdge) -> str:
-        if e.origin.x == e.twin.origin.x:
-            return "darkorange"   # vertical
-        if e.origin.y == e.twin.origin.y:
-            return "royalblue"    # horizontal
-        return "lightgray"        # everything else
-
-    # מציירים רק half-edges "קדמיים" (כדי לא להכפיל קווים)
-    for he in dcel.half_edges:
-        if id(he) > id(he.twin):
-            continue
-        x1, y1 = float(he.origin.x), float(he.origin.y)
-        x2, y2 = float(he.twin.origin.x), float(he.twin.origin.y)
-        ax.plot([x1, x2], [y1, y2], color=col(he), linewidth=1)
-
-    ax.set_aspect("equal", adjustable="box")
+    draw_slab_partition(dcel, ax)
     ax.set_title(title)
     plt.show()
 
@@ -46,6 +121,7 @@ def show_slab_partition(dcel: DCEL, title: str = "Slab partition"):
 #      – שימושי להשוואה חזותית
 # ------------------------------------------------------------
 def show_problem(instance):
+    plt = _pyplot()
     fig, ax = plt.subplots()
     ax.scatter(instance.points_x, instance.points_y, color="black")
 
@@ -68,7 +144,7 @@ def show_problem(instance):
 
 
 # ------------------------------------------------------------
-#  C.  הדגמה מהירה – להריץ `python -m be_alg.viz_utils`
+#  C.  הדגמה מהירה – להריץ `python -m be_alg.viz_utils [out.png]`
 # ------------------------------------------------------------
 if __name__ == "__main__":
     # מצולע דוגמה קטן
@@ -80,4 +156,7 @@ if __name__ == "__main__":
     from be_alg.slab_partition import slab_partition
     slab_partition(dcel)
 
-    show_slab_partition(dcel, "Vertical + Horizontal cuts")
\ No newline at end of file
+    if len(sys.argv) > 1:
+        save_slab_partition(dcel, sys.argv[1], "Vertical + Horizontal cuts")
+    else:
+        show_slab_partition(dcel, "Vertical + Horizontal cuts")
@@ -1,11 +1,12 @@
 from .data_schemas import Cgshop2025Instance, Cgshop2025Solution
 from .instance_database import InstanceDatabase
 from .naive_algorithm import DelaunayBasedSolver
-from .verifier import VerificationResult, verify
+from .verifier import VerificationResult, verify, verify_rational
 from .zip import ZipSolutionIterator, ZipWriter
 
 __all__ = [
     "verify",
+    "verify_rational",
     "VerificationResult",
     "DelaunayBasedSolver",
     "Cgshop2025Instance",
@@ -41,6 +41,9 @@ Verifies geometric structures, detecting non-triangular faces, bad edges, and is
 - `VerificationGeometryHelper()`: Initialize the geometry helper.
 - `add_point(point: Point) -> int`: Adds a point to the geometry and returns its index.
 - `add_segment(index1: int, index2: int)`: Adds a segment between two points by their indices.
+- `add_points(points: List[Point]) -> int`: Adds many points; returns the index of the first one.
+- `add_points_rational(x_num, x_den, y_num, y_den) -> int`: Same, with exact coordinates given as lists of integer numerators and denominators.
+- `add_segments(edges: List[Tuple[int, int]])`: Adds many segments in one aggregated (sweep-line) insertion.
 - `get_num_points() -> int`: Returns the number of points in the geometry.
 - `search_for_non_triangular_faces() -> Optional[Point]`: Searches for any non-triangular faces.
 - `search_for_bad_edges() -> Optional[Segment]`: Searches for edges with the same face on both sides.
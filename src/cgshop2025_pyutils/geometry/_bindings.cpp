@@ -4,6 +4,7 @@
 #include <pybind11/stl.h>       // Automatic conversion of vectors
 
 // cgal
+#include <CGAL/Arr_batched_point_location.h>
 #include <CGAL/Arr_naive_point_location.h>
 #include <CGAL/Arr_segment_traits_2.h>
 #include <CGAL/Arrangement_2.h>
@@ -12,6 +13,7 @@
 #include <CGAL/Exact_integer.h>
 #include <CGAL/Exact_predicates_exact_constructions_kernel.h>
 #include <CGAL/Exact_rational.h>
+#include <CGAL/Gmpz.h>
 #include <CGAL/Point_2.h>
 #include <CGAL/Polygon_2.h>
 #include <CGAL/Polygon_with_holes_2.h>
@@ -24,10 +26,17 @@
 // fmt
 #include <exception>
 #include <fmt/core.h>
+#include <memory>
+#include <string_view>
 #include <unordered_map>
+#include <variant>
 
 // for duplicate check
 #include <map>
+#include <set>
+
+// big Python ints
+#include <gmp.h>
 
 // Define CGAL types for easy readability and maintenance
 using Kernel = CGAL::Epeck; // Exact Predicates Exact Constructions Kernel
@@ -38,8 +47,10 @@ using Segment2 = Kernel::Segment_2;
 using Traits_2 = CGAL::Arr_segment_traits_2<Kernel>;
 using Arrangement_2 = CGAL::Arrangement_2<Traits_2>;
 using Halfedge_const_handle = Arrangement_2::Halfedge_const_handle;
+using Face_const_handle = Arrangement_2::Face_const_handle;
 using Face_handle = Arrangement_2::Face_handle;
 using PointLocation = CGAL::Arr_naive_point_location<Arrangement_2>;
+using LocationResult = CGAL::Arr_point_location_result<Arrangement_2>::Type;
 using Rational = CGAL::Gmpq;
 
 // Compute convex hull and return the indices of the points on the hull
@@ -84,6 +95,43 @@ public:
     CGAL::insert(arrangement_, s, point_location_);
   }
 
+  // Add many points at once and return the index of the first one.
+  // All points are located in one sweep (batched point location); those
+  // inside a face become isolated vertices right away.  A point on an
+  // edge or a vertex goes through insert_point, as the edge it was
+  // located on may have been split by an earlier point of the batch.
+  int add_points(const std::vector<Point> &points) {
+    const auto first = static_cast<int>(points_.size());
+    std::vector<std::pair<Point, LocationResult>> located;
+    located.reserve(points.size());
+    CGAL::locate(arrangement_, points.begin(), points.end(),
+                 std::back_inserter(located));
+    std::set<Point> placed; // duplicates in the batch locate to a face, too
+    for (const auto &[p, obj] : located) {
+      if (const auto *f = std::get_if<Face_const_handle>(&obj)) {
+        if (placed.insert(p).second) {
+          arrangement_.insert_in_face_interior(
+              p, arrangement_.non_const_handle(*f));
+        }
+      } else {
+        CGAL::insert_point(arrangement_, p, point_location_);
+      }
+    }
+    points_.insert(points_.end(), points.begin(), points.end());
+    return first;
+  }
+
+  // Add many segments at once; a single sweep (aggregated insertion)
+  // instead of one point location per segment
+  void add_segments(const std::vector<std::pair<int, int>> &edges) {
+    std::vector<Segment2> segments;
+    segments.reserve(edges.size());
+    for (const auto &[i, j] : edges) {
+      segments.emplace_back(points_.at(i), points_.at(j));
+    }
+    CGAL::insert(arrangement_, segments.begin(), segments.end());
+  }
+
   // Get the number of points in the arrangement
   int get_num_points() const {
     return static_cast<int>(arrangement_.number_of_vertices());
@@ -372,6 +420,69 @@ Kernel::FT str_to_exact(std::string number) {
   return checked_int_str_to_exact(std::move(number));
 }
 
+// Exact rational from a GMP integer, for whichever type CGAL uses
+template <typename ER = CGAL::Exact_rational>
+static CGAL::Exact_rational mpz_to_exact(mpz_srcptr z) {
+  if constexpr (std::is_constructible_v<ER, CGAL::Gmpz>) {
+    return ER(CGAL::Gmpz(z));
+  } else if constexpr (std::is_constructible_v<ER, mpz_srcptr>) {
+    return ER(z);
+  } else {
+    std::unique_ptr<char, void (*)(void *)> digits(mpz_get_str(nullptr, 10, z),
+                                                   std::free);
+    return integer_str_to_exact(digits.get());
+  }
+}
+
+// Exact value of a Python int of any size: int64 directly, longer ones
+// through their bytes (int.to_bytes) and mpz_import
+static Kernel::FT py_int_to_exact(const pybind11::handle &value) {
+  namespace py = pybind11;
+  try {
+    return to_exact(value.cast<std::int64_t>());
+  } catch (const py::cast_error &) {
+  }
+  const py::int_ number = py::reinterpret_borrow<py::object>(value);
+  const bool negative = number < py::int_(0);
+  const py::object magnitude = negative ? -number : py::object(number);
+  const auto size = (magnitude.attr("bit_length")().cast<std::size_t>() + 7) / 8;
+  const py::bytes raw = magnitude.attr("to_bytes")(size, "little");
+  const std::string_view bytes = raw;
+  mpz_t z;
+  mpz_init(z);
+  mpz_import(z, bytes.size(), -1, 1, 0, 0, bytes.data());
+  if (negative) {
+    mpz_neg(z, z);
+  }
+  Kernel::FT exact(mpz_to_exact(z));
+  mpz_clear(z);
+  return exact;
+}
+
+// Points from exact numerator / denominator lists of Python ints
+static std::vector<Point> rational_points(const pybind11::sequence &x_num,
+                                          const pybind11::sequence &x_den,
+                                          const pybind11::sequence &y_num,
+                                          const pybind11::sequence &y_den) {
+  const std::size_t n = pybind11::len(x_num);
+  if (pybind11::len(x_den) != n || pybind11::len(y_num) != n ||
+      pybind11::len(y_den) != n) {
+    throw std::runtime_error("Coordinate lists differ in length.");
+  }
+  std::vector<Point> points;
+  points.reserve(n);
+  for (std::size_t i = 0; i < n; ++i) {
+    auto dx = py_int_to_exact(x_den[i]);
+    auto dy = py_int_to_exact(y_den[i]);
+    if (dx == 0 || dy == 0) {
+      throw std::runtime_error("Divide by 0 in rational coordinate!");
+    }
+    points.emplace_back(py_int_to_exact(x_num[i]) / dx,
+                        py_int_to_exact(y_num[i]) / dy);
+  }
+  return points;
+}
+
 std::string point_to_string(const Point &p) {
   return fmt::format("({}, {})", CGAL::to_double(p.x()),
                      CGAL::to_double(p.y()));
@@ -538,6 +649,17 @@ PYBIND11_MODULE(_bindings, m) {
       .def(py::init<>())
       .def("add_point", &VerificationGeometryHelper::add_point)
       .def("add_segment", &VerificationGeometryHelper::add_segment)
+      .def("add_points", &VerificationGeometryHelper::add_points)
+      .def(
+          "add_points_rational",
+          [](VerificationGeometryHelper &self, const py::sequence &x_num,
+             const py::sequence &x_den, const py::sequence &y_num,
+             const py::sequence &y_den) {
+            return self.add_points(rational_points(x_num, x_den, y_num, y_den));
+          },
+          "Add points given as exact numerator / denominator lists; returns "
+          "the index of the first one.")
+      .def("add_segments", &VerificationGeometryHelper::add_segments)
       .def("search_for_isolated_points",
            &VerificationGeometryHelper::search_for_isolated_points)
       .def("search_for_bad_edges",
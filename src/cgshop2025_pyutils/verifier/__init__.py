@@ -1 +1 @@
-from .verifier import VerificationResult, verify
+from .verifier import VerificationResult, verify, verify_rational
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterator, List, Sequence, Tuple
 
 from pydantic import BaseModel
 
@@ -61,23 +61,80 @@ def verify(
     for point in all_points:
         geom_helper.add_point(point)
 
-    # Add boundary segments to the geometry helper
-    for i, j in zip(instance.region_boundary[:-1], instance.region_boundary[1:]):
+    # Add boundary and constraint segments to the geometry helper
+    for i, j in _instance_segments(instance):
         geom_helper.add_segment(i, j)
-    if len(instance.region_boundary) > 2:
-        geom_helper.add_segment(
-            instance.region_boundary[-1], instance.region_boundary[0]
+
+    # Add segments to the geometry helper
+    for edge in solution.edges:
+        geom_helper.add_segment(edge[0], edge[1])
+
+    return _check_arrangement(
+        geom_helper, instance, len(solution.steiner_points_x), strict
+    )
+
+
+def verify_rational(
+    instance: Cgshop2025Instance,
+    x_num: Sequence[int],
+    x_den: Sequence[int],
+    y_num: Sequence[int],
+    y_den: Sequence[int],
+    edges: Sequence[Sequence[int]],
+    strict: bool = False,
+) -> VerificationResult:
+    """
+    Same checks as `verify`, for a solution held in memory: the exact
+    coordinates of all points (instance points first, then the Steiner
+    points) as integer numerator / denominator lists, plus the edges.
+    Points and segments go to the geometry helper in bulk, without
+    building Point objects or number strings in Python.
+    """
+    num_points = len(x_num)
+    for index, edge in enumerate(edges):
+        if not (0 <= edge[0] < num_points and 0 <= edge[1] < num_points):
+            return VerificationResult(
+                num_obtuse_triangles=-1,
+                num_steiner_points=-1,
+                errors=[
+                    f"Edge {index} ({list(edge)}) contains out-of-bounds point indices (total number of points: {num_points})"
+                ],
+            )
+
+    geom_helper = VerificationGeometryHelper()
+    geom_helper.add_points_rational(x_num, x_den, y_num, y_den)
+    # a duplicate point does not create a new arrangement vertex
+    if geom_helper.get_num_points() != num_points:
+        return VerificationResult(
+            num_obtuse_triangles=-1,
+            num_steiner_points=-1,
+            errors=["Duplicate points found"],
         )
+    geom_helper.add_segments(
+        list(_instance_segments(instance)) + [(i, j) for i, j in edges]
+    )
+    return _check_arrangement(
+        geom_helper, instance, num_points - len(instance.points_x), strict
+    )
+
 
-    # Add constraint segments to the geometry helper
+def _instance_segments(instance: Cgshop2025Instance) -> Iterator[Tuple[int, int]]:
+    """Boundary and constraint segments of the instance."""
+    boundary = instance.region_boundary
+    yield from zip(boundary[:-1], boundary[1:])
+    if len(boundary) > 2:
+        yield boundary[-1], boundary[0]
     for constraint in instance.additional_constraints:
-        geom_helper.add_segment(constraint[0], constraint[1])
         assert len(constraint) == 2
+        yield constraint[0], constraint[1]
 
-    # Add segments to the geometry helper
-    for edge in solution.edges:
-        geom_helper.add_segment(edge[0], edge[1])
 
+def _check_arrangement(
+    geom_helper: VerificationGeometryHelper,
+    instance: Cgshop2025Instance,
+    num_solution_steiner_points: int,
+    strict: bool,
+) -> VerificationResult:
     # Initialize an error list to collect all issues found during verification
     errors = []
 
@@ -103,10 +160,10 @@ def verify(
 
     # Check the number of steiner points for correctness
     num_steiner_points = geom_helper.get_num_points() - len(instance.points_x)
-    if num_steiner_points != len(solution.steiner_points_x) and strict:
+    if num_steiner_points != num_solution_steiner_points and strict:
         # We can repair the solution and just adapt the number of Steiner points
         errors.append(
-            f"Expected {num_steiner_points} Steiner points, but found {len(solution.steiner_points_x)}"
+            f"Expected {num_steiner_points} Steiner points, but found {num_solution_steiner_points}"
         )
 
     # If any errors were detected, return a result with those errors
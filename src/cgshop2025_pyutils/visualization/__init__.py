@@ -1,3 +1,4 @@
 from .instance import plot_instance
+from .solution import plot_solution
 
-__all__ = ["plot_instance"]
+__all__ = ["plot_instance", "plot_solution"]
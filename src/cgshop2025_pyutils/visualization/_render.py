@@ -0,0 +1,257 @@
+"""
+Shared rendering helpers for `plot_instance` and `plot_solution`.
+
+Both functions draw in one of two modes:
+
+- vector: one LineCollection per edge class and one PolyCollection for
+  the obtuse triangles, i.e. a handful of artists however big the input;
+- raster: above `raster_threshold` edges everything is drawn into a
+  fixed-resolution RGBA image with numpy and shown with a single
+  `imshow`, so the cost no longer depends on the figure backend.
+"""
+
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba
+
+from ..data_schemas import Cgshop2025Instance
+
+DEFAULT_RASTER_THRESHOLD = 200_000
+DEFAULT_RESOLUTION = 1024
+
+
+def to_float(values: Sequence[Union[int, str]]) -> np.ndarray:
+    """Float images of coordinates given as ints or "p/q" strings."""
+    out = np.empty(len(values), dtype=float)
+    for k, value in enumerate(values):
+        if isinstance(value, str) and "/" in value:
+            num, den = value.split("/")
+            out[k] = int(num) / int(den)
+        else:
+            out[k] = int(value)
+    return out
+
+
+def instance_points(instance: Cgshop2025Instance) -> np.ndarray:
+    return np.column_stack(
+        (
+            np.asarray(instance.points_x, dtype=float),
+            np.asarray(instance.points_y, dtype=float),
+        )
+    )
+
+
+def boundary_edges(instance: Cgshop2025Instance) -> np.ndarray:
+    """Closed region boundary as an (n, 2) index array."""
+    boundary = np.asarray(instance.region_boundary, dtype=np.int64)
+    if len(boundary) < 2:
+        return np.empty((0, 2), dtype=np.int64)
+    if len(boundary) == 2:
+        return boundary.reshape(1, 2)
+    return np.column_stack((boundary, np.roll(boundary, -1)))
+
+
+def constraint_edges(instance: Cgshop2025Instance) -> np.ndarray:
+    return np.asarray(instance.additional_constraints, dtype=np.int64).reshape(-1, 2)
+
+
+def obtuse_triangles(
+    points: np.ndarray, edges: np.ndarray, tolerance: float = 1e-12
+) -> np.ndarray:
+    """
+    Obtuse triangular faces of the plane graph (points, edges) as a
+    (t, 3) index array.
+
+    The faces are traced on the half-edges sorted by angle around their
+    origin, so only actual faces count, not every 3-cycle. An edge that
+    overlaps a shorter collinear edge from the same point (a constraint
+    split by Steiner points) is left out. The angle test runs on the
+    float coordinates; a corner counts as obtuse only if its cosine is
+    below -`tolerance`, so right angles between rational points are not
+    flagged because of rounding.
+    """
+    n = len(points)
+    edges = np.sort(edges, axis=1)
+    # one int64 key per edge: much faster to deduplicate than rows
+    keys = np.sort(edges[:, 0] * n + edges[:, 1])
+    keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+    low, high = np.divmod(keys, n)
+    low, high = low[low != high], high[low != high]
+    while True:
+        m = len(low)
+        if m < 3:
+            return np.empty((0, 3), dtype=np.int64)
+        origin = np.concatenate((low, high))
+        d = points[np.concatenate((high, low))] - points[origin]
+        prev = _ccw_predecessors(origin, d, n)
+        # a half-edge parallel to its neighbour in angular order overlaps
+        # it; the longer of the two goes
+        dp = d[prev]
+        cross = d[:, 0] * dp[:, 1] - d[:, 1] * dp[:, 0]
+        length = np.linalg.norm(d, axis=1)
+        overlap = (
+            (prev != np.arange(2 * m))
+            & (np.abs(cross) <= tolerance * length * length[prev])
+            & (np.einsum("ij,ij->i", d, dp) > 0)
+            & (length > length[prev])
+        )
+        if not overlap.any():
+            break
+        dropped = np.zeros(m, dtype=bool)
+        dropped[np.flatnonzero(overlap) % m] = True
+        low, high = low[~dropped], high[~dropped]
+
+    # The face to the left of u->v continues with v->w, where v->w comes
+    # right before v->u in CCW order around v.
+    index = np.arange(2 * m)
+    twin = np.concatenate((np.arange(m, 2 * m), np.arange(m)))
+    second = prev[twin]
+    third = second[second]
+    triangle = second[third] == index
+    # every triangle appears once per half-edge; keep its smallest one
+    keep = triangle & (index < second) & (index < third)
+    a, b, c = origin[keep], origin[second[keep]], origin[third[keep]]
+    pa, pb, pc = points[a], points[b], points[c]
+    ab, bc, ca = pb - pa, pc - pb, pa - pc
+    # counter-clockwise faces only: the outer face of a triangle is CW
+    ccw = ab[:, 0] * (-ca[:, 1]) - ab[:, 1] * (-ca[:, 0]) > 0
+    obtuse = np.zeros(len(a), dtype=bool)
+    for u, v in ((ab, -ca), (bc, -ab), (ca, -bc)):
+        dot = np.einsum("ij,ij->i", u, v)
+        norm = np.linalg.norm(u, axis=1) * np.linalg.norm(v, axis=1)
+        obtuse |= dot < -tolerance * norm
+    select = ccw & obtuse
+    return np.column_stack((a[select], b[select], c[select]))
+
+
+def _ccw_predecessors(origin: np.ndarray, d: np.ndarray, n: int) -> np.ndarray:
+    """
+    For every half-edge (its origin and direction `d`), the half-edge
+    right before it in CCW order around the same origin, wrapping around.
+    """
+    order = np.lexsort((np.arctan2(d[:, 1], d[:, 0]), origin))
+    degree = np.bincount(origin, minlength=n)
+    last = np.cumsum(degree)[origin[order]]
+    first = last - degree[origin[order]]
+    position = np.arange(len(order))
+    prev = np.empty_like(order)
+    prev[order] = order[np.where(position == first, last - 1, position - 1)]
+    return prev
+
+
+def draw_vector(
+    ax: Axes,
+    points: np.ndarray,
+    layers: Sequence[Tuple[np.ndarray, str]],
+    triangles: Optional[np.ndarray],
+    obtuse_color: str,
+) -> None:
+    """One collection per layer; `layers` are (edges, color), drawn in order."""
+    if triangles is not None and len(triangles):
+        ax.add_collection(
+            PolyCollection(
+                points[triangles], facecolors=obtuse_color, edgecolors="none"
+            )
+        )
+    for edges, color in layers:
+        if len(edges):
+            ax.add_collection(LineCollection(points[edges], colors=color))
+    ax.autoscale_view()
+
+
+def draw_raster(
+    ax: Axes,
+    points: np.ndarray,
+    layers: Sequence[Tuple[np.ndarray, str]],
+    triangles: Optional[np.ndarray],
+    obtuse_color: str,
+    point_color: Optional[str],
+    resolution: int,
+) -> None:
+    """
+    Draw everything into one RGBA image whose longer side has
+    `resolution` pixels. Later layers paint over earlier ones: obtuse
+    triangles, then the edge layers, then the points.
+    """
+    lo = points.min(axis=0)
+    hi = points.max(axis=0)
+    span = np.maximum(hi - lo, np.finfo(float).tiny)
+    scale = (resolution - 1) / span.max()
+    width, height = (np.rint(span * scale).astype(int) + 1).tolist()
+    pixels = (points - lo) * scale
+    image = np.zeros((height, width, 4), dtype=np.float32)
+
+    if triangles is not None and len(triangles):
+        image[_triangle_pixels(pixels[triangles], width, height)] = to_rgba(
+            obtuse_color
+        )
+    for edges, color in layers:
+        if len(edges):
+            image[_segment_pixels(pixels[edges], width, height)] = to_rgba(color)
+    if point_color is not None:
+        ij = np.rint(pixels).astype(np.int64)
+        image.reshape(-1, 4)[ij[:, 1] * width + ij[:, 0]] = to_rgba(point_color)
+
+    # pixel centres sit on the grid points, so extend by half a pixel
+    half = 0.5 / scale
+    ax.imshow(
+        image,
+        origin="lower",
+        interpolation="nearest",
+        extent=(lo[0] - half, hi[0] + half, lo[1] - half, hi[1] + half),
+    )
+
+
+def _segment_pixels(segments: np.ndarray, width: int, height: int) -> tuple:
+    """(rows, cols) of the pixels hit by (k, 2, 2) pixel-space segments."""
+    a, b = segments[:, 0], segments[:, 1]
+    steps = np.ceil(np.abs(b - a).max(axis=1)).astype(np.int64) + 1
+    owner = np.repeat(np.arange(len(segments)), steps)
+    # position of every sample within its segment
+    offsets = np.arange(len(owner)) - np.repeat(np.cumsum(steps) - steps, steps)
+    t = offsets / np.maximum(steps[owner] - 1, 1)
+    xy = a[owner] + (b - a)[owner] * t[:, None]
+    ij = np.rint(xy).astype(np.int64)
+    return (
+        np.clip(ij[:, 1], 0, height - 1),
+        np.clip(ij[:, 0], 0, width - 1),
+    )
+
+
+def _triangle_pixels(triangles: np.ndarray, width: int, height: int) -> tuple:
+    """
+    (rows, cols) of the pixel centres inside (t, 3, 2) pixel-space
+    triangles, plus each triangle's centroid pixel so that triangles
+    smaller than a pixel still show up.
+    """
+    lo = np.floor(triangles.min(axis=1)).astype(np.int64)
+    hi = np.ceil(triangles.max(axis=1)).astype(np.int64)
+    size = hi - lo + 1
+    count = size[:, 0] * size[:, 1]
+    owner = np.repeat(np.arange(len(triangles)), count)
+    offsets = np.arange(len(owner)) - np.repeat(np.cumsum(count) - count, count)
+    x = lo[owner, 0] + offsets % size[owner, 0]
+    y = lo[owner, 1] + offsets // size[owner, 0]
+
+    inside = np.ones(len(owner), dtype=bool)
+    t = triangles[owner]
+    area = _cross(t[:, 0], t[:, 1], t[:, 2])
+    for k in range(3):
+        p, q = t[:, k], t[:, (k + 1) % 3]
+        side = (q[:, 0] - p[:, 0]) * (y - p[:, 1]) - (q[:, 1] - p[:, 1]) * (
+            x - p[:, 0]
+        )
+        inside &= side * area >= 0
+    centroid = np.rint(triangles.mean(axis=1)).astype(np.int64)
+    x = np.concatenate((x[inside], centroid[:, 0]))
+    y = np.concatenate((y[inside], centroid[:, 1]))
+    return np.clip(y, 0, height - 1), np.clip(x, 0, width - 1)
+
+
+def _cross(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    return (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (
+        c[:, 0] - a[:, 0]
+    )
@@ -1,31 +1,46 @@
+from typing import Optional
+
 from matplotlib.axes import Axes
 
 from ..data_schemas import Cgshop2025Instance
+from ._render import (
+    DEFAULT_RASTER_THRESHOLD,
+    DEFAULT_RESOLUTION,
+    boundary_edges,
+    constraint_edges,
+    draw_raster,
+    draw_vector,
+    instance_points,
+)
+
 
+def plot_instance(
+    ax: Axes,
+    instance: Cgshop2025Instance,
+    raster_threshold: Optional[int] = DEFAULT_RASTER_THRESHOLD,
+    resolution: int = DEFAULT_RESOLUTION,
+) -> Axes:
+    """
+    Plot the points (black), the region boundary (blue) and the
+    constraints (red) of an instance.
 
-def plot_instance(ax: Axes, instance: Cgshop2025Instance) -> Axes:
-    # Plot points
-    ax.scatter(instance.points_x, instance.points_y, color="black")
-    # Plot region boundary
-    for i in range(len(instance.region_boundary)):
-        x1, y1 = (
-            instance.points_x[instance.region_boundary[i]],
-            instance.points_y[instance.region_boundary[i]],
-        )
-        x2, y2 = (
-            instance.points_x[
-                instance.region_boundary[(i + 1) % len(instance.region_boundary)]
-            ],
-            instance.points_y[
-                instance.region_boundary[(i + 1) % len(instance.region_boundary)]
-            ],
-        )
-        ax.plot([x1, x2], [y1, y2], color="blue", linestyle="-")
-    # Plot constraints
-    for constraint in instance.additional_constraints:
-        x1, y1 = instance.points_x[constraint[0]], instance.points_y[constraint[0]]
-        x2, y2 = instance.points_x[constraint[1]], instance.points_y[constraint[1]]
-        ax.plot([x1, x2], [y1, y2], color="red", linestyle="-")
+    Edges are drawn as one collection per kind. With more than
+    `raster_threshold` points plus edges the instance is rasterized into a
+    single image whose longer side has `resolution` pixels; pass
+    `raster_threshold=None` to always draw vector artists.
+    """
+    points = instance_points(instance)
+    layers = [
+        (boundary_edges(instance), "blue"),
+        (constraint_edges(instance), "red"),
+    ]
+    size = len(points) + sum(len(edges) for edges, _ in layers)
+    if raster_threshold is not None and size > raster_threshold:
+        draw_raster(ax, points, layers, None, "none", "black", resolution)
+    else:
+        draw_vector(ax, points, layers, None, "none")
+        # Plot points
+        ax.scatter(points[:, 0], points[:, 1], color="black")
     ax.set_aspect("equal")
     ax.set_title(instance.instance_uid)
     return ax
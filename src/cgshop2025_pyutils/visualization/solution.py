@@ -0,0 +1,68 @@
+from typing import Optional
+
+import numpy as np
+from matplotlib.axes import Axes
+
+from ..data_schemas import Cgshop2025Instance, Cgshop2025Solution
+from ._render import (
+    DEFAULT_RASTER_THRESHOLD,
+    DEFAULT_RESOLUTION,
+    boundary_edges,
+    constraint_edges,
+    draw_raster,
+    draw_vector,
+    instance_points,
+    obtuse_triangles,
+    to_float,
+)
+
+
+def plot_solution(
+    ax: Axes,
+    instance: Cgshop2025Instance,
+    solution: Cgshop2025Solution,
+    show_obtuse: bool = True,
+    raster_threshold: Optional[int] = DEFAULT_RASTER_THRESHOLD,
+    resolution: int = DEFAULT_RESOLUTION,
+) -> Axes:
+    """
+    Plot a solution on top of its instance: solution edges (gray), region
+    boundary (blue), constraints (red), instance points (black), Steiner
+    points (green) and, with `show_obtuse`, the obtuse triangles filled
+    in orange. The raster mode draws all points in black.
+
+    Obtuse triangles are found on the float coordinates, so this is a
+    picture, not a verification; use `verify` for the exact count. Above
+    `raster_threshold` points plus edges the plot is rasterized into one
+    image whose longer side has `resolution` pixels; pass
+    `raster_threshold=None` to always draw vector artists.
+    """
+    steiner = np.column_stack(
+        (to_float(solution.steiner_points_x), to_float(solution.steiner_points_y))
+    )
+    points = np.concatenate((instance_points(instance), steiner.reshape(-1, 2)))
+    edges = np.asarray(solution.edges, dtype=np.int64).reshape(-1, 2)
+    boundary = boundary_edges(instance)
+    constraints = constraint_edges(instance)
+    layers = [(edges, "gray"), (boundary, "blue"), (constraints, "red")]
+
+    triangles = None
+    if show_obtuse:
+        triangles = obtuse_triangles(
+            points, np.concatenate((edges, boundary, constraints))
+        )
+
+    size = len(points) + sum(len(e) for e, _ in layers)
+    num_points = len(instance.points_x)
+    if raster_threshold is not None and size > raster_threshold:
+        draw_raster(ax, points, layers, triangles, "orange", "black", resolution)
+    else:
+        draw_vector(ax, points, layers, triangles, "orange")
+        ax.scatter(points[:num_points, 0], points[:num_points, 1], color="black")
+        if len(steiner):
+            ax.scatter(
+                points[num_points:, 0], points[num_points:, 1], color="green", s=8
+            )
+    ax.set_aspect("equal")
+    ax.set_title(solution.instance_uid)
+    return ax
@@ -0,0 +1,77 @@
+from fractions import Fraction
+
+import pytest
+
+from be_alg import number_backend
+from be_alg.number_backend import NumberBackend
+
+
+class StrictNumber:
+    """
+    Exact number with the restrictions of the pybind FieldNumber: it
+    only mixes with its own kind, has no unary minus, no abs and no
+    hash, and == against anything else is just False.
+    """
+    __slots__ = ("q",)
+    __hash__ = None
+
+    def __init__(self, value):
+        self.q = value.q if isinstance(value, StrictNumber) else Fraction(value)
+
+    def _other(self, other) -> Fraction:
+        if not isinstance(other, StrictNumber):
+            raise TypeError(f"StrictNumber does not mix with {type(other).__name__}")
+        return other.q
+
+    def __add__(self, other):
+        return StrictNumber(self.q + self._other(other))
+
+    def __sub__(self, other):
+        return StrictNumber(self.q - self._other(other))
+
+    def __mul__(self, other):
+        return StrictNumber(self.q * self._other(other))
+
+    def __truediv__(self, other):
+        return StrictNumber(self.q / self._other(other))
+
+    def __eq__(self, other):
+        return isinstance(other, StrictNumber) and self.q == other.q
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __lt__(self, other):
+        return self.q < self._other(other)
+
+    def __le__(self, other):
+        return self.q <= self._other(other)
+
+    def __gt__(self, other):
+        return self.q > self._other(other)
+
+    def __ge__(self, other):
+        return self.q >= self._other(other)
+
+    def __float__(self):
+        return float(self.q)
+
+    def exact(self) -> str:
+        return str(self.q)
+
+
+@pytest.fixture(params=["field", "strict"])
+def field_like(request, monkeypatch) -> str:
+    """
+    Name of a number backend with FieldNumber's restrictions: "field"
+    itself when the CGAL bindings are built, and always "strict"
+    (StrictNumber), so code that mixes coordinates with ints, negates
+    or hashes them fails here too.
+    """
+    if request.param == "field":
+        pytest.importorskip("cgshop2025_pyutils.geometry")
+    else:
+        monkeypatch.setitem(number_backend._FACTORIES, "strict",
+                            lambda: NumberBackend("strict", StrictNumber))
+        monkeypatch.delitem(number_backend._CACHE, "strict", raising=False)
+    return request.param
@@ -0,0 +1,42 @@
+from fractions import Fraction
+from types import SimpleNamespace
+
+import pytest
+
+from be_alg.array_dcel import ArrayDCEL
+from be_alg.bitsize import bit_sizes
+from be_alg.dcel import DCEL
+from be_alg.export import export_arrays
+from be_alg.slab_partition import SlabStats, add_vertical_cuts, run_stage
+
+
+@pytest.mark.parametrize("cls", [DCEL, ArrayDCEL])
+def test_bit_sizes_of_a_dcel_and_its_solution(cls):
+    pts = [(0, 0), (8, 0), (8, 6), (0, 6)]
+    dcel = cls.from_polygon([0, 1, 2, 3], pts)
+    he = dcel.half_edges[0]                                   # (0,0) → (8,0)
+    dcel.split_edge(he, Fraction(1, 3), 0)
+    dcel.split_edge(dcel.half_edges[2], Fraction(255, 7), 6)  # on (8,6) → (0,6)
+
+    report = bit_sizes(dcel)
+    assert report.points == 6
+    # 1/3 and 255/7 are the only fractions; 255 the longest numerator
+    assert report.numerators[8] == 1
+    assert report.denominators == {1: 10, 2: 1, 3: 1}
+    assert report.max_bits == 8
+    assert report.worst == (5, "255/7", 6, 8 + 3 + 3 + 1)
+
+    sx, sy, _ = export_arrays(dcel, 4)
+    steiner = bit_sizes(SimpleNamespace(steiner_points_x=sx, steiner_points_y=sy))
+    assert steiner.worst == (1, "255/7", 6, 15)
+    assert bit_sizes(dcel, first=4).to_dict() == {**steiner.to_dict(), "worst": report.worst}
+
+
+def test_slab_stats_keep_a_report_per_stage():
+    pts = [(0, 0), (7, 0), (7, 3), (5, 5), (3, 5), (1, 4), (0, 2)]
+    dcel = DCEL.from_polygon(list(range(len(pts))), pts)
+    stats = SlabStats(bit_sizes=True)
+    run_stage(dcel, "vertical", add_vertical_cuts, stats)
+    assert stats.bits["vertical"].points == len(dcel.vertices)
+    assert stats.to_dict()["bit_sizes"]["vertical"]["max_bits"] == stats.bits["vertical"].max_bits
+    assert "bit_sizes" not in SlabStats().to_dict()
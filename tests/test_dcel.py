@@ -0,0 +1,229 @@
+from fractions import Fraction
+
+import pytest
+
+from be_alg.array_dcel import ArrayDCEL
+from be_alg.dcel import DCEL
+from be_alg.export import export_arrays
+from be_alg.slab_partition import (
+    add_horizontal_cuts,
+    add_vertical_cuts,
+    refine_faces,
+    slab_partition,
+)
+from be_alg.triangulation import triangulate_faces
+
+
+def _square(size=4, cls=DCEL):
+    pts = [(Fraction(x), Fraction(y))
+           for x, y in [(0, 0), (size, 0), (size, size), (0, size)]]
+    return cls.from_polygon([0, 1, 2, 3], pts)
+
+
+def _ring(face):
+    he, ring = face.outer, []
+    while True:
+        ring.append(he)
+        he = he.next
+        if he is face.outer:
+            return ring
+
+
+def _vertical_ids(face):
+    return {id(e) for e in _ring(face) if e.origin.x == e.twin.origin.x}
+
+
+def test_split_edge_keeps_vertical_index():
+    dcel = _square()
+    inner = dcel.faces[0]
+    right = next(e for e in _ring(inner) if e.origin.x == e.twin.origin.x == 4)
+    dcel.split_edge(right, Fraction(4), Fraction(1))
+    dcel.split_edge(right, Fraction(4), Fraction(1, 2))
+    for face in dcel.faces:
+        assert {id(e) for e in face.verticals} == _vertical_ids(face)
+    hit = inner.verticals.first_hit_right(Fraction(1), Fraction(3, 4))
+    assert (hit.origin.y, hit.twin.origin.y) == (Fraction(1, 2), Fraction(1))
+    assert inner.verticals.first_hit_left(Fraction(1), Fraction(3, 4)).origin.x == 0
+    assert inner.verticals.first_hit_left(Fraction(0), Fraction(3, 4)) is None
+
+
+def test_ray_query_skips_x_groups_that_miss_its_height(monkeypatch):
+    # a staircase: n vertical steps between the two sides, all above y = 1/2
+    n = 2000
+    pts = [(0, 0), (n + 1, 0), (n + 1, n + 2)]
+    for i in range(n, 0, -1):
+        pts += [(i, i + 2), (i, i + 1)]
+    pts.append((0, 2))
+    dcel = DCEL.from_polygon(list(range(len(pts))), [(Fraction(x), Fraction(y)) for x, y in pts])
+    index = dcel.faces[0].verticals
+    assert len(index) == n + 2
+
+    from be_alg import face_index
+    visited = []
+    y_low = face_index._y_low
+    monkeypatch.setattr(face_index, "_y_low", lambda he: visited.append(he) or y_low(he))
+    assert index.first_hit_right(Fraction(0), Fraction(1, 2)).origin.x == n + 1
+    assert index.first_hit_left(Fraction(n + 1), Fraction(1, 2)).origin.x == 0
+    assert index.first_hit_right(Fraction(n // 2), Fraction(n // 2 + 2)).origin.x == n // 2 + 1
+    assert len(visited) < 200                   # a few tree paths, not n groups
+
+
+def test_add_diagonal_splits_vertical_index():
+    dcel = _square()
+    inner = dcel.faces[0]
+    bottom = next(e for e in _ring(inner) if e.origin.y == e.twin.origin.y == 0)
+    top = next(e for e in _ring(inner) if e.origin.y == e.twin.origin.y == 4)
+    low = dcel.split_edge(bottom, Fraction(2), Fraction(0))
+    up = dcel.split_edge(top, Fraction(2), Fraction(4))
+    face, new_face = dcel.add_diagonal(inner, low, up)
+    for f in (face, new_face):
+        assert {id(e) for e in f.verticals} == _vertical_ids(f)
+        assert len(f.verticals) == 2
+    left_face = next(f for f in (face, new_face) if min(e.origin.x for e in f.verticals) == 0)
+    assert left_face.verticals.first_hit_right(Fraction(0), Fraction(3)).origin.x == 2
+
+
+def test_vertex_star_matches_rotation():
+    dcel = _square()
+    inner = dcel.faces[0]
+    bottom = next(e for e in _ring(inner) if e.origin.y == e.twin.origin.y == 0)
+    top = next(e for e in _ring(inner) if e.origin.y == e.twin.origin.y == 4)
+    low = dcel.split_edge(bottom, Fraction(2), Fraction(0))
+    up = dcel.split_edge(top, Fraction(2), Fraction(4))
+    face, new_face = dcel.add_diagonal(inner, low, up)
+    dcel.add_diagonal(new_face, dcel.vertices[0], up)
+    for v in dcel.vertices:
+        around, he = {}, v.incident
+        while True:
+            around[he.face] = he
+            he = he.twin.next
+            if he is v.incident:
+                break
+        assert v.star == around
+        for f, he in around.items():
+            assert dcel.edge_from_vertex_in_face(v, f) is he
+    assert dcel.common_face(low, up, dcel.outer_face) in (face, new_face)
+
+
+def test_validate_reports_broken_links():
+    dcel = _square()
+    dcel.validate()
+    he = dcel.faces[0].outer
+    he.next = he.next.next          # skip one edge of the ring
+    with pytest.raises(RuntimeError, match="next.prev"):
+        dcel.validate()
+
+
+@pytest.mark.parametrize("cls", [DCEL, ArrayDCEL])
+@pytest.mark.parametrize("corners", [((0, 0), (4, 0)), ((4, 0), (4, 4))])
+def test_split_edge_at_matches_repeated_split_edge(cls, corners):
+    ts = [Fraction(1, 3), Fraction(5, 8), Fraction(7, 2)]
+    if corners[0][1] == corners[1][1]:                   # the bottom side
+        points = [(t, Fraction(0)) for t in ts]
+    else:                                                # the vertical side
+        points = [(Fraction(4), t) for t in ts]
+
+    def edge(dcel):
+        a, b = (tuple(map(Fraction, c)) for c in corners)
+        return next(e for e in dcel.half_edges
+                    if (e.origin.x, e.origin.y) == a
+                    and (e.twin.origin.x, e.twin.origin.y) == b)
+
+    batch, one_by_one = _square(cls=cls), _square(cls=cls)
+    ms = batch.split_edge_at(edge(batch), points)
+    he = edge(one_by_one)
+    for x, y in points:
+        one_by_one.split_edge(he, x, y)
+        he = he.next                                     # the M → B piece
+
+    batch.validate()
+    assert [(m.x, m.y) for m in ms] == points
+    assert export_arrays(batch, 4) == export_arrays(one_by_one, 4)
+    assert batch.split_edge_at(next(iter(batch.half_edges)), []) == []
+
+
+def test_rollback_restores_the_dcel():
+    dcel = _square()
+    inner = dcel.faces[0]
+    bottom = next(e for e in _ring(inner) if e.origin.y == e.twin.origin.y == 0)
+    top = next(e for e in _ring(inner) if e.origin.y == e.twin.origin.y == 4)
+    right = next(e for e in _ring(inner) if e.origin.x == e.twin.origin.x == 4)
+    links = [(e.twin, e.next, e.prev, e.face) for e in dcel.half_edges]
+    stars = [dict(v.star) for v in dcel.vertices]
+
+    dcel.begin()
+    low = dcel.split_edge(bottom, Fraction(2), Fraction(0))
+    dcel.begin()
+    up = dcel.split_edge(top, Fraction(2), Fraction(4))
+    dcel.split_edge_at(right, [(Fraction(4), Fraction(1)), (Fraction(4), Fraction(3))])
+    dcel.add_diagonal(inner, low, up)
+    dcel.commit()                                        # inner: still undone below
+    dcel.validate()
+    dcel.rollback()
+
+    dcel.validate()
+    assert (len(dcel.vertices), len(dcel.half_edges), len(dcel.faces)) == (4, 8, 2)
+    assert [(e.twin, e.next, e.prev, e.face) for e in dcel.half_edges] == links
+    assert [v.star for v in dcel.vertices] == stars
+    assert (inner.n_edges, inner.n_horizontal) == (4, 2)
+    assert {id(e) for e in inner.verticals} == _vertical_ids(inner)
+    with pytest.raises(RuntimeError):
+        dcel.rollback()
+
+    # refine + triangulate: face types and the order of every star come back
+    pts = [(0, 0), (6, 3), (6, 4), (3, 6), (0, 1)]      # a slanted open slab
+    dcel = DCEL.from_polygon(list(range(5)), [(Fraction(x), Fraction(y)) for x, y in pts])
+    add_vertical_cuts(dcel)
+    add_horizontal_cuts(dcel)
+    n_faces = len(dcel.faces)
+    links = [(e.twin, e.next, e.prev, e.face) for e in dcel.half_edges]
+    stars = [list(v.star.items()) for v in dcel.vertices]
+    dcel.begin()
+    refine_faces(dcel)
+    refined = len(dcel.faces)
+    triangulate_faces(dcel)
+    assert n_faces < refined < len(dcel.faces)          # both stages split faces
+    dcel.rollback()
+    dcel.validate()
+    assert len(dcel.faces) == n_faces
+    assert [f.ftype for f in dcel.faces] == [None] * n_faces
+    assert [(e.twin, e.next, e.prev, e.face) for e in dcel.half_edges] == links
+    assert [list(v.star.items()) for v in dcel.vertices] == stars
+
+
+@pytest.mark.parametrize("cls", [DCEL, ArrayDCEL])
+def test_cuts_reuse_the_vertex_at_the_split_point(cls):
+    # (0, 2) shoots right through the isolated point (2, 2) on the x = 2 cut
+    pts = [(0, 0), (4, 0), (4, 4), (0, 4), (0, 2), (2, 2)]
+    dcel = cls.from_polygon([4, 0, 1, 2, 3], [(Fraction(x), Fraction(y)) for x, y in pts])
+    point = dcel.vertices[5]
+    assert dcel.vertex_at(Fraction(2), Fraction(2)) is point
+    assert dcel.vertex_at(Fraction(2), Fraction(3)) is None
+
+    slab_partition(dcel, validate=True)
+    assert point.incident is not None
+    xy = [(v.x, v.y) for v in dcel.vertices]
+    assert len(xy) == len(set(xy))
+
+    he = point.incident
+    assert dcel.split_edge(he, he.twin.origin.x, he.twin.origin.y) is he.twin.origin
+    assert dcel.vertex_at(Fraction(2), Fraction(4)) is not None
+
+
+@pytest.mark.parametrize("cls", [DCEL, ArrayDCEL])
+def test_vertex_at_tells_apart_points_with_equal_float_images(cls):
+    # (2, 4 + i/10³⁰) all have the float images (2.0, 4.0) of the top midpoint
+    two, four, eps = Fraction(2), Fraction(4), Fraction(1, 10**30)
+    pts = [(0, 0), (4, 0), (4, 4), (0, 4)] + [(two, four + i * eps) for i in range(1, 41)]
+    dcel = cls.from_polygon([0, 1, 2, 3], [(Fraction(x), Fraction(y)) for x, y in pts])
+    for i in range(1, 41):
+        assert dcel.vertex_at(two, four + i * eps) is dcel.vertices[3 + i]
+    assert dcel.vertex_at(two, four) is None
+    if cls is DCEL:                                  # rollback unindexes it again
+        top = next(e for e in _ring(dcel.faces[0]) if e.origin.y == e.twin.origin.y == 4)
+        dcel.begin()
+        m = dcel.split_edge(top, two, four)
+        assert dcel.vertex_at(two, four) is m
+        dcel.rollback()
+        assert dcel.vertex_at(two, four) is None
+        assert dcel.vertex_at(two, four + 40 * eps) is dcel.vertices[43]
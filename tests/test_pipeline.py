@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+
+import pytest
+
+from be_alg.array_dcel import ArrayDCEL
+from be_alg.dcel import DCEL
+from be_alg.number_backend import as_fraction
+from be_alg.pipeline import STAGES, checkpoint_key, checkpoint_path, run_stages
+from be_alg.slab_partition import SlabStats
+
+
+def _instance():
+    pts = [(0, 0), (7, 0), (7, 3), (5, 5), (3, 5), (1, 4), (0, 2), (3, 2)]
+    return SimpleNamespace(instance_uid="demo", num_points=len(pts),
+                           points_x=[x for x, _ in pts], points_y=[y for _, y in pts],
+                           region_boundary=list(range(7)), additional_constraints=[])
+
+
+def _edges(dcel):
+    def xy(v):
+        return as_fraction(v.x), as_fraction(v.y)
+
+    return sorted(sorted([xy(he.origin), xy(he.twin.origin)]) for he in dcel.half_edges)
+
+
+def test_stages_write_checkpoints_and_resume(tmp_path):
+    full = run_stages(_instance(), tmp_path, validate=True)
+    key = checkpoint_key(_instance())
+    for stage in STAGES:
+        assert checkpoint_path(tmp_path, key, stage).exists()
+
+    # everything checkpointed → nothing is recomputed
+    stats = SlabStats()
+    assert _edges(run_stages(_instance(), tmp_path, stats=stats)) == _edges(full)
+    assert stats.stages == {}
+
+    # only the cuts left → the later stages run again, the cuts do not
+    for stage in STAGES[STAGES.index("vertical") + 1:]:
+        checkpoint_path(tmp_path, key, stage).unlink()
+    stats = SlabStats()
+    resumed = run_stages(_instance(), tmp_path, dcel_cls=ArrayDCEL, validate=True, stats=stats)
+    assert list(stats.stages) == ["horizontal", "refine", "triangulate"]
+    assert _edges(resumed) == _edges(full)
+    assert all(checkpoint_path(tmp_path, key, stage).exists() for stage in STAGES)
+
+
+def test_checkpoints_are_keyed_by_backend_and_content(tmp_path):
+    run_stages(_instance(), tmp_path)
+    edited = _instance()
+    edited.additional_constraints = [(3, 7)]
+    assert checkpoint_key(edited) != checkpoint_key(_instance())
+    assert checkpoint_key(_instance(), "gmpy2") != checkpoint_key(_instance())
+
+    stats = SlabStats()
+    run_stages(edited, tmp_path, stats=stats, validate=True)  # same uid, new content
+    assert list(stats.stages) == list(STAGES[1:])
+
+
+def test_from_stage_reruns_on_the_previous_checkpoint(tmp_path):
+    full = run_stages(_instance(), tmp_path)
+    rerun = run_stages(_instance(), tmp_path, from_stage="refine", workers=2)
+    assert _edges(rerun) == _edges(full)
+    with pytest.raises(ValueError):
+        run_stages(_instance(), None, from_stage="refine")
+
+
+@pytest.mark.parametrize("cls", [DCEL, ArrayDCEL])
+def test_field_backend_runs_every_stage(cls, field_like):
+    dcel = run_stages(_instance(), dcel_cls=cls, number=field_like, validate=True)
+    assert _edges(dcel) == _edges(run_stages(_instance()))
@@ -0,0 +1,58 @@
+from fractions import Fraction
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from be_alg.array_dcel import ArrayDCEL
+from be_alg.dcel import DCEL
+from be_alg.point_location import PointLocator
+from be_alg.slab_partition import slab_partition
+
+
+def _partition(cls):
+    pts = [(0, 0), (8, 0), (8, 6), (0, 6),
+           (2, 2), (4, 3), (6, 2), (2, 4), (4, 4), (3, 5)]
+    inst = SimpleNamespace(points_x=[x for x, _ in pts], points_y=[y for _, y in pts],
+                           region_boundary=[0, 1, 2, 3],
+                           additional_constraints=[[4, 5], [5, 6], [7, 8], [8, 9], [9, 7]])
+    dcel = cls.from_instance(inst)
+    slab_partition(dcel)
+    return dcel
+
+
+def _inside(face, x, y):
+    """Crossing number; the query points never lie on an edge."""
+    he, inside = face.outer, False
+    while True:
+        a, b = he.origin, he.twin.origin
+        if (a.y > y) != (b.y > y) and a.x + (y - a.y) * (b.x - a.x) / (b.y - a.y) > x:
+            inside = not inside
+        he = he.next
+        if he is face.outer:
+            return inside
+
+
+# off every vertex x and every edge: denominators 7 and 11 do not occur
+_QUERIES = [(Fraction(i, 7), Fraction(j, 11)) for i in range(-3, 60, 4) for j in range(-3, 70, 5)]
+
+
+@pytest.mark.parametrize("cls", [DCEL, ArrayDCEL])
+def test_locate_matches_brute_force(cls):
+    dcel = _partition(cls)
+    locator = PointLocator(dcel)
+    for x, y in _QUERIES:
+        face = locator.locate(x, y)
+        if 0 < x < 8 and 0 < y < 6:
+            assert face is not dcel.outer_face and _inside(face, x, y)
+        else:
+            assert face is dcel.outer_face
+
+
+@pytest.mark.parametrize("cls", [DCEL, ArrayDCEL])
+def test_locate_many_matches_locate(cls):
+    locator = PointLocator(_partition(cls))
+    qx = np.array([float(x) for x, _ in _QUERIES])
+    qy = np.array([float(y) for _, y in _QUERIES])
+    assert locator.locate_many(qx, qy).tolist() == \
+        [locator.locate_index(x, y) for x, y in _QUERIES]
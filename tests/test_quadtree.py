@@ -0,0 +1,113 @@
+from types import SimpleNamespace
+
+import pytest
+
+from be_alg.array_dcel import ArrayDCEL
+from be_alg.dcel import DCEL
+from be_alg.face_types import FaceType
+from be_alg.quadtree import quadtree_partition
+from be_alg.slab_partition import iterate_half_edges
+
+
+def _instance(constraints=()):
+    pts = [(0, 2), (4, 0), (12, 0), (15, 6), (9, 11), (1, 8),     # convex hull
+           (8, 0),                                                # on the bottom side
+           (3, 3), (7, 5), (12, 6), (6, 9)]
+    return SimpleNamespace(points_x=[x for x, _ in pts], points_y=[y for _, y in pts],
+                           region_boundary=[0, 1, 6, 2, 3, 4, 5],
+                           additional_constraints=list(constraints),
+                           num_points=len(pts))
+
+
+def _area2(face):
+    he, total = face.outer, 0
+    while True:
+        a, b = he.origin, he.twin.origin
+        total += a.x * b.y - b.x * a.y
+        he = he.next
+        if he is face.outer:
+            return total
+
+
+def _max_angle_dot(face):
+    """min over the corners of dot(b - a, c - a): < 0 iff some angle is obtuse."""
+    a, b, c = ((he.origin.x, he.origin.y) for he in iterate_half_edges(face.outer))
+    return min((q[0] - p[0]) * (r[0] - p[0]) + (q[1] - p[1]) * (r[1] - p[1])
+               for p, q, r in ((a, b, c), (b, c, a), (c, a, b)))
+
+
+@pytest.mark.parametrize("cls", [DCEL, ArrayDCEL])
+def test_quadtree_tiles_the_hull(cls):
+    inst = _instance()
+    dcel = quadtree_partition(inst, cls)
+    dcel.validate()
+
+    for i, (x, y) in enumerate(zip(inst.points_x, inst.points_y)):
+        assert (dcel.vertices[i].x, dcel.vertices[i].y) == (x, y)
+        assert dcel.vertices[i].incident is not None
+    ring = [(inst.points_x[i], inst.points_y[i]) for i in inst.region_boundary]
+    hull = sum(a[0] * b[1] - b[0] * a[1] for a, b in zip(ring, ring[1:] + ring[:1]))
+    inner = [f for f in dcel.faces if f is not dcel.outer_face]
+    assert _area2(dcel.outer_face) == -hull
+    assert sum(_area2(f) for f in inner) == hull
+    assert all(_area2(f) > 0 for f in inner)
+
+
+@pytest.mark.parametrize("cls", [DCEL, ArrayDCEL])
+def test_quadtree_face_types(cls):
+    dcel = quadtree_partition(_instance(), cls)
+    seen = set()
+    for face in dcel.faces:
+        if face is dcel.outer_face:
+            continue
+        seen.add(face.ftype)
+        if face.ftype is FaceType.RECTANGLE:
+            assert face.n_edges == 4 and face.n_vertical == face.n_horizontal == 2
+        elif face.n_edges == 3:
+            obtuse = _max_angle_dot(face) < 0
+            assert face.ftype is (FaceType.OBTUSE_TRI if obtuse else FaceType.RIGHT_TRI)
+    assert {FaceType.RECTANGLE, FaceType.RIGHT_TRI} <= seen
+
+
+def _square_with(q):
+    pts = [(0, 0), (1024, 0), (1024, 1024), (0, 1024), q]
+    return SimpleNamespace(points_x=[x for x, _ in pts], points_y=[y for _, y in pts],
+                           region_boundary=[0, 1, 2, 3], additional_constraints=[],
+                           num_points=len(pts))
+
+
+def test_quadtree_stops_at_one_point_per_leaf():
+    # (333, 517) is a corner of no cell above depth 10; splitting down to
+    # there cost 421 faces.  It is too far off the diagonals through the
+    # corners of its leaf to be warped, so after the one extra split the
+    # leaf that holds it alone is fanned instead
+    dcel = quadtree_partition(_square_with((333, 517)))
+    dcel.validate()
+    inner = [f for f in dcel.faces if f is not dcel.outer_face]
+    assert len(inner) == 7
+    assert sum(f.ftype is FaceType.RECTANGLE for f in inner) == 3
+    assert sum(_area2(f) for f in inner) == 2 * 1024 * 1024
+
+
+def test_quadtree_warps_the_nearest_corner_onto_a_point():
+    dcel = quadtree_partition(_square_with((520, 520)))
+    dcel.validate()
+    coords = {(v.x, v.y) for v in dcel.vertices}
+    assert (520, 520) in coords and (512, 512) not in coords     # the centre moved
+    inner = [f for f in dcel.faces if f is not dcel.outer_face]
+    assert len(inner) == 8
+    assert all(f.n_edges == 3 and _max_angle_dot(f) >= 0 for f in inner)
+    assert sum(_area2(f) for f in inner) == 2 * 1024 * 1024
+
+
+def test_quadtree_rejects_what_it_cannot_mesh():
+    with pytest.raises(ValueError, match="constraints"):
+        quadtree_partition(_instance([[7, 8]]))
+    inst = _instance()
+    inst.points_x[7] = 3.5
+    with pytest.raises(ValueError, match="integer"):
+        quadtree_partition(inst)
+    inst = _instance()
+    inst.region_boundary = [0, 1, 6, 2, 3, 8, 4, 5]        # (7, 5) dents the ring
+    with pytest.raises(ValueError, match="convex"):
+        quadtree_partition(inst)
@@ -0,0 +1,250 @@
+import json
+import math
+import random
+from fractions import Fraction
+from types import SimpleNamespace
+
+import pytest
+from conftest import StrictNumber
+
+from be_alg.array_dcel import ArrayDCEL
+from be_alg.dcel import DCEL
+from be_alg.number_backend import approx, as_fraction
+from be_alg.slab_partition import (
+    add_horizontal_cuts,
+    add_vertical_cuts,
+    iterate_half_edges,
+    refine_faces,
+    slab_partition,
+)
+
+
+def _star_polygon(n, seed, radius=1000):
+    """Random star-shaped simple polygon with integer coordinates (CCW)."""
+    rnd = random.Random(seed)
+    angles = sorted(rnd.uniform(0, 2 * math.pi) for _ in range(n))
+    pts = []
+    for a in angles:
+        r = rnd.uniform(0.3, 1) * radius
+        p = (round(r * math.cos(a)), round(r * math.sin(a)))
+        if p not in pts:
+            pts.append(p)
+    return [(Fraction(x), Fraction(y)) for x, y in pts]
+
+
+DEMO = [(Fraction(x), Fraction(y))
+        for x, y in [(0, 0), (7, 0), (7, 3), (5, 5), (3, 5), (1, 4), (0, 2)]]
+
+
+def _build(pts, cls=DCEL, number="fraction"):
+    return cls.from_polygon(list(range(len(pts))), pts, number=number)
+
+
+def _geometry(dcel):
+    def xy(v):
+        return as_fraction(v.x), as_fraction(v.y)
+
+    vertices = sorted(xy(v) for v in dcel.vertices)
+    edges = sorted(tuple(sorted([xy(he.origin), xy(he.twin.origin)]))
+                   for he in dcel.half_edges)
+    types = sorted(f.ftype.name for f in dcel.faces if f.ftype is not None)
+    return vertices, edges, len(dcel.faces), types
+
+
+def _assert_consistent(dcel):
+    dcel.validate()
+    for he in dcel.half_edges:
+        assert he.twin.twin is he
+        assert he.next.prev is he
+        assert he.next.origin is he.twin.origin
+        assert he.next.face is he.face
+
+
+@pytest.mark.parametrize("pts", [DEMO] + [_star_polygon(n, s)
+                                          for n, s in [(10, 0), (40, 1), (120, 2)]])
+def test_vertical_sweep_matches_scan(pts):
+    scan, sweep = _build(pts), _build(pts)
+    add_vertical_cuts(scan)
+    add_vertical_cuts(sweep, sweep=True)
+    _assert_consistent(sweep)
+    assert _geometry(sweep) == _geometry(scan)
+
+
+@pytest.mark.parametrize("pts", [DEMO, _star_polygon(50, 5)])
+def test_array_dcel_runs_slab_partition_unchanged(pts):
+    objects, arrays = _build(pts), _build(pts, ArrayDCEL)
+    slab_partition(objects, sweep=True, validate=True)
+    slab_partition(arrays, sweep=True, validate=True)
+    _assert_consistent(arrays)
+    assert _geometry(arrays) == _geometry(objects)
+
+
+@pytest.mark.parametrize("sweep", [False, True])
+def test_filtered_predicates_match_exact(sweep):
+    # offsets far below float resolution force the exact tie-breaks
+    tiny = Fraction(1, 10 ** 30)
+    pts = [(x + (i % 3) * tiny, y - (i % 2) * tiny)
+           for i, (x, y) in enumerate(_star_polygon(60, 7))]
+    exact, filtered = _build(pts), _build(pts, ArrayDCEL)
+    slab_partition(exact, sweep=sweep)
+    slab_partition(filtered, sweep=sweep, filtered=True)
+    _assert_consistent(filtered)
+    assert _geometry(filtered) == _geometry(exact)
+
+
+@pytest.mark.parametrize("cls", [DCEL, ArrayDCEL])
+def test_face_counters_match_rings(cls):
+    dcel = _build(_star_polygon(60, 8), cls)
+    slab_partition(dcel, sweep=True)
+    for f in dcel.faces:
+        ring = list(iterate_half_edges(f.outer))
+        assert f.n_edges == len(ring)
+        assert f.n_vertical == sum(e.origin.x == e.twin.origin.x for e in ring)
+        assert f.n_horizontal == sum(e.origin.y == e.twin.origin.y for e in ring)
+
+
+@pytest.mark.parametrize("cls", [DCEL, ArrayDCEL])
+def test_parallel_refine_matches_serial(cls):
+    pts = _star_polygon(120, 9)
+    serial, parallel = _build(pts), _build(pts, cls)
+    slab_partition(serial, sweep=True)
+    slab_partition(parallel, sweep=True, workers=2, validate=True)
+    assert _geometry(parallel) == _geometry(serial)
+    # replayed in the order of the serial loop: same faces, same order
+    assert [f.ftype for f in parallel.faces] == [f.ftype for f in serial.faces]
+
+
+@pytest.mark.parametrize("saved_cls", [DCEL, ArrayDCEL])
+@pytest.mark.parametrize("loaded_cls", [DCEL, ArrayDCEL])
+def test_snapshot_round_trip_continues_like_the_original(tmp_path, saved_cls, loaded_cls):
+    # an affine image keeps the polygon simple but needs big exact numbers
+    pts = [(x / 3 + Fraction(1, 7), y * 10 ** 30 / 7) for x, y in _star_polygon(80, 10)]
+    reference, saved = _build(pts), _build(pts, saved_cls)
+    slab_partition(reference, sweep=True)
+    add_vertical_cuts(saved, sweep=True)
+    saved.save(tmp_path / "cuts.dcel")
+
+    loaded = loaded_cls.load(tmp_path / "cuts.dcel")
+    loaded.validate()
+    assert _geometry(loaded) == _geometry(saved)
+    add_horizontal_cuts(loaded)
+    refine_faces(loaded)
+    assert _geometry(loaded) == _geometry(reference)
+
+
+def test_both_layouts_write_the_same_snapshot(tmp_path):
+    # same arrays, same star order – the ArrayDCEL star chains included
+    for cls in (DCEL, ArrayDCEL):
+        dcel = _build(_star_polygon(60, 8), cls)
+        slab_partition(dcel, sweep=True)
+        dcel.save(tmp_path / f"{cls.__name__}.dcel")
+    assert (tmp_path / "DCEL.dcel").read_bytes() == (tmp_path / "ArrayDCEL.dcel").read_bytes()
+
+
+def test_truncated_snapshot_is_rejected(tmp_path):
+    dcel = _build(_star_polygon(20, 3))
+    dcel.save(tmp_path / "full.dcel")
+    data = (tmp_path / "full.dcel").read_bytes()
+    for cut in (10, len(data) // 2, len(data) - 1):
+        (tmp_path / "cut.dcel").write_bytes(data[:cut])
+        with pytest.raises(ValueError):
+            DCEL.load(tmp_path / "cut.dcel")
+
+
+@pytest.mark.parametrize("cls", [DCEL, ArrayDCEL])
+def test_stats_count_hot_paths_and_export_json(cls):
+    pts = _star_polygon(60, 11)
+    plain, counted = _build(pts), _build(pts, cls)
+    assert slab_partition(plain, sweep=True) is None
+    stats = slab_partition(counted, sweep=True, stats=True)
+    assert _geometry(counted) == _geometry(plain)
+    assert "split_edge" not in vars(counted)         # wrappers removed again
+
+    record = json.loads(stats.to_json())
+    assert list(record["stages"]) == ["vertical", "horizontal", "refine"]
+    totals = record["totals"]
+    assert totals["split_edge"] == len(counted.vertices) - len(pts)
+    assert totals["add_diagonal"] == len(counted.faces) - 2
+    assert totals["edge_lookups"] > 0
+    assert totals["ring_steps"] > 0 and totals["seconds"] > 0
+
+
+def test_gmpy2_backend_matches_fraction():
+    pytest.importorskip("gmpy2")
+    pts = _star_polygon(40, 6)
+    reference, mpq = _build(pts), _build(pts, number="gmpy2")
+    slab_partition(reference, sweep=True)
+    slab_partition(mpq, sweep=True)
+    assert type(mpq.vertices[-1].x).__name__ == "mpq"
+    assert _geometry(mpq) == _geometry(reference)
+
+
+def test_slab_partition_classifies_all_inner_faces():
+    dcel = _build(_star_polygon(60, 3))
+    slab_partition(dcel, sweep=True)
+    _assert_consistent(dcel)
+    assert all(f.ftype is not None for f in dcel.faces if f is not dcel.outer_face)
+
+
+def _scan_first_vertical_hit(face, x0, y0):
+    best = None
+    for he in iterate_half_edges(face.outer):
+        a, b = he.origin, he.twin.origin
+        if a.x == b.x and a.x > x0 and min(a.y, b.y) <= y0 <= max(a.y, b.y):
+            if best is None or a.x < best.origin.x:
+                best = he
+    return best
+
+
+def test_vertical_index_tracks_rings_and_matches_scan():
+    dcel = _build(_star_polygon(80, 4))
+    slab_partition(dcel, sweep=True)
+    rnd = random.Random(0)
+    for face in dcel.faces:
+        ring = list(iterate_half_edges(face.outer))
+        assert {id(e) for e in face.verticals} == {
+            id(e) for e in ring if e.origin.x == e.twin.origin.x}
+        for v in {e.origin for e in ring}:
+            x0, y0 = v.x - rnd.randint(0, 5), v.y + rnd.randint(-5, 5)
+            hit = face.verticals.first_hit_right(x0, y0)
+            ref = _scan_first_vertical_hit(face, x0, y0)
+            assert (hit is None) == (ref is None)
+            if hit is not None:
+                assert hit.origin.x == ref.origin.x
+                assert min(hit.origin.y, hit.twin.origin.y) <= y0 <= max(
+                    hit.origin.y, hit.twin.origin.y)
+
+
+@pytest.mark.parametrize("cls", [DCEL, ArrayDCEL])
+def test_field_backend_builds_and_partitions_like_fraction(cls, field_like):
+    # constraints go through the subdivision sweep, the horizontal cuts
+    # through corner_toward
+    pts = [(0, 0), (7, 0), (7, 3), (5, 5), (3, 5), (1, 4), (0, 2), (3, 2), (5, 2)]
+    inst = SimpleNamespace(points_x=[x for x, _ in pts], points_y=[y for _, y in pts],
+                           region_boundary=list(range(7)),
+                           additional_constraints=[[0, 7], [7, 8], [8, 2]])
+    reference = DCEL.from_instance(inst)
+    dcel = cls.from_instance(inst, number=field_like)
+    assert _geometry(dcel) == _geometry(reference)
+    for d in (reference, dcel):
+        slab_partition(d, sweep=True)
+    dcel.validate()
+    assert _geometry(dcel) == _geometry(reference)
+
+
+def test_approx_is_monotone_when_float_is_a_midpoint():
+    class Midpoint(StrictNumber):
+        __slots__ = ()
+
+        def __float__(self):                    # an ulp off, like an interval midpoint
+            return math.nextafter(float(self.q), math.inf)
+
+        def exact(self):
+            raise AssertionError("approx went through the exact string")
+
+    third = Fraction(1, 3)
+    values = sorted({third, third + Fraction(1, 10**30), Fraction(1, 2), Fraction(7, 9)})
+    images = [approx(Midpoint(q)) for q in values]
+    assert images == sorted(images)
+    assert all(Fraction(f) <= q < Fraction(math.nextafter(f, math.inf))
+               for f, q in zip(images, values))
@@ -0,0 +1,102 @@
+from types import SimpleNamespace
+
+import pytest
+
+from be_alg.array_dcel import ArrayDCEL
+from be_alg.dcel import DCEL
+from be_alg.export import export_arrays
+from be_alg.slab_partition import slab_partition
+
+
+def _instance(constraints):
+    pts = [(0, 0), (8, 0), (8, 6), (0, 6),          # boundary
+           (2, 2), (4, 3), (6, 2),                  # a loose polyline
+           (2, 4), (4, 4), (3, 5)]                  # a closed triangle
+    return SimpleNamespace(points_x=[x for x, _ in pts], points_y=[y for _, y in pts],
+                           region_boundary=[0, 1, 2, 3],
+                           additional_constraints=constraints)
+
+
+def _area2(face):
+    he, total = face.outer, 0
+    while True:
+        a, b = he.origin, he.twin.origin
+        total += a.x * b.y - b.x * a.y
+        he = he.next
+        if he is face.outer:
+            return total
+
+
+@pytest.mark.parametrize("cls", [DCEL, ArrayDCEL])
+def test_from_instance_without_constraints_is_from_polygon(cls, tmp_path):
+    inst = _instance([])
+    cls.from_instance(inst).save(tmp_path / "a.dcel")
+    cls.from_polygon(inst.region_boundary,
+                     list(zip(inst.points_x, inst.points_y))).save(tmp_path / "b.dcel")
+    assert (tmp_path / "a.dcel").read_bytes() == (tmp_path / "b.dcel").read_bytes()
+
+
+@pytest.mark.parametrize("cls", [DCEL, ArrayDCEL])
+def test_loose_constraints_are_bridged_to_the_boundary(cls):
+    constraints = [[4, 5], [5, 6], [7, 8], [8, 9], [9, 7], [0, 1]]
+    dcel = cls.from_instance(_instance(constraints))
+    dcel.validate()
+
+    sx, sy, edges = export_arrays(dcel, 10)
+    # polyline: (2,2) down to the bottom side; triangle: (2,4) onto (2,2)
+    assert (sx, sy) == ([2], [0])
+    assert [4, 10] in edges and [4, 7] in edges
+    for a, b in constraints[:-1]:
+        assert sorted([a, b]) in edges
+    assert [0, 10] in edges and [1, 10] in edges          # the split bottom side
+    assert len(dcel.faces) == 3              # inside, outside, the triangle
+
+    # the dangling polyline must not confuse the vertical cuts
+    slab_partition(dcel, validate=True)
+    for face in dcel.faces:
+        assert (_area2(face) < 0) == (face is dcel.outer_face)
+
+
+@pytest.mark.parametrize("cls", [DCEL, ArrayDCEL])
+def test_from_edges_wires_a_triangulation(cls):
+    pts = [(0, 0), (4, 0), (4, 4), (0, 4), (2, 1), (9, 9)]      # (9, 9) unused
+    edges = [[0, 1], [1, 2], [2, 3], [3, 0], [4, 0], [1, 4], [4, 2], [4, 3], [2, 1]]
+    dcel = cls.from_edges(pts, edges)
+    dcel.validate()
+    assert len(dcel.half_edges) == 16 and len(dcel.faces) == 5
+    for face in dcel.faces:
+        assert (_area2(face) < 0) == (face is dcel.outer_face)
+        assert face.n_edges == (4 if face is dcel.outer_face else 3)
+    assert dcel.vertices[5].incident is None
+
+    with pytest.raises(ValueError, match="connected"):
+        cls.from_edges(pts + [(10, 9)], edges + [[5, 6]])
+
+
+@pytest.mark.parametrize("cls", [DCEL, ArrayDCEL])
+def test_from_edges_with_a_vertical_edge_at_the_leftmost_vertex(cls, field_like):
+    # (0, 0) is the leftmost-lowest vertex and 0→3 runs straight up
+    pts = [(0, 0), (2, 0), (2, 2), (0, 2)]
+    edges = [[0, 1], [1, 2], [2, 3], [3, 0], [0, 2]]
+    reference = cls.from_edges(pts, edges)
+    dcel = cls.from_edges(pts, edges, number=field_like)
+    dcel.validate()
+    assert export_arrays(dcel, 4) == export_arrays(reference, 4)
+    assert [f.n_edges for f in dcel.faces] == [f.n_edges for f in reference.faces]
+    assert dcel.faces.index(dcel.outer_face) == reference.faces.index(reference.outer_face)
+
+
+@pytest.mark.parametrize("cls", [DCEL, ArrayDCEL])
+def test_from_solution_round_trips_a_partition(cls):
+    inst = _instance([[4, 5], [5, 6], [7, 8], [8, 9], [9, 7]])
+    dcel = cls.from_instance(inst)
+    slab_partition(dcel)
+    sx, sy, edges = export_arrays(dcel, 10)
+    solution = SimpleNamespace(steiner_points_x=sx, steiner_points_y=sy, edges=edges)
+
+    again = cls.from_solution(inst, solution)
+    again.validate()
+    assert export_arrays(again, 10) == (sx, sy, edges)
+    assert len(again.faces) == len(dcel.faces)
+    for face in again.faces:
+        assert (_area2(face) < 0) == (face is again.outer_face)
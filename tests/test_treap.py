@@ -0,0 +1,41 @@
+import random
+
+import pytest
+
+from be_alg.treap import Treap
+
+
+class _MaxTreap(Treap):
+    __slots__ = ()
+    key = staticmethod(lambda item: item[0])
+    aggregate = staticmethod(lambda item: item[1])
+
+
+def test_treap_matches_a_sorted_list_with_duplicate_keys():
+    rng = random.Random(7)
+    items = [(rng.randrange(50), i) for i in range(400)]
+    tree = _MaxTreap(items[:100])
+    ref = sorted(items[:100], key=lambda it: it[0])
+    for item in items[100:]:
+        tree.insert(item)
+        ref.append(item)
+    ref.sort(key=lambda it: it[0])              # stable: equal keys keep insertion order
+    assert list(tree) == ref
+    for item in rng.sample(items, 250):
+        tree.remove(item)
+        ref.remove(item)
+        assert len(tree) == len(ref)
+    assert list(tree) == ref
+    assert tree.root.top == max(it[1] for it in ref)
+    assert tree.last_below(25) == [it for it in ref if it[0] < 25][-1]
+    with pytest.raises(ValueError):
+        tree.remove((10, -1))
+    assert list(tree) == ref
+
+
+def test_treap_updates_take_a_per_call_key():
+    tree = Treap([3, 1, 2], key=lambda v: -v)
+    tree.insert(5, key=lambda v: -v)
+    tree.remove(2, key=lambda v: -v)
+    assert list(tree) == [5, 3, 1]
+    assert tree.last_below(-2, key=lambda v: -v) == 3
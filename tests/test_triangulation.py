@@ -0,0 +1,112 @@
+from fractions import Fraction
+from types import SimpleNamespace
+
+import pytest
+from test_slab_partition import _star_polygon
+
+from be_alg.array_dcel import ArrayDCEL
+from be_alg.dcel import DCEL
+from be_alg.export import export_arrays
+from be_alg.face_types import FaceType
+from be_alg.slab_partition import iterate_half_edges, slab_partition
+from be_alg.triangulation import triangle_type, triangulate_faces
+
+
+def _partition(cls, number="fraction"):
+    pts = [(0, 0), (8, 0), (8, 6), (0, 6),
+           (2, 2), (4, 3), (6, 2), (2, 4), (4, 4), (3, 5)]
+    inst = SimpleNamespace(points_x=[x for x, _ in pts], points_y=[y for _, y in pts],
+                           region_boundary=[0, 1, 2, 3],
+                           additional_constraints=[[4, 5], [5, 6], [7, 8], [8, 9], [9, 7]])
+    dcel = cls.from_instance(inst, number=number)
+    slab_partition(dcel)
+    return dcel
+
+
+def _triangulated(cls):
+    dcel = _partition(cls)
+    triangulate_faces(dcel)
+    return dcel
+
+
+def _area2(face):
+    total = 0
+    for he in iterate_half_edges(face.outer):
+        a, b = he.origin, he.twin.origin
+        total += a.x * b.y - b.x * a.y
+    return total
+
+
+@pytest.mark.parametrize("cls", [DCEL, ArrayDCEL])
+def test_every_face_becomes_a_typed_triangle(cls):
+    dcel = _partition(cls)
+    area = sum(_area2(f) for f in dcel.faces if f is not dcel.outer_face)
+    rectangles = sum(f.ftype is FaceType.RECTANGLE for f in dcel.faces)
+    n_faces = len(dcel.faces)
+
+    assert triangulate_faces(dcel) == 0
+    dcel.validate()
+    inner = [f for f in dcel.faces if f is not dcel.outer_face]
+    assert sum(_area2(f) for f in inner) == area
+    assert len(dcel.faces) >= n_faces + rectangles
+    for f in inner:
+        assert f.n_edges == 3 and _area2(f) > 0
+        assert f.ftype is triangle_type(*(he.origin for he in iterate_half_edges(f.outer)))
+    assert export_arrays(dcel, 10) == export_arrays(_triangulated(DCEL), 10)
+    # the one left leans on the constraint (4,3)-(6,2), see the module docstring
+    assert sum(f.ftype is FaceType.OBTUSE_TRI for f in inner) == 1
+
+
+@pytest.mark.parametrize("cls", [DCEL, ArrayDCEL])
+@pytest.mark.parametrize("pts", [
+    [(0, 0), (7, 0), (7, 3), (5, 5), (3, 5), (1, 4), (0, 2)],
+    [(2, 0), (6, 0), (8, 3), (6, 6), (2, 6), (0, 3)],
+    _star_polygon(20, 0),
+])
+def test_polygon_is_left_without_obtuse_triangles(cls, pts):
+    pts = [(Fraction(x), Fraction(y)) for x, y in pts]
+    dcel = cls.from_polygon(list(range(len(pts))), pts)
+    slab_partition(dcel)
+    assert triangulate_faces(dcel) == 0
+    dcel.validate()
+    inner = [f for f in dcel.faces if f is not dcel.outer_face]
+    assert sum(_area2(f) for f in inner) + _area2(dcel.outer_face) == 0
+    for f in inner:
+        assert f.ftype is triangle_type(*(he.origin for he in iterate_half_edges(f.outer)))
+    assert not any(f.ftype is FaceType.OBTUSE_TRI for f in inner)
+
+
+def test_star_polygons_grow_by_a_bounded_factor():
+    """Column points stop where no face needs them, so the output per face does not run away."""
+    for n in (40, 80):
+        pts = _star_polygon(n, 1)
+        dcel = DCEL.from_polygon(list(range(len(pts))), pts)
+        slab_partition(dcel)
+        before = len(dcel.faces) - 1
+        assert triangulate_faces(dcel) == 0
+        inner = [f for f in dcel.faces if f is not dcel.outer_face]
+        assert all(f.n_edges == 3 for f in inner)
+        assert len(inner) < 30 * before
+        # the fans on shared or flat sloped edges, see the module docstring
+        assert sum(f.ftype is FaceType.OBTUSE_TRI for f in inner) < len(inner) // 50
+
+
+def test_triangulation_rolls_back():
+    dcel = _partition(DCEL)
+    before = export_arrays(dcel, 10), [(f.outer, f.n_edges, f.n_vertical) for f in dcel.faces]
+    dcel.begin()
+    triangulate_faces(dcel)
+    dcel.rollback()
+    dcel.validate()
+    after = export_arrays(dcel, 10), [(f.outer, f.n_edges, f.n_vertical) for f in dcel.faces]
+    assert after == before
+
+
+@pytest.mark.parametrize("cls", [DCEL, ArrayDCEL])
+def test_field_backend_types_like_fraction(cls, field_like):
+    dcel = _partition(cls, number=field_like)
+    assert triangulate_faces(dcel) == 0
+    dcel.validate()
+    reference = _triangulated(DCEL)
+    assert [f.ftype for f in dcel.faces] == [f.ftype for f in reference.faces]
+    assert FaceType.RIGHT_TRI in {f.ftype for f in dcel.faces}
@@ -1,8 +1,9 @@
 import copy
 import random
 import uuid
+from fractions import Fraction
 
-from cgshop2025_pyutils import VerificationResult, verify
+from cgshop2025_pyutils import VerificationResult, verify, verify_rational
 from cgshop2025_pyutils.data_schemas.instance import Cgshop2025Instance
 from cgshop2025_pyutils.data_schemas.solution import Cgshop2025Solution
 from cgshop2025_pyutils.geometry import Point, compute_convex_hull
@@ -533,3 +534,37 @@ def test_verify_edge_outside_boundary():
     assert not result.errors
     assert result.num_obtuse_triangles == 0
     assert result.num_steiner_points == 0
+
+
+def verify_in_memory(instance: Cgshop2025Instance, solution: Cgshop2025Solution):
+    qx = [Fraction(x) for x in instance.points_x + solution.steiner_points_x]
+    qy = [Fraction(y) for y in instance.points_y + solution.steiner_points_y]
+    return verify_rational(
+        instance,
+        [q.numerator for q in qx],
+        [q.denominator for q in qx],
+        [q.numerator for q in qy],
+        [q.denominator for q in qy],
+        solution.edges,
+    )
+
+
+def test_verify_rational_matches_verify():
+    for instance in generate_random_instances(SEEDS[0], num_instances=3):
+        solution = DelaunayBasedSolver(instance).solve()
+        assert verify_in_memory(instance, solution) == verify(instance, solution)
+        break_solution_delete_edge(instance, solution)
+        assert verify_in_memory(instance, solution).errors != []
+
+    instance = instance_from_point_set(
+        [Point(x, y) for x, y in [(0, 0), (4, 0), (4, 4), (0, 4)]], "square"
+    )
+    solution = Cgshop2025Solution(  # numerator and denominator beyond int64
+        instance_uid=instance.instance_uid,
+        steiner_points_x=[f"{2**70 + 1}/{2**69}"],
+        steiner_points_y=["5/7"],
+        edges=[[0, 1], [1, 2], [2, 3], [3, 0], [4, 0], [4, 1], [4, 2], [4, 3]],
+    )
+    result = verify_in_memory(instance, solution)
+    assert result == verify(instance, solution)
+    assert not result.errors and result.num_steiner_points == 1
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("cgshop2025_pyutils.geometry")
+
+from matplotlib.figure import Figure
+
+from cgshop2025_pyutils.data_schemas.instance import Cgshop2025Instance
+from cgshop2025_pyutils.data_schemas.solution import Cgshop2025Solution
+from cgshop2025_pyutils.visualization import plot_instance, plot_solution
+from cgshop2025_pyutils.visualization._render import obtuse_triangles
+
+
+def _example():
+    instance = Cgshop2025Instance(
+        instance_uid="example",
+        num_points=4,
+        points_x=[0, 4, 4, 0],
+        points_y=[0, 0, 2, 2],
+        region_boundary=[0, 1, 2, 3],
+        num_constraints=1,
+        additional_constraints=[[0, 2]],
+    )
+    # Steiner point (2, 1) splits the constraint; the bottom and the top
+    # triangle are obtuse at it
+    solution = Cgshop2025Solution(
+        instance_uid="example",
+        steiner_points_x=["4/2"],
+        steiner_points_y=[1],
+        edges=[[0, 4], [4, 2], [1, 4], [3, 4]],
+    )
+    return instance, solution
+
+
+def test_obtuse_triangles():
+    points = np.array([[0, 0], [4, 0], [4, 2], [0, 2], [2, 1]], dtype=float)
+    edges = np.array([[0, 1], [1, 2], [2, 3], [3, 0], [0, 4], [4, 2], [1, 4], [3, 4]])
+    # duplicates, both orientations and the unsplit constraint must not matter
+    edges = np.concatenate((edges, edges[:, ::-1], [[0, 2]]))
+    found = {tuple(sorted(t)) for t in obtuse_triangles(points, edges).tolist()}
+    assert found == {(0, 1, 4), (2, 3, 4)}
+
+
+def test_plot_solution_vector():
+    instance, solution = _example()
+    fig = Figure()
+    ax = plot_solution(fig.add_subplot(), instance, solution, raster_threshold=None)
+    # obtuse fill, three edge layers, instance and Steiner points
+    assert len(ax.collections) == 6
+    assert len(ax.collections[0].get_paths()) == 2
+    assert not ax.images
+
+
+@pytest.mark.parametrize("plot", ["instance", "solution"])
+def test_raster_mode(plot):
+    instance, solution = _example()
+    fig = Figure()
+    ax = fig.add_subplot()
+    if plot == "instance":
+        plot_instance(ax, instance, raster_threshold=0, resolution=64)
+    else:
+        plot_solution(ax, instance, solution, raster_threshold=0, resolution=64)
+    assert not ax.collections
+    (image,) = ax.images
+    assert image.get_array().shape == (33, 64, 4)
+    assert image.get_array()[..., 3].any()
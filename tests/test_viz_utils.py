@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from be_alg.array_dcel import ArrayDCEL
+from be_alg.dcel import DCEL
+from be_alg.slab_partition import slab_partition
+from be_alg.viz_utils import edge_segments, save_slab_partition
+
+
+def test_importing_the_stages_does_not_load_matplotlib():
+    code = "import sys, be_alg.slab_partition; print('matplotlib' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                         check=True, env=_env())
+    assert out.stdout.strip() == "False"
+
+
+def test_pyplot_falls_back_to_agg_without_a_display_backend():
+    # a display is announced, but tkinter cannot be imported
+    code = ("import sys; sys.modules['tkinter'] = None; "
+            "from be_alg.viz_utils import _pyplot; print(_pyplot().get_backend())")
+    env = {k: v for k, v in _env().items() if k != "MPLBACKEND"}
+    env["DISPLAY"] = ":0"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                         check=True, env=env)
+    assert out.stdout.strip().lower() == "agg"
+
+
+def _env():
+    return {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+
+
+@pytest.mark.parametrize("cls", [DCEL, ArrayDCEL])
+def test_save_slab_partition_writes_png_and_svg(cls, tmp_path):
+    pts = [(0, 0), (7, 0), (7, 3), (5, 5), (3, 5), (1, 4), (0, 2)]
+    dcel = cls.from_polygon(list(range(len(pts))), pts)
+    slab_partition(dcel)
+
+    segments = edge_segments(dcel)
+    assert sum(len(s) for s in segments.values()) == len(dcel.half_edges) // 2
+    for (x1, y1), (x2, y2) in segments["vertical"]:
+        assert x1 == x2 and y1 != y2
+    for (x1, y1), (x2, y2) in segments["horizontal"]:
+        assert y1 == y2 and x1 != x2
+
+    save_slab_partition(dcel, tmp_path / "p.png")
+    save_slab_partition(dcel, tmp_path / "p.svg")
+    assert (tmp_path / "p.png").read_bytes()[:8] == b"\x89PNG\r\n\x1a\n"
+    assert b"<svg" in (tmp_path / "p.svg").read_bytes()[:500]